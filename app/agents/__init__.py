@@ -8,9 +8,10 @@ This package contains extraction agents:
 Argument analysis (research, enrichment, pros/cons, reliability) is delegated
 to the evidence-engine service via app/services/evidence_engine.py.
 """
-from .extraction import extract_arguments, structure_to_dict
+from .extraction import extract_arguments, extract_arguments_async, structure_to_dict
 
 __all__ = [
     "extract_arguments",
+    "extract_arguments_async",
     "structure_to_dict",
 ]
@@ -11,13 +11,18 @@ Implements improved argument extraction with 4-axis strategy:
 # Main extraction function
 from .arguments import (
     extract_arguments,
+    extract_arguments_async,
     extract_arguments_simple,
     extract_thesis_arguments_only
 )
 
 # Pipeline components (can be used separately if needed)
 from .segmentation import segment_transcript, Segment
-from .local_extractor import extract_from_segment
+from .local_extractor import (
+    extract_from_segment,
+    extract_from_segment_iter,
+    extract_from_all_segments_batch
+)
 from .consolidator import consolidate_arguments, deduplicate_by_similarity
 from .hierarchy import build_hierarchy, ArgumentRole
 from .translator import translate_arguments
@@ -30,6 +35,7 @@ from .tree_builder import (
     SubArgumentNode,
     EvidenceNode,
     structure_to_dict,
+    write_structure_jsonl,
     get_all_thesis_arguments,
     get_chain_by_id,
     count_total_nodes,
@@ -39,6 +45,7 @@ from .tree_builder import (
 __all__ = [
     # Main functions
     "extract_arguments",
+    "extract_arguments_async",
     "extract_arguments_simple",
     "extract_thesis_arguments_only",
 
@@ -46,6 +53,8 @@ __all__ = [
     "segment_transcript",
     "Segment",
     "extract_from_segment",
+    "extract_from_segment_iter",
+    "extract_from_all_segments_batch",
     "consolidate_arguments",
     "deduplicate_by_similarity",
     "build_hierarchy",
@@ -61,6 +70,7 @@ __all__ = [
     "SubArgumentNode",
     "EvidenceNode",
     "structure_to_dict",
+    "write_structure_jsonl",
     "get_all_thesis_arguments",
     "get_chain_by_id",
     "count_total_nodes",
@@ -0,0 +1,108 @@
+"""
+OpenAI Batch API helper.
+
+Submits many chat completion requests as a single batch job instead of one
+HTTP round-trip per request. Batch jobs are billed at 50% of the synchronous
+price but complete asynchronously, so they suit offline/bulk processing only.
+"""
+import logging
+import time
+from typing import Dict
+
+import orjson
+from openai import OpenAI
+
+from .constants_extraction import (
+    BATCH_COMPLETION_WINDOW,
+    BATCH_POLL_INTERVAL_SECONDS,
+    BATCH_MAX_WAIT_SECONDS
+)
+from ...services.openai_client import OPENAI_RETRY
+
+logger = logging.getLogger(__name__)
+
+CHAT_COMPLETIONS_ENDPOINT = "/v1/chat/completions"
+BATCH_FAILED_STATUSES = {"failed", "expired", "cancelled"}
+
+# ============================================================================
+# BATCH LOGIC
+# ============================================================================
+
+def run_chat_batch(client: OpenAI, bodies: Dict[str, Dict]) -> Dict[str, str]:
+    """
+    Run chat completion requests through the OpenAI Batch API.
+
+    Process:
+    1. Serialize one JSONL line per request and upload it (purpose="batch")
+    2. Create the batch job and poll until it completes
+    3. Download the output file and map results back by custom_id
+
+    Args:
+        client: OpenAI client
+        bodies: Chat completion request bodies keyed by custom_id
+
+    Returns:
+        Dict mapping custom_id → message content
+        Requests that failed individually are omitted
+
+    Raises:
+        RuntimeError: If the batch fails, expires or exceeds BATCH_MAX_WAIT_SECONDS
+    """
+    if not bodies:
+        return {}
+
+    payload = b"".join(
+        orjson.dumps({
+            "custom_id": custom_id,
+            "method": "POST",
+            "url": CHAT_COMPLETIONS_ENDPOINT,
+            "body": body
+        }) + b"\n"
+        for custom_id, body in bodies.items()
+    )
+
+    input_file = OPENAI_RETRY(client.files.create)(
+        file=("batch_input.jsonl", payload),
+        purpose="batch"
+    )
+    batch = OPENAI_RETRY(client.batches.create)(
+        input_file_id=input_file.id,
+        endpoint=CHAT_COMPLETIONS_ENDPOINT,
+        completion_window=BATCH_COMPLETION_WINDOW
+    )
+    logger.info(f"[Batch] Submitted batch {batch.id} with {len(bodies)} requests")
+
+    deadline = time.monotonic() + BATCH_MAX_WAIT_SECONDS
+    while batch.status != "completed":
+        if batch.status in BATCH_FAILED_STATUSES:
+            raise RuntimeError(f"Batch {batch.id} ended with status '{batch.status}'")
+        if time.monotonic() > deadline:
+            client.batches.cancel(batch.id)
+            raise RuntimeError(f"Batch {batch.id} timed out after {BATCH_MAX_WAIT_SECONDS}s")
+
+        time.sleep(BATCH_POLL_INTERVAL_SECONDS)
+        batch = OPENAI_RETRY(client.batches.retrieve)(batch.id)
+
+    logger.info(f"[Batch] Batch {batch.id} completed")
+
+    if not batch.output_file_id:
+        logger.warning(f"[Batch] Batch {batch.id} produced no output file")
+        return {}
+
+    output = OPENAI_RETRY(client.files.content)(batch.output_file_id).text
+
+    results = {}
+    for line in output.splitlines():
+        if not line.strip():
+            continue
+
+        record = orjson.loads(line)
+        response = record.get("response") or {}
+
+        if response.get("status_code") != 200:
+            logger.warning(f"[Batch] Request {record.get('custom_id')} failed: {record.get('error')}")
+            continue
+
+        results[record["custom_id"]] = response["body"]["choices"][0]["message"]["content"]
+
+    return results
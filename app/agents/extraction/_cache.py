@@ -0,0 +1,291 @@
+"""
+Content-addressed disk cache for LLM results.
+
+Entries are JSON files (or .npy files for arrays) named by a SHA-256 key
+under <cache dir>/<namespace>/. A cache failure never breaks the
+pipeline: read errors are treated as misses and write errors are only
+logged.
+
+The directory (LLM_CACHE_DIR by default) is capped at LLM_CACHE_MAX_MB:
+writes periodically evict the least recently used entries. Set
+LLM_CACHE_ENABLED=false to turn the cache off.
+"""
+import contextlib
+import hashlib
+import itertools
+import logging
+import os
+import tempfile
+from typing import Any, Dict, Optional
+
+import numpy as np
+import orjson
+from openai import OpenAI
+
+from ...config import get_settings
+from .constants_extraction import (
+    LLM_CACHE_DIR,
+    LLM_CACHE_PRUNE_INTERVAL,
+    LLM_CACHE_PRUNE_TARGET,
+    CHAT_CACHE_NAMESPACE
+)
+from ._rate_limiter import throttled_chat_completion
+
+logger = logging.getLogger(__name__)
+
+_write_counter = itertools.count()
+
+# ============================================================================
+# CACHE LOGIC
+# ============================================================================
+
+def make_cache_key(*parts: str) -> str:
+    """
+    Build a cache key from the inputs that determine an LLM result.
+
+    Args:
+        *parts: Model, prompt version, input text, ...
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()
+
+
+def cache_get(namespace: str, key: str) -> Optional[Any]:
+    """
+    Read a cached value.
+
+    Args:
+        namespace: Cache sub-directory
+        key: Key from make_cache_key
+
+    Returns:
+        Cached value or None on miss
+    """
+    if not get_settings().llm_cache_enabled:
+        return None
+
+    path = _entry_path(namespace, key)
+
+    try:
+        with open(path, "rb") as f:
+            value = orjson.loads(f.read())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"[Cache] Unreadable entry {namespace}/{key}: {e}")
+        return None
+
+    _touch(path)
+    return value
+
+
+def cache_put(namespace: str, key: str, value: Any) -> None:
+    """
+    Store a JSON-serializable value.
+
+    Writes to a temp file then renames, so concurrent readers never see
+    a partial entry; a failed write removes its temp file.
+
+    Args:
+        namespace: Cache sub-directory
+        key: Key from make_cache_key
+        value: JSON-serializable value
+    """
+    if not get_settings().llm_cache_enabled:
+        return
+
+    path = _entry_path(namespace, key)
+    tmp_path = None
+
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(orjson.dumps(value))
+        os.replace(tmp_path, path)
+        _maybe_prune()
+    except (OSError, TypeError, ValueError) as e:
+        logger.warning(f"[Cache] Failed to write entry {namespace}/{key}: {e}")
+        _discard_tmp(tmp_path)
+
+
+def cache_get_array(namespace: str, key: str) -> Optional[np.ndarray]:
+    """
+    Read a cached numpy array.
+
+    Args:
+        namespace: Cache sub-directory
+        key: Key from make_cache_key
+
+    Returns:
+        Cached array or None on miss
+    """
+    if not get_settings().llm_cache_enabled:
+        return None
+
+    path = _entry_path(namespace, key, ".npy")
+
+    try:
+        value = np.load(path, allow_pickle=False)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"[Cache] Unreadable entry {namespace}/{key}: {e}")
+        return None
+
+    _touch(path)
+    return value
+
+
+def cache_put_array(namespace: str, key: str, value: np.ndarray) -> None:
+    """
+    Store a numpy array (atomic write, like cache_put).
+
+    Args:
+        namespace: Cache sub-directory
+        key: Key from make_cache_key
+        value: Array to store
+    """
+    if not get_settings().llm_cache_enabled:
+        return
+
+    path = _entry_path(namespace, key, ".npy")
+    tmp_path = None
+
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            np.save(f, value, allow_pickle=False)
+        os.replace(tmp_path, path)
+        _maybe_prune()
+    except (OSError, ValueError) as e:
+        logger.warning(f"[Cache] Failed to write entry {namespace}/{key}: {e}")
+        _discard_tmp(tmp_path)
+
+
+def cached_chat_completion(client: OpenAI, body: Dict[str, Any]) -> str:
+    """
+    Run a chat completion, reusing the stored content of an identical request.
+
+    The key covers the whole request body (model, messages, temperature,
+    max_tokens, ...), so any prompt change is a miss. Only complete
+    responses (finish_reason "stop") are stored.
+
+    Args:
+        client: OpenAI client
+        body: Chat completion request body
+
+    Returns:
+        Message content
+    """
+    key = _chat_cache_key(body)
+
+    cached = cache_get(CHAT_CACHE_NAMESPACE, key)
+    if isinstance(cached, str):
+        return cached
+
+    response = throttled_chat_completion(client, body)
+
+    return _store_chat_content(key, response)
+
+
+def _chat_cache_key(body: Dict[str, Any]) -> str:
+    """Cache key covering the whole request body."""
+    return make_cache_key(orjson.dumps(body, option=orjson.OPT_SORT_KEYS).decode("utf-8"))
+
+
+def _store_chat_content(key: str, response: Any) -> str:
+    """Store a complete response's content and return it."""
+    choice = response.choices[0]
+
+    if choice.finish_reason == "stop":
+        cache_put(CHAT_CACHE_NAMESPACE, key, choice.message.content)
+
+    return choice.message.content
+
+
+def prune_cache(max_bytes: int) -> int:
+    """
+    Evict the least recently used entries until the cache fits max_bytes.
+
+    Recency is the file mtime, refreshed on every hit. Eviction stops at
+    LLM_CACHE_PRUNE_TARGET of the cap, so the next writes do not trigger
+    another pass right away.
+
+    Args:
+        max_bytes: Size cap of the whole cache directory
+
+    Returns:
+        Number of entries removed
+    """
+    entries = []
+    total = 0
+
+    try:
+        with os.scandir(_cache_root()) as namespaces:
+            for namespace in namespaces:
+                if not namespace.is_dir():
+                    continue
+                with os.scandir(namespace.path) as files:
+                    for entry in files:
+                        if entry.name.endswith(".tmp"):
+                            continue  # In-flight write
+                        stat = entry.stat()
+                        entries.append((stat.st_mtime, stat.st_size, entry.path))
+                        total += stat.st_size
+    except OSError as e:
+        logger.warning(f"[Cache] Failed to scan cache directory: {e}")
+        return 0
+
+    if total <= max_bytes:
+        return 0
+
+    target = max_bytes * LLM_CACHE_PRUNE_TARGET
+    removed = 0
+
+    for _, size, path in sorted(entries):
+        if total <= target:
+            break
+        with contextlib.suppress(OSError):
+            os.unlink(path)
+            removed += 1
+        total -= size
+
+    logger.info(f"[Cache] Evicted {removed} entries to stay under {max_bytes >> 20} MB")
+    return removed
+
+
+def _maybe_prune() -> None:
+    """Enforce the size cap every LLM_CACHE_PRUNE_INTERVAL writes."""
+    if next(_write_counter) % LLM_CACHE_PRUNE_INTERVAL:
+        return
+
+    max_mb = get_settings().llm_cache_max_mb
+    if max_mb > 0:
+        prune_cache(max_mb << 20)
+
+
+def _touch(path: str) -> None:
+    """Mark an entry as recently used (eviction order)."""
+    with contextlib.suppress(OSError):
+        os.utime(path)
+
+
+def _discard_tmp(tmp_path: Optional[str]) -> None:
+    """Remove the temp file of a failed write, if it was created."""
+    if tmp_path is not None:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+
+
+def _cache_root() -> str:
+    """Return the cache directory (LLM_CACHE_DIR unless configured)."""
+    return os.path.expanduser(get_settings().llm_cache_dir or LLM_CACHE_DIR)
+
+
+def _entry_path(namespace: str, key: str, suffix: str = ".json") -> str:
+    """Return the file path of a cache entry."""
+    return os.path.join(_cache_root(), namespace, f"{key}{suffix}")
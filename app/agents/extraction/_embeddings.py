@@ -0,0 +1,141 @@
+"""
+Embedding helper shared by the extraction agents.
+
+Large inputs are split into sub-batches so a single request never exceeds
+the embeddings endpoint limits, and the sub-batches are sent concurrently
+over the shared client's connection pool.
+
+OpenAI vectors are cached on disk per (model, text), so reruns only pay
+for texts that were never embedded before.
+
+When LOCAL_EMBEDDING_MODEL is set and sentence-transformers is installed,
+texts are embedded locally instead (no network call, no per-token cost).
+"""
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, List, Optional
+
+import numpy as np
+from openai import OpenAI
+
+from ...config import get_settings
+from .constants_extraction import (
+    EMBEDDING_MODEL,
+    EMBEDDING_BATCH_SIZE,
+    EMBEDDING_MAX_WORKERS,
+    LOCAL_EMBEDDING_BATCH_SIZE,
+    EMBEDDING_CACHE_NAMESPACE
+)
+from ...services.openai_client import get_openai_client, OPENAI_RETRY
+from ._cache import make_cache_key, cache_get_array, cache_put_array
+
+logger = logging.getLogger(__name__)
+
+# ============================================================================
+# EMBEDDING LOGIC
+# ============================================================================
+
+def embed_texts(texts: List[str], normalize: bool = False) -> np.ndarray:
+    """
+    Embed texts, preserving input order.
+
+    Args:
+        texts: Texts to embed
+        normalize: L2-normalize rows, so cosine similarity is a plain dot
+            product (default: False)
+
+    Returns:
+        float32 matrix of shape (len(texts), dim)
+
+    Raises:
+        openai.OpenAIError: If any sub-batch request fails
+    """
+    if not texts:
+        return np.empty((0, 0), dtype=np.float32)
+
+    local_model = get_settings().local_embedding_model
+    if local_model:
+        embedder = _get_local_embedder(local_model)
+        if embedder is not None:
+            return embedder.encode(
+                texts,
+                batch_size=LOCAL_EMBEDDING_BATCH_SIZE,
+                normalize_embeddings=True,
+                convert_to_numpy=True
+            ).astype(np.float32, copy=False)
+
+    keys = [make_cache_key(EMBEDDING_MODEL, text) for text in texts]
+    vectors: List[Optional[np.ndarray]] = [
+        cache_get_array(EMBEDDING_CACHE_NAMESPACE, key) for key in keys
+    ]
+
+    missing = [i for i, vector in enumerate(vectors) if vector is None]
+    if missing:
+        if len(missing) < len(texts):
+            logger.info(f"[Embeddings] {len(texts) - len(missing)}/{len(texts)} embeddings served from cache")
+
+        new_vectors = _embed_remote([texts[i] for i in missing])
+        for i, vector in zip(missing, new_vectors):
+            vectors[i] = vector
+            cache_put_array(EMBEDDING_CACHE_NAMESPACE, keys[i], vector)
+
+    embeddings = np.stack(vectors).astype(np.float32, copy=False)
+    if normalize:
+        embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True).clip(min=1e-12)
+
+    return embeddings
+
+
+def _embed_remote(texts: List[str]) -> np.ndarray:
+    """Embed texts with the OpenAI API, in concurrent sub-batches."""
+    client = get_openai_client()
+    batches = [
+        texts[i:i + EMBEDDING_BATCH_SIZE]
+        for i in range(0, len(texts), EMBEDDING_BATCH_SIZE)
+    ]
+
+    if len(batches) == 1:
+        results = [_embed_batch(client, batches[0])]
+    else:
+        logger.info(f"[Embeddings] Embedding {len(texts)} texts in {len(batches)} concurrent batches")
+        with ThreadPoolExecutor(max_workers=min(EMBEDDING_MAX_WORKERS, len(batches))) as executor:
+            results = list(executor.map(lambda batch: _embed_batch(client, batch), batches))
+
+    return np.asarray(
+        [embedding for batch in results for embedding in batch],
+        dtype=np.float32
+    )
+
+
+@OPENAI_RETRY
+def _embed_batch(client: OpenAI, texts: List[str]) -> List[List[float]]:
+    """Embed one sub-batch, ordered by the index the API reports for each input."""
+    response = client.embeddings.create(
+        model=EMBEDDING_MODEL,
+        input=texts
+    )
+    return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+
+
+@lru_cache(maxsize=1)
+def _get_local_embedder(model_name: str) -> Optional[Any]:
+    """
+    Load a sentence-transformers model once per process.
+
+    Returns:
+        SentenceTransformer instance, or None if the optional dependency is
+        missing or the model cannot be loaded (caller falls back to OpenAI)
+    """
+    try:
+        from sentence_transformers import SentenceTransformer
+    except ImportError:
+        logger.warning("[Embeddings] sentence-transformers not installed, using OpenAI embeddings")
+        return None
+
+    try:
+        logger.info(f"[Embeddings] Loading local embedding model {model_name}")
+        return SentenceTransformer(model_name)
+    except Exception as e:
+        logger.error(f"[Embeddings] Failed to load {model_name}: {e}, using OpenAI embeddings")
+        return None
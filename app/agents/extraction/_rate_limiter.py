@@ -0,0 +1,139 @@
+"""
+Proactive OpenAI rate limiting.
+
+Concurrent workers share one request/token budget sized to the account's
+RPM/TPM quota (OPENAI_RPM / OPENAI_TPM settings). Each call waits for budget
+before it is sent, so the pipeline runs at the quota ceiling instead of
+bursting into 429s and spending its time in retry backoff.
+
+Both limits default to 0 (disabled).
+
+throttled_chat_completion applies the limiter inside the retry loop, so
+retries after a 429 wait for budget too.
+"""
+import logging
+import threading
+import time
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+from openai import OpenAI
+
+from ...config import get_settings
+from ...services.openai_client import OPENAI_RETRY
+from ._tokens import count_tokens
+
+logger = logging.getLogger(__name__)
+
+# ============================================================================
+# RATE LIMITER
+# ============================================================================
+
+class LeakyBucket:
+    """
+    Request and token budgets refilled continuously at rpm/tpm per minute.
+
+    A limit of 0 disables that budget.
+    """
+
+    def __init__(self, rpm: int, tpm: int):
+        self.rpm = rpm
+        self.tpm = tpm
+        self._available_requests = float(rpm)
+        self._available_tokens = float(tpm)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: int) -> None:
+        """
+        Block until one request and `tokens` tokens are available, then consume them.
+
+        Args:
+            tokens: Estimated tokens of the request (prompt + max completion);
+                clamped to the per-minute capacity so oversized requests still pass
+        """
+        if self.tpm:
+            tokens = min(tokens, self.tpm)
+
+        while True:
+            with self._lock:
+                self._refill()
+
+                has_request = not self.rpm or self._available_requests >= 1
+                has_tokens = not self.tpm or self._available_tokens >= tokens
+                if has_request and has_tokens:
+                    if self.rpm:
+                        self._available_requests -= 1
+                    if self.tpm:
+                        self._available_tokens -= tokens
+                    return
+
+                wait = 0.0
+                if not has_request:
+                    wait = (1 - self._available_requests) * 60 / self.rpm
+                if not has_tokens:
+                    wait = max(wait, (tokens - self._available_tokens) * 60 / self.tpm)
+
+            time.sleep(wait)
+
+    def _refill(self) -> None:
+        """Add the budget accrued since the last refill (caller holds the lock)."""
+        now = time.monotonic()
+        elapsed_minutes = (now - self._last_refill) / 60
+        self._last_refill = now
+
+        if self.rpm:
+            self._available_requests = min(self.rpm, self._available_requests + elapsed_minutes * self.rpm)
+        if self.tpm:
+            self._available_tokens = min(self.tpm, self._available_tokens + elapsed_minutes * self.tpm)
+
+
+@lru_cache(maxsize=1)
+def get_rate_limiter() -> Optional[LeakyBucket]:
+    """
+    Return the process-wide limiter, or None when no limit is configured.
+
+    Returns:
+        LeakyBucket shared by all OpenAI chat calls
+    """
+    settings = get_settings()
+
+    if not settings.openai_rpm and not settings.openai_tpm:
+        return None
+
+    logger.info(f"[Rate Limiter] Limiting OpenAI calls to {settings.openai_rpm} RPM / {settings.openai_tpm} TPM")
+    return LeakyBucket(settings.openai_rpm, settings.openai_tpm)
+
+
+def throttle(messages: List[Dict], max_tokens: int) -> None:
+    """
+    Wait for rate-limit budget before sending a chat completion.
+
+    Args:
+        messages: Chat messages of the request
+        max_tokens: Completion token cap of the request
+    """
+    limiter = get_rate_limiter()
+    if limiter is None:
+        return
+
+    prompt_tokens = sum(count_tokens(message["content"]) for message in messages)
+    limiter.acquire(prompt_tokens + max_tokens)
+
+
+@OPENAI_RETRY
+def throttled_chat_completion(client: OpenAI, body: Dict) -> Any:
+    """
+    Run a chat completion, retrying transient errors (429, 5xx, network).
+
+    Every attempt waits for rate-limit budget, retries included.
+
+    Args:
+        client: OpenAI client
+        body: Chat completion request body
+
+    Returns:
+        Chat completion response (or stream when body sets stream)
+    """
+    throttle(body["messages"], body.get("max_tokens", 0))
+    return client.chat.completions.create(**body)
@@ -0,0 +1,80 @@
+"""
+Token counting helpers for the extraction pipeline.
+
+Character limits under- or over-shoot the model's token budget depending
+on the language; these helpers slice text at an exact token count using
+the tokenizer of the extraction model.
+"""
+import logging
+from functools import lru_cache
+from typing import Any, Optional
+
+from .constants_extraction import EXTRACTION_MODEL
+
+logger = logging.getLogger(__name__)
+
+# ============================================================================
+# TOKEN LOGIC
+# ============================================================================
+
+@lru_cache(maxsize=1)
+def get_encoder() -> Optional[Any]:
+    """
+    Return the tiktoken encoding of EXTRACTION_MODEL, loaded once per process.
+
+    Returns:
+        tiktoken Encoding, or None if tiktoken or its encoding file is
+        unavailable (callers fall back to character limits)
+    """
+    try:
+        import tiktoken
+        return tiktoken.encoding_for_model(EXTRACTION_MODEL)
+    except Exception as e:
+        logger.warning(f"[Tokens] Tokenizer unavailable for {EXTRACTION_MODEL}: {e}")
+        return None
+
+
+def count_tokens(text: str) -> int:
+    """
+    Count tokens of text.
+
+    Args:
+        text: Text to measure
+
+    Returns:
+        Exact token count, or a ~4 characters/token estimate without a tokenizer
+    """
+    encoder = get_encoder()
+
+    if encoder is None:
+        return len(text) // 4 + 1
+
+    return len(encoder.encode(text))
+
+
+def truncate_to_tokens(text: str, max_tokens: int, fallback_max_chars: int) -> str:
+    """
+    Truncate text to at most max_tokens tokens.
+
+    Args:
+        text: Text to truncate
+        max_tokens: Token budget
+        fallback_max_chars: Character limit used when no tokenizer is available
+
+    Returns:
+        Truncated text (unchanged if already within budget)
+    """
+    encoder = get_encoder()
+
+    if encoder is None:
+        if len(text) > fallback_max_chars:
+            logger.info(f"[Tokens] Truncating text from {len(text)} to {fallback_max_chars} chars")
+            return text[:fallback_max_chars]
+        return text
+
+    tokens = encoder.encode(text)
+    if len(tokens) <= max_tokens:
+        return text
+
+    logger.info(f"[Tokens] Truncating text from {len(tokens)} to {max_tokens} tokens")
+    return encoder.decode(tokens[:max_tokens])
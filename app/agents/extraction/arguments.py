@@ -9,6 +9,7 @@ Implements 4-axis improvement strategy:
 
 Original monolithic implementation backed up in arguments_old.py
 """
+import asyncio
 import logging
 from typing import List, Dict, Tuple
 
@@ -16,18 +17,21 @@ from ...config import get_settings
 from ...utils.language_detector import detect_language
 from ...constants import (
     TRANSCRIPT_MAX_LENGTH_FOR_ARGS,
+    TRANSCRIPT_MAX_TOKENS_FOR_ARGS,
     TRANSCRIPT_MIN_LENGTH,
     LANGUAGE_MAP_DETECTION
 )
 
 # Import pipeline components
 from .segmentation import segment_transcript, get_segment_stats
-from .local_extractor import extract_from_all_segments
+from .local_extractor import extract_from_all_segments, extract_from_all_segments_batch
 from .consolidator import consolidate_arguments
 from .hierarchy import build_hierarchy
-from .translator import translate_arguments
-from .validators import validate_arguments
+from .translator import translate_arguments, translate_arguments_batch_api
+from .validators import validate_arguments, validate_arguments_batch_api
+from .constants_extraction import BATCH_API_MIN_ARGUMENTS
 from .tree_builder import build_reasoning_trees, ArgumentStructure
+from ._tokens import truncate_to_tokens
 
 logger = logging.getLogger(__name__)
 
@@ -39,7 +43,8 @@ def extract_arguments(
     transcript_text: str,
     video_id: str = "",
     enable_hierarchy: bool = True,
-    enable_validation: bool = True
+    enable_validation: bool = True,
+    use_batch_api: bool = False
 ) -> Tuple[str, ArgumentStructure]:
     """
     Extract arguments using improved pipeline approach.
@@ -56,6 +61,10 @@ def extract_arguments(
         video_id: Video identifier (optional)
         enable_hierarchy: Build argument hierarchy (default: True)
         enable_validation: Validate arguments before translation (default: True)
+        use_batch_api: Extract segments through one OpenAI Batch API job, and
+            validate/translate through Batch API jobs too when there are at
+            least BATCH_API_MIN_ARGUMENTS arguments (half the cost, but
+            minutes to hours of latency) (default: False)
 
     Returns:
         Tuple of (detected_language, argument_structure)
@@ -84,10 +93,12 @@ def extract_arguments(
     lang_code = LANGUAGE_MAP_DETECTION.get(detected_lang, "fr")
     logger.info(f"[Arguments] Detected language: {detected_lang} ({lang_code})")
 
-    # Truncate if too long
-    if len(transcript_text) > TRANSCRIPT_MAX_LENGTH_FOR_ARGS:
-        logger.info(f"[Arguments] Truncating transcript from {len(transcript_text)} to {TRANSCRIPT_MAX_LENGTH_FOR_ARGS} chars")
-        transcript_text = transcript_text[:TRANSCRIPT_MAX_LENGTH_FOR_ARGS]
+    # Truncate if too long (token-accurate, character limit as fallback)
+    transcript_text = truncate_to_tokens(
+        transcript_text,
+        TRANSCRIPT_MAX_TOKENS_FOR_ARGS,
+        fallback_max_chars=TRANSCRIPT_MAX_LENGTH_FOR_ARGS
+    )
 
     # ========================================================================
     # AXIS 1: Pipeline-Based Extraction
@@ -101,7 +112,10 @@ def extract_arguments(
 
     # Step 1.2: Extract from each segment locally
     logger.info("[Arguments] Step 2/6: Extracting from segments")
-    all_segment_arguments = extract_from_all_segments(segments, language=lang_code)
+    if use_batch_api:
+        all_segment_arguments = extract_from_all_segments_batch(segments, language=lang_code)
+    else:
+        all_segment_arguments = extract_from_all_segments(segments, language=lang_code)
     total_extracted = sum(len(args) for args in all_segment_arguments)
     logger.info(f"[Arguments] Extracted {total_extracted} arguments from segments")
 
@@ -119,11 +133,17 @@ def extract_arguments(
             total_arguments=0
         ))
 
+    use_batch_api_for_arguments = use_batch_api and len(consolidated) >= BATCH_API_MIN_ARGUMENTS
+
     # ========================================================================
     # AXIS 4: Validation (before translation)
     # ========================================================================
 
-    if enable_validation:
+    if enable_validation and use_batch_api_for_arguments:
+        logger.info("[Arguments] Step 4/6: Validating arguments (Batch API)")
+        validated = validate_arguments_batch_api(consolidated)
+        logger.info(f"[Arguments] Validated {len(validated)} of {len(consolidated)} arguments")
+    elif enable_validation:
         logger.info("[Arguments] Step 4/6: Validating arguments")
         validated = validate_arguments(consolidated)
         logger.info(f"[Arguments] Validated {len(validated)} of {len(consolidated)} arguments")
@@ -145,7 +165,8 @@ def extract_arguments(
     # ========================================================================
 
     logger.info("[Arguments] Step 5/6: Translating arguments")
-    translated = translate_arguments(
+    translate = translate_arguments_batch_api if use_batch_api_for_arguments else translate_arguments
+    translated = translate(
         validated,
         target_language="en",
         source_language=lang_code
@@ -189,6 +210,39 @@ def extract_arguments(
 # UTILITIES
 # ============================================================================
 
+async def extract_arguments_async(
+    transcript_text: str,
+    video_id: str = "",
+    enable_hierarchy: bool = True,
+    enable_validation: bool = True,
+    use_batch_api: bool = False
+) -> Tuple[str, ArgumentStructure]:
+    """
+    Async variant of extract_arguments for use inside the event loop.
+
+    The pipeline is blocking (sync OpenAI client, thread pools), so it runs
+    in a worker thread: other requests keep being served while a video is
+    extracted, and several videos can be extracted concurrently.
+
+    Args:
+        Same as extract_arguments
+
+    Returns:
+        Tuple of (detected_language, argument_structure)
+
+    Example:
+        >>> results = await asyncio.gather(*[extract_arguments_async(t) for t in transcripts])
+    """
+    return await asyncio.to_thread(
+        extract_arguments,
+        transcript_text,
+        video_id,
+        enable_hierarchy,
+        enable_validation,
+        use_batch_api
+    )
+
+
 def extract_arguments_simple(
     transcript_text: str,
     video_id: str = ""
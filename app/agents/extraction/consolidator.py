@@ -3,16 +3,32 @@ Argument consolidation and deduplication (Axis 1).
 
 Merges arguments from multiple segments and removes semantic duplicates.
 """
+import hashlib
 import logging
+import re
+from collections import defaultdict
 from typing import List, Dict
 import numpy as np
-from openai import OpenAI
 
 from ...config import get_settings
-from .constants_extraction import DEDUPLICATION_THRESHOLD
+from .constants_extraction import (
+    DEDUPLICATION_THRESHOLD,
+    DEDUP_CLUSTER_MIN_ARGUMENTS,
+    DEDUP_CLUSTER_BLOCK_SIZE,
+    SIMHASH_BITS,
+    SIMHASH_BANDS,
+    SIMHASH_MAX_HAMMING,
+    SIMHASH_NGRAM_SIZE
+)
+from ._embeddings import embed_texts
 
 logger = logging.getLogger(__name__)
 
+INT8_SCALE = 127  # Unit-norm components in [-1, 1] -> int8
+
+_PUNCTUATION_RE = re.compile(r"[^\w\s]")
+_WHITESPACE_RE = re.compile(r"\s+")
+
 # ============================================================================
 # CONSOLIDATION LOGIC
 # ============================================================================
@@ -25,7 +41,8 @@ def consolidate_arguments(
     Consolidate arguments from all segments.
 
     Process:
-    1. Flatten all arguments from segments
+    1. Flatten all arguments from segments, dropping exact duplicates
+       (segment overlap repeats the same argument in adjacent segments)
     2. Remove semantic duplicates using embeddings
     3. Keep most complete version of duplicates
 
@@ -40,10 +57,14 @@ def consolidate_arguments(
         >>> consolidated = consolidate_arguments(all_segment_args)
         >>> print(f"Reduced from {sum(len(a) for a in all_segment_args)} to {len(consolidated)}")
     """
-    # Step 1: Flatten
-    all_arguments = []
+    # Step 1: Flatten (first occurrence of each normalized text wins)
+    seen = {}
     for segment_args in all_segment_arguments:
-        all_arguments.extend(segment_args)
+        for arg in segment_args:
+            key = _normalize_text(arg.get("argument_en") or arg["argument"])
+            seen.setdefault(key, arg)
+
+    all_arguments = list(seen.values())
 
     if not all_arguments:
         logger.info("[Consolidator] No arguments to consolidate")
@@ -77,33 +98,35 @@ def deduplicate_by_similarity(
         List of unique arguments
 
     Note:
-        Uses OpenAI text-embedding-3-small for efficiency
+        Exact and near-exact duplicates (typically produced by the segment
+        overlap) are dropped first without any API call; only survivors are
+        embedded with OpenAI text-embedding-3-small, sub-batched by embed_texts
     """
     if len(arguments) <= 1:
         return arguments
 
+    arguments = _drop_near_exact_duplicates(arguments)
+    if len(arguments) <= 1:
+        return arguments
+
     settings = get_settings()
 
-    if not settings.openai_api_key:
+    if not settings.openai_api_key and not settings.local_embedding_model:
         logger.warning("[Consolidator] No OpenAI key, skipping deduplication")
         return arguments
 
     try:
-        client = OpenAI(api_key=settings.openai_api_key)
-
         # Get embeddings for all arguments
         logger.info("[Consolidator] Computing embeddings for deduplication")
 
         texts = [arg["argument"] for arg in arguments]
-        response = client.embeddings.create(
-            model="text-embedding-3-small",
-            input=texts
-        )
-
-        embeddings = [data.embedding for data in response.data]
+        embeddings = embed_texts(texts)
 
         # Find duplicates
-        unique_indices = _find_unique_indices(embeddings, threshold)
+        if len(arguments) > DEDUP_CLUSTER_MIN_ARGUMENTS:
+            unique_indices = _cluster_representatives(embeddings, texts, threshold)
+        else:
+            unique_indices = _find_unique_indices(embeddings, threshold)
 
         unique_arguments = [arguments[i] for i in unique_indices]
 
@@ -118,6 +141,89 @@ def deduplicate_by_similarity(
         return arguments
 
 
+def _drop_near_exact_duplicates(arguments: List[Dict]) -> List[Dict]:
+    """
+    Drop exact and near-exact duplicates, keeping first occurrences.
+
+    Process:
+    1. Exact: 8-byte BLAKE2b digest of the normalized text
+    2. Near-exact: SimHash of the normalized text, LSH-banded so only
+       arguments sharing a band are compared (Hamming <= SIMHASH_MAX_HAMMING)
+
+    Args:
+        arguments: List of argument dicts
+
+    Returns:
+        Arguments without exact/near-exact duplicates
+    """
+    seen_digests = set()
+    buckets = defaultdict(list)
+    band_bits = SIMHASH_BITS // SIMHASH_BANDS
+    band_mask = (1 << band_bits) - 1
+    kept = []
+
+    for arg in arguments:
+        normalized = _normalize_text(arg["argument"])
+
+        digest = hashlib.blake2b(normalized.encode("utf-8"), digest_size=8).digest()
+        if digest in seen_digests:
+            continue
+        seen_digests.add(digest)
+
+        fingerprint = _simhash(normalized)
+        bands = [
+            (band, (fingerprint >> (band * band_bits)) & band_mask)
+            for band in range(SIMHASH_BANDS)
+        ]
+        if any(
+            (fingerprint ^ other).bit_count() <= SIMHASH_MAX_HAMMING
+            for key in bands
+            for other in buckets[key]
+        ):
+            continue
+
+        for key in bands:
+            buckets[key].append(fingerprint)
+        kept.append(arg)
+
+    if len(kept) < len(arguments):
+        logger.info(f"[Consolidator] Dropped {len(arguments) - len(kept)} exact/near-exact duplicates before embedding")
+
+    return kept
+
+
+def _normalize_text(text: str) -> str:
+    """Lowercase, strip punctuation and collapse whitespace."""
+    text = _PUNCTUATION_RE.sub(" ", text.lower())
+    return _WHITESPACE_RE.sub(" ", text).strip()
+
+
+def _simhash(text: str) -> int:
+    """
+    Compute a SIMHASH_BITS-bit SimHash over character n-grams.
+
+    Args:
+        text: Normalized text
+
+    Returns:
+        Fingerprint as an int; similar texts differ in few bits
+    """
+    grams = {
+        text[i:i + SIMHASH_NGRAM_SIZE]
+        for i in range(max(len(text) - SIMHASH_NGRAM_SIZE + 1, 1))
+    }
+    digests = b"".join(
+        hashlib.blake2b(gram.encode("utf-8"), digest_size=SIMHASH_BITS // 8).digest()
+        for gram in grams
+    )
+
+    # One row of bits per n-gram; a bit is set where most n-grams set it
+    bits = np.unpackbits(np.frombuffer(digests, dtype=np.uint8)).reshape(len(grams), SIMHASH_BITS)
+    majority = bits.sum(axis=0) * 2 > len(grams)
+
+    return int.from_bytes(np.packbits(majority).tobytes(), "big")
+
+
 def _find_unique_indices(
     embeddings: List[List[float]],
     threshold: float
@@ -125,6 +231,13 @@ def _find_unique_indices(
     """
     Find indices of unique embeddings based on cosine similarity.
 
+    Rows are L2-normalized once, then quantized to int8 (x127): a 1536-d
+    row takes 1.5 KB instead of 6 KB, and the quantization error on a dot
+    product stays far below the gap between unrelated and duplicate
+    arguments. Each row is compared only against the rows kept so far
+    (K x d, K << N after deduplication), with int32 accumulation, against
+    the threshold scaled into integer space (0.85 -> 13710).
+
     Args:
         embeddings: List of embedding vectors
         threshold: Similarity threshold
@@ -132,49 +245,84 @@ def _find_unique_indices(
     Returns:
         List of indices for unique arguments
     """
-    unique_indices = []
-    embeddings_array = np.array(embeddings)
-
-    for i in range(len(embeddings)):
-        is_duplicate = False
+    matrix = _normalize_rows(embeddings)
+    if len(matrix) == 0:
+        return []
 
-        # Compare with already selected unique arguments
-        for j in unique_indices:
-            similarity = _cosine_similarity(
-                embeddings_array[i],
-                embeddings_array[j]
-            )
+    quantized = np.clip(np.round(matrix * INT8_SCALE), -128, 127).astype(np.int8)
+    threshold_scaled = int(threshold * INT8_SCALE * INT8_SCALE)
 
-            if similarity > threshold:
-                is_duplicate = True
-                logger.debug(f"[Consolidator] Argument {i} is duplicate of {j} (sim: {similarity:.3f})")
-                break
+    # Pre-allocated buffer of kept rows (avoids re-stacking on every keep)
+    kept = np.empty_like(quantized)
+    kept_count = 0
+    unique_indices = []
 
-        if not is_duplicate:
+    for i, vector in enumerate(quantized):
+        if kept_count == 0 or np.matmul(kept[:kept_count], vector, dtype=np.int32).max() <= threshold_scaled:
+            kept[kept_count] = vector
+            kept_count += 1
             unique_indices.append(i)
 
     return unique_indices
 
 
-def _cosine_similarity(vec1: np.ndarray, vec2: np.ndarray) -> float:
+def _cluster_representatives(
+    embeddings: List[List[float]],
+    texts: List[str],
+    threshold: float
+) -> List[int]:
     """
-    Calculate cosine similarity between two vectors.
+    Find one representative per cluster of near-duplicate embeddings.
+
+    Used for large inputs: similarities are computed block by block
+    (DEDUP_CLUSTER_BLOCK_SIZE x N float32 products), every pair above the
+    threshold is linked in a union-find, and the longest text of each
+    connected component is kept.
 
     Args:
-        vec1: First embedding vector
-        vec2: Second embedding vector
+        embeddings: List of embedding vectors
+        texts: Argument texts aligned with embeddings
+        threshold: Similarity threshold
 
     Returns:
-        Similarity score (0.0-1.0)
+        Sorted indices of cluster representatives
     """
-    dot_product = np.dot(vec1, vec2)
-    norm1 = np.linalg.norm(vec1)
-    norm2 = np.linalg.norm(vec2)
-
-    if norm1 == 0 or norm2 == 0:
-        return 0.0
-
-    return dot_product / (norm1 * norm2)
+    matrix = _normalize_rows(embeddings)
+    parent = list(range(len(matrix)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for start in range(0, len(matrix), DEDUP_CLUSTER_BLOCK_SIZE):
+        block = matrix[start:start + DEDUP_CLUSTER_BLOCK_SIZE]
+        rows, cols = np.nonzero(block @ matrix.T > threshold)
+        for i, j in zip((rows + start).tolist(), cols.tolist()):
+            if i < j:
+                root_i, root_j = find(i), find(j)
+                if root_i != root_j:
+                    parent[root_j] = root_i
+
+    representatives: Dict[int, int] = {}
+    for i in range(len(matrix)):
+        root = find(i)
+        best = representatives.get(root)
+        if best is None or len(texts[i]) > len(texts[best]):
+            representatives[root] = i
+
+    return sorted(representatives.values())
+
+
+def _normalize_rows(embeddings: List[List[float]]) -> np.ndarray:
+    """Return embeddings as an L2-normalized float32 matrix (zero rows stay zero)."""
+    matrix = np.array(embeddings, dtype=np.float32)
+    if len(matrix) == 0:
+        return matrix
+
+    matrix /= np.linalg.norm(matrix, axis=1, keepdims=True).clip(min=1e-12)
+    return matrix
 
 
 def merge_similar_arguments(
@@ -42,15 +42,17 @@ MIN_SEGMENT_LENGTH = 500   # Minimum viable segment size
 # EXTRACTION PROMPTS (AXIS 1 + 2)
 # ============================================================================
 
-LOCAL_EXTRACTION_SYSTEM_PROMPT = "You are a precise argument extractor that identifies only causal and mechanistic reasoning."
+EXTRACTION_PROMPT_VERSION = "2"  # Bump when extraction prompts change (invalidates cache)
 
-LOCAL_EXTRACTION_USER_PROMPT = """
-{definition}
+# Static instructions live in the system message and only the segment is sent
+# as the user message, so the prefix is identical for every segment of a video
+# (language). OpenAI only caches prefixes of 1024+ tokens; this one is ~490, so
+# the split only pays off through prompt caching if the prompt grows past that.
+LOCAL_EXTRACTION_SYSTEM_PROMPT = """You are a precise argument extractor that identifies only causal and mechanistic reasoning.
 
-Analyze this transcript segment and extract ONLY the explanatory arguments.
+{definition}
 
-**Segment:**
-{segment}
+Analyze the transcript segment sent by the user and extract ONLY the explanatory arguments.
 
 **Language:** {language}
 
@@ -76,16 +78,34 @@ For each argument you extract:
 }}}}
 """
 
+# Feedback re-prompt when a response is not valid JSON (sent once)
+JSON_RETRY_FEEDBACK_PROMPT = "Your previous response was not valid JSON ({error}). Return the complete response again as a single valid JSON object, with no other text."
+
 # ============================================================================
 # CONSOLIDATION PROMPTS (AXIS 1)
 # ============================================================================
 
 DEDUPLICATION_THRESHOLD = 0.85  # Cosine similarity threshold for duplicates
+DEDUP_CLUSTER_MIN_ARGUMENTS = 500  # Above this, dedup by clustering instead of greedy scan
+DEDUP_CLUSTER_BLOCK_SIZE = 1024    # Rows per similarity block when clustering
+
+# Near-exact prefilter (before any embeddings call)
+SIMHASH_BITS = 128
+SIMHASH_BANDS = 4        # 4 x 32-bit bands: Hamming <= 3 guarantees one identical band
+SIMHASH_MAX_HAMMING = 3
+SIMHASH_NGRAM_SIZE = 3   # Character n-grams of the normalized text
+
+EMBEDDING_MODEL = "text-embedding-3-small"
+EMBEDDING_BATCH_SIZE = 256      # Inputs per embeddings request (stays under per-request caps)
+EMBEDDING_MAX_WORKERS = 4       # Concurrent embeddings requests for large inputs
+LOCAL_EMBEDDING_BATCH_SIZE = 64 # Encode batch size for the optional local embedder
 
 # ============================================================================
 # HIERARCHY PROMPTS (AXIS 3)
 # ============================================================================
 
+PARENT_SIMILARITY_THRESHOLD = 0.7  # Minimum cosine similarity to accept a parent match
+
 ROLE_CLASSIFICATION_SYSTEM_PROMPT = "You are an expert at analyzing argumentative structure."
 
 ROLE_CLASSIFICATION_USER_PROMPT = """
@@ -103,15 +123,80 @@ Classify the role of this argument within the overall reasoning.
 - **counter_argument**: Opposing view the author addresses
 
 {json_instruction}
+"""
 
-**Response format:**
-{{{{
-  "role": "thesis|sub_argument|evidence|counter_argument",
-  "parent_argument": "The thesis or sub-argument this supports (if applicable)",
-  "confidence": 0.0-1.0
-}}}}
+ROLE_BATCH_CLASSIFICATION_USER_PROMPT = """
+Classify the role of EACH argument below within the overall reasoning, and
+identify the argument it supports.
+
+**Arguments (with IDs):**
+{arguments}
+
+**Roles:**
+- **thesis**: Main claim or central assertion (top-level)
+- **sub_argument**: Supporting claim that backs up a thesis
+- **evidence**: Specific data, study, or fact used as support
+- **counter_argument**: Opposing view the author addresses
+
+For every argument, parent_id is the ID of the thesis or sub-argument it
+supports (null for thesis arguments). Return exactly one entry per ID.
+
+{json_instruction}
 """
 
+# Structured outputs: the API guarantees responses match these schemas
+ROLE_VALUES = ["thesis", "sub_argument", "evidence", "counter_argument"]
+
+ROLE_CLASSIFICATION_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "argument_role",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "role": {"type": "string", "enum": ROLE_VALUES},
+                "parent_argument": {
+                    "type": ["string", "null"],
+                    "description": "The thesis or sub-argument this supports (null for a thesis)"
+                },
+                "confidence": {"type": "number", "description": "0.0-1.0"}
+            },
+            "required": ["role", "parent_argument", "confidence"],
+            "additionalProperties": False
+        }
+    }
+}
+
+ROLE_BATCH_CLASSIFICATION_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "argument_roles",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "classifications": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "id": {"type": "integer"},
+                            "role": {"type": "string", "enum": ROLE_VALUES},
+                            "parent_id": {"type": ["integer", "null"]},
+                            "confidence": {"type": "number", "description": "0.0-1.0"}
+                        },
+                        "required": ["id", "role", "parent_id", "confidence"],
+                        "additionalProperties": False
+                    }
+                }
+            },
+            "required": ["classifications"],
+            "additionalProperties": False
+        }
+    }
+}
+
 # ============================================================================
 # TRANSLATION PROMPTS (AXIS 4)
 # ============================================================================
@@ -131,13 +216,69 @@ Translate this argument to {target_language}.
 {argument}
 
 {json_instruction}
+"""
 
-**Response format:**
-{{{{
-  "translation": "The faithful translation in {target_language}"
-}}}}
+TRANSLATION_BATCH_USER_PROMPT = """
+Translate EACH argument below to {target_language}.
+
+**Critical requirements:**
+1. Preserve the EXACT causal/mechanistic meaning
+2. Keep technical terms accurate
+3. Maintain the argumentative structure
+4. Do NOT add or remove reasoning
+5. Translate every item independently; never merge or split items
+6. Return exactly one entry per item, with its id
+
+**Original arguments ({source_language}, JSON):**
+{items}
+
+{json_instruction}
 """
 
+# Structured outputs: the API guarantees responses match these schemas
+TRANSLATION_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "argument_translation",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "translation": {"type": "string", "description": "The faithful translation"}
+            },
+            "required": ["translation"],
+            "additionalProperties": False
+        }
+    }
+}
+
+TRANSLATION_BATCH_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "argument_translations",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "translations": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "id": {"type": "integer"},
+                            "translation": {"type": "string"}
+                        },
+                        "required": ["id", "translation"],
+                        "additionalProperties": False
+                    }
+                }
+            },
+            "required": ["translations"],
+            "additionalProperties": False
+        }
+    }
+}
+
 # ============================================================================
 # VALIDATION PROMPTS (AXIS 4)
 # ============================================================================
@@ -160,17 +301,92 @@ Evaluate whether it meets AT LEAST ONE of these criteria:
 It is INVALID only if it's purely descriptive, narrative, or trivial.
 
 {json_instruction}
+"""
 
-**Response format:**
-{{{{
-  "is_valid": true/false,
-  "meets_causal_criterion": true/false,
-  "meets_mechanistic_criterion": true/false,
-  "meets_substantive_criterion": true/false,
-  "reasoning": "Brief explanation of why it's valid or invalid"
-}}}}
+VALIDATION_BATCH_USER_PROMPT = """
+{definition}
+
+Does EACH extracted text below qualify as an explanatory argument according
+to the definition above?
+
+**Texts (with IDs):**
+{items}
+
+A text is VALID if it meets ANY of the criteria, INVALID only if it's purely
+descriptive, narrative, or trivial. Judge every text independently and
+return exactly one entry per ID.
+
+{json_instruction}
 """
 
+# Structured outputs: the API guarantees responses match these schemas
+VALIDATION_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "argument_validation",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "is_valid": {"type": "boolean"},
+                "meets_causal_criterion": {"type": "boolean"},
+                "meets_mechanistic_criterion": {"type": "boolean"},
+                "meets_substantive_criterion": {"type": "boolean"},
+                "reasoning": {
+                    "type": "string",
+                    "description": "Brief explanation of why it's valid or invalid"
+                }
+            },
+            "required": [
+                "is_valid",
+                "meets_causal_criterion",
+                "meets_mechanistic_criterion",
+                "meets_substantive_criterion",
+                "reasoning"
+            ],
+            "additionalProperties": False
+        }
+    }
+}
+
+VALIDATION_BATCH_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "argument_validations",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "validations": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "id": {"type": "integer"},
+                            "is_valid": {"type": "boolean"},
+                            "reasoning": {"type": "string", "description": "Brief explanation"}
+                        },
+                        "required": ["id", "is_valid", "reasoning"],
+                        "additionalProperties": False
+                    }
+                }
+            },
+            "required": ["validations"],
+            "additionalProperties": False
+        }
+    }
+}
+
+# Local pre-filter (rejects obviously invalid texts without an LLM call)
+VALIDATION_MIN_ARGUMENT_LENGTH = 40  # Shorter texts are rejected as trivial
+# Unambiguous causal connectives: texts containing one always go to the LLM
+# ("car", "since" left out: car/temporal senses)
+CAUSAL_CONNECTIVE_KEYWORDS = [
+    "parce que", "puisque", "grâce à", "entraîne", "entraînent",
+    "provoque", "provoquent", "inhibe", "inhibent", "mécanisme",
+    "because", "therefore", "leads to", "causes", "inhibits", "mechanism"
+]
+
 # ============================================================================
 # LLM SETTINGS
 # ============================================================================
@@ -179,6 +395,11 @@ It is INVALID only if it's purely descriptive, narrative, or trivial.
 EXTRACTION_MODEL = "gpt-4o"           # Smart model for extraction
 CLASSIFICATION_MODEL = "gpt-4o-mini"  # Fast model for classification/validation
 TRANSLATION_MODEL = "gpt-4o-mini"     # Fast model for translation
+TRANSLATION_ESCALATION_MODEL = "gpt-4o"  # Retry model when a fast translation looks wrong
+
+# Translation/source length ratio outside this range triggers escalation
+TRANSLATION_MIN_LENGTH_RATIO = 0.3
+TRANSLATION_MAX_LENGTH_RATIO = 2.0
 
 # Temperature settings
 EXTRACTION_TEMP = 0.3       # Low temp for consistent extraction
@@ -188,6 +409,39 @@ VALIDATION_TEMP = 0.2       # Low for strict validation
 
 # Token limits
 EXTRACTION_MAX_TOKENS = 2000
+EXTRACTION_MAX_TOKENS_RETRY = 4000  # Retry cap when a response is cut at EXTRACTION_MAX_TOKENS
 CLASSIFICATION_MAX_TOKENS = 500
+CLASSIFICATION_BATCH_MAX_TOKENS = 4000
 TRANSLATION_MAX_TOKENS = 500
 VALIDATION_MAX_TOKENS = 500
+
+# Concurrency
+CLASSIFICATION_MAX_WORKERS = 16  # Concurrent role classification calls
+CLASSIFICATION_BATCH_MAX_ARGUMENTS = 60  # Above this, classify per argument
+EXTRACTION_MAX_WORKERS = 8       # Concurrent segment extraction calls
+TRANSLATION_MAX_WORKERS = 8      # Concurrent argument translation calls
+TRANSLATION_BATCH_SIZE = 15      # Arguments per batched translation call
+VALIDATION_MAX_WORKERS = 8       # Concurrent detailed validation calls
+VALIDATION_BATCH_SIZE = 12       # Texts per batched validation call
+
+# ============================================================================
+# BATCH API SETTINGS
+# ============================================================================
+
+BATCH_COMPLETION_WINDOW = "24h"       # Only window supported by the Batch API
+BATCH_POLL_INTERVAL_SECONDS = 10      # Delay between batch status checks
+BATCH_MAX_WAIT_SECONDS = 24 * 3600    # Give up (and cancel) after the completion window
+BATCH_API_MIN_ARGUMENTS = 200         # Below this, batch jobs cost more latency than they save
+
+# ============================================================================
+# CACHE SETTINGS
+# ============================================================================
+
+LLM_CACHE_DIR = "~/.cache/video-analyzer"  # Default root of the on-disk LLM result cache
+LLM_CACHE_PRUNE_INTERVAL = 256             # Writes between two size checks (first write checks too)
+LLM_CACHE_PRUNE_TARGET = 0.9               # Evict down to this fraction of the size cap
+EXTRACTION_CACHE_NAMESPACE = "extraction"  # Sub-directory for segment extractions
+EMBEDDING_CACHE_NAMESPACE = "embeddings"   # Sub-directory for OpenAI embedding vectors
+CHAT_CACHE_NAMESPACE = "chat"              # Sub-directory for chat completion contents
+CLASSIFICATION_CACHE_SIZE = 4096           # In-memory LRU entries for role classification
+VALIDATION_CACHE_SIZE = 4096               # In-memory LRU entries for argument validation
@@ -3,24 +3,43 @@ Argumentative hierarchy builder (Axis 3).
 
 Classifies arguments by role and builds parent-child relationships.
 """
-import json
 import logging
-from typing import List, Dict, Optional
+from bisect import bisect_right
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Dict, Optional, Tuple
 from enum import Enum
-from openai import OpenAI
+import numpy as np
+import orjson
 
 from ...config import get_settings
 from ...prompts import JSON_OUTPUT_STRICT
 from .constants_extraction import (
     ROLE_CLASSIFICATION_SYSTEM_PROMPT,
     ROLE_CLASSIFICATION_USER_PROMPT,
+    ROLE_BATCH_CLASSIFICATION_USER_PROMPT,
+    ROLE_CLASSIFICATION_RESPONSE_FORMAT,
+    ROLE_BATCH_CLASSIFICATION_RESPONSE_FORMAT,
     CLASSIFICATION_MODEL,
     CLASSIFICATION_TEMP,
-    CLASSIFICATION_MAX_TOKENS
+    CLASSIFICATION_MAX_TOKENS,
+    CLASSIFICATION_BATCH_MAX_TOKENS,
+    CLASSIFICATION_BATCH_MAX_ARGUMENTS,
+    CLASSIFICATION_MAX_WORKERS,
+    CLASSIFICATION_CACHE_SIZE,
+    PARENT_SIMILARITY_THRESHOLD
 )
+from ...services.openai_client import get_openai_client
+from ._embeddings import embed_texts
+from ._rate_limiter import throttled_chat_completion
 
 logger = logging.getLogger(__name__)
 
+# Joins argument texts for substring search; never appears in clean text
+_TEXT_SEPARATOR = "\x00"
+
 # ============================================================================
 # DATA STRUCTURES
 # ============================================================================
@@ -32,6 +51,15 @@ class ArgumentRole(str, Enum):
     EVIDENCE = "evidence"              # Specific data/study
     COUNTER_ARGUMENT = "counter_argument"  # Opposing view
 
+
+@dataclass(slots=True)
+class _TextIndex:
+    """Lowercased argument texts prepared once for parent text lookups."""
+    clean_texts: List[str]
+    exact: Dict[str, int]    # clean text → first argument index
+    haystack: str            # clean texts joined by _TEXT_SEPARATOR
+    starts: List[int]        # offset of each clean text in haystack
+
 # ============================================================================
 # HIERARCHY BUILDING
 # ============================================================================
@@ -42,7 +70,8 @@ def build_hierarchy(arguments: List[Dict]) -> List[Dict]:
 
     Process:
     1. Assign explicit IDs to each argument
-    2. Classify role for each argument
+    2. Classify role and parent of all arguments in one LLM call
+       (falls back to concurrent per-argument calls on mismatch)
     3. Identify parent-child relationships
     4. Add hierarchy metadata
 
@@ -66,46 +95,168 @@ def build_hierarchy(arguments: List[Dict]) -> List[Dict]:
     for i, arg in enumerate(arguments):
         arg["id"] = i
 
-    # Pre-compute embeddings for all arguments (for efficient parent matching)
-    arg_embeddings = _get_argument_embeddings(arguments)
+    batch_results = None
+    if len(arguments) <= CLASSIFICATION_BATCH_MAX_ARGUMENTS:
+        batch_results = classify_arguments_batch(arguments)
+
+    if batch_results is not None:
+        for arg, result in zip(arguments, batch_results):
+            arg.update(result)
+    else:
+        _classify_individually(arguments)
+
+    for arg in arguments:
+        logger.debug(f"[Hierarchy] Argument {arg['id']}: role={arg['role']}, parent_id={arg.get('parent_id')}")
+
+    # Log summary
+    role_counts = _count_roles(arguments)
+    logger.info(f"[Hierarchy] Roles: {role_counts}")
+
+    return arguments
 
-    # Classify all arguments
-    for i, arg in enumerate(arguments):
-        # Get context (other arguments)
-        context = _get_context_arguments(arguments, exclude_index=i)
 
-        # Classify role
-        role_data = classify_argument_role(
-            arg["argument"],
-            context
+def classify_arguments_batch(arguments: List[Dict]) -> Optional[List[Dict]]:
+    """
+    Classify role and parent of all arguments with a single LLM call.
+
+    Arguments are listed with their IDs so the model returns parent_id
+    directly, without fuzzy parent-text matching.
+
+    Args:
+        arguments: Arguments with id field
+
+    Returns:
+        One {role, parent_id, confidence} dict per argument (input order),
+        or None if unavailable or the response does not match the schema
+    """
+    settings = get_settings()
+
+    if not settings.openai_api_key:
+        return None
+
+    try:
+        client = get_openai_client()
+
+        arguments_text = "\n".join(f'[{arg["id"]}] {arg["argument"]}' for arg in arguments)
+
+        user_prompt = ROLE_BATCH_CLASSIFICATION_USER_PROMPT.format(
+            arguments=arguments_text,
+            json_instruction=JSON_OUTPUT_STRICT
         )
 
-        # Add to argument
+        messages = [
+            {"role": "system", "content": ROLE_CLASSIFICATION_SYSTEM_PROMPT},
+            {"role": "user", "content": user_prompt}
+        ]
+
+        response = throttled_chat_completion(client, {
+            "model": CLASSIFICATION_MODEL,
+            "messages": messages,
+            "temperature": CLASSIFICATION_TEMP,
+            "max_tokens": CLASSIFICATION_BATCH_MAX_TOKENS,
+            "response_format": ROLE_BATCH_CLASSIFICATION_RESPONSE_FORMAT
+        })
+
+        data = orjson.loads(response.choices[0].message.content)
+        return _parse_batch_classifications(data, arguments)
+
+    except Exception as e:
+        logger.error(f"[Hierarchy] Batch classification error: {e}")
+        return None
+
+
+def _parse_batch_classifications(data: Dict, arguments: List[Dict]) -> Optional[List[Dict]]:
+    """
+    Validate a batch classification response against the argument IDs.
+
+    Returns:
+        Per-argument results in input order, or None on schema mismatch
+    """
+    classifications = data.get("classifications") if isinstance(data, dict) else None
+    if not isinstance(classifications, list):
+        logger.warning("[Hierarchy] Batch classification missing 'classifications' list, falling back")
+        return None
+
+    valid_roles = {role.value for role in ArgumentRole}
+    valid_ids = {arg["id"] for arg in arguments}
+    by_id = {
+        item["id"]: item
+        for item in classifications
+        if isinstance(item, dict) and item.get("id") in valid_ids and item.get("role") in valid_roles
+    }
+
+    if len(by_id) != len(valid_ids):
+        logger.warning(f"[Hierarchy] Batch classification covered {len(by_id)}/{len(valid_ids)} arguments, falling back")
+        return None
+
+    results = []
+    for arg in arguments:
+        item = by_id[arg["id"]]
+        parent_id = item.get("parent_id")
+
+        if item["role"] == ArgumentRole.THESIS.value or parent_id not in valid_ids or parent_id == arg["id"]:
+            parent_id = None
+
+        results.append({
+            "role": item["role"],
+            "parent_id": parent_id,
+            "confidence": item.get("confidence", 0.5)
+        })
+
+    return results
+
+
+def _classify_individually(arguments: List[Dict]) -> None:
+    """
+    Classify arguments with one LLM call each and resolve parents by text.
+
+    Calls run concurrently; parents are matched by exact/substring text
+    first, then by embedding similarity in one batch.
+
+    Args:
+        arguments: Arguments with id field (updated in place)
+    """
+    texts = [arg["argument"] for arg in arguments]
+
+    # Classify all arguments concurrently (network-bound, one call per argument)
+    contexts = [
+        _get_context_arguments(texts, exclude_index=i)
+        for i in range(len(texts))
+    ]
+    with ThreadPoolExecutor(max_workers=min(CLASSIFICATION_MAX_WORKERS, len(arguments))) as executor:
+        role_results = list(executor.map(classify_argument_role, texts, contexts))
+
+    # Collect parent texts of non-thesis arguments
+    parent_texts: Dict[int, str] = {}
+    for i, (arg, role_data) in enumerate(zip(arguments, role_results)):
         arg["role"] = role_data.get("role", ArgumentRole.THESIS.value)
         arg["confidence"] = role_data.get("confidence", 0.5)
+        arg["parent_id"] = None
 
-        # Find parent if applicable
         if arg["role"] in [ArgumentRole.SUB_ARGUMENT.value, ArgumentRole.EVIDENCE.value, ArgumentRole.COUNTER_ARGUMENT.value]:
-            parent_text = role_data.get("parent_argument")
-            parent_index = _find_parent_id_with_embeddings(
-                parent_text, arguments, arg_embeddings
-            ) if parent_text else None
+            if role_data.get("parent_argument"):
+                parent_texts[i] = role_data["parent_argument"]
+
+    # Resolve parents: text matching first, then one batched embedding pass for the rest
+    text_index = _build_text_index(texts)
+
+    parent_indices = {
+        i: _find_parent_by_text(text, text_index)
+        for i, text in parent_texts.items()
+    }
+    unmatched = [i for i, index in parent_indices.items() if index is None]
+    if unmatched:
+        semantic_matches = _find_parents_with_embeddings(
+            [parent_texts[i] for i in unmatched], _get_argument_embeddings(arguments)
+        )
+        parent_indices.update(zip(unmatched, semantic_matches))
 
+    for i, parent_index in parent_indices.items():
+        if parent_index is not None:
             # Convert index to actual ID
-            if parent_index is not None:
-                arg["parent_id"] = arguments[parent_index]["id"]
-            else:
-                arg["parent_id"] = None
+            arguments[i]["parent_id"] = arguments[parent_index]["id"]
         else:
-            arg["parent_id"] = None
-
-        logger.debug(f"[Hierarchy] Argument {arg['id']}: role={arg['role']}, parent_id={arg.get('parent_id')}")
-
-    # Log summary
-    role_counts = _count_roles(arguments)
-    logger.info(f"[Hierarchy] Roles: {role_counts}")
-
-    return arguments
+            logger.warning(f"[Hierarchy] Could not find parent for: '{parent_texts[i][:60]}...'")
 
 
 def classify_argument_role(
@@ -121,6 +272,10 @@ def classify_argument_role(
 
     Returns:
         Dict with {role, parent_argument, confidence}
+
+    Note:
+        Successful results are memoized per (argument, context) for the
+        process lifetime, so re-runs and retries do not call the LLM again
     """
     settings = get_settings()
 
@@ -132,40 +287,8 @@ def classify_argument_role(
         }
 
     try:
-        client = OpenAI(api_key=settings.openai_api_key)
-
-        # Format context (limit to 10 arguments)
-        context_text = "\n".join([f"- {arg}" for arg in context[:10]])
-        if len(context) > 10:
-            context_text += f"\n... and {len(context) - 10} more"
-
-        # Build prompt
-        user_prompt = ROLE_CLASSIFICATION_USER_PROMPT.format(
-            argument=argument,
-            context=context_text,
-            json_instruction=JSON_OUTPUT_STRICT
-        )
-
-        # Call LLM
-        response = client.chat.completions.create(
-            model=CLASSIFICATION_MODEL,
-            messages=[
-                {"role": "system", "content": ROLE_CLASSIFICATION_SYSTEM_PROMPT},
-                {"role": "user", "content": user_prompt}
-            ],
-            temperature=CLASSIFICATION_TEMP,
-            max_tokens=CLASSIFICATION_MAX_TOKENS,
-            response_format={"type": "json_object"}
-        )
-
-        content = response.choices[0].message.content
-        data = json.loads(content)
-
-        return {
-            "role": data.get("role", ArgumentRole.THESIS.value),
-            "parent_argument": data.get("parent_argument"),
-            "confidence": data.get("confidence", 0.5)
-        }
+        # Cached as a JSON string so callers always get a fresh dict
+        return orjson.loads(_classify_cached(argument, tuple(context)))
 
     except Exception as e:
         logger.error(f"[Hierarchy] Classification error: {e}")
@@ -175,7 +298,55 @@ def classify_argument_role(
         }
 
 
-def _get_argument_embeddings(arguments: List[Dict]) -> Optional[List]:
+@lru_cache(maxsize=CLASSIFICATION_CACHE_SIZE)
+def _classify_cached(argument: str, context: Tuple[str, ...]) -> str:
+    """
+    Classify one argument with the LLM (memoized).
+
+    Raises on any error so failures are never cached.
+
+    Returns:
+        JSON string with {role, parent_argument, confidence}
+    """
+    client = get_openai_client()
+
+    # Format context (limit to 10 arguments)
+    context_text = "\n".join([f"- {arg}" for arg in context[:10]])
+    if len(context) > 10:
+        context_text += f"\n... and {len(context) - 10} more"
+
+    # Build prompt
+    user_prompt = ROLE_CLASSIFICATION_USER_PROMPT.format(
+        argument=argument,
+        context=context_text,
+        json_instruction=JSON_OUTPUT_STRICT
+    )
+
+    messages = [
+        {"role": "system", "content": ROLE_CLASSIFICATION_SYSTEM_PROMPT},
+        {"role": "user", "content": user_prompt}
+    ]
+
+    # Call LLM
+    response = throttled_chat_completion(client, {
+        "model": CLASSIFICATION_MODEL,
+        "messages": messages,
+        "temperature": CLASSIFICATION_TEMP,
+        "max_tokens": CLASSIFICATION_MAX_TOKENS,
+        "response_format": ROLE_CLASSIFICATION_RESPONSE_FORMAT
+    })
+
+    content = response.choices[0].message.content
+    data = orjson.loads(content)
+
+    return orjson.dumps({
+        "role": data.get("role", ArgumentRole.THESIS.value),
+        "parent_argument": data.get("parent_argument"),
+        "confidence": data.get("confidence", 0.5)
+    }).decode("utf-8")
+
+
+def _get_argument_embeddings(arguments: List[Dict]) -> Optional[np.ndarray]:
     """
     Get embeddings for all arguments in batch (efficient).
 
@@ -183,28 +354,16 @@ def _get_argument_embeddings(arguments: List[Dict]) -> Optional[List]:
         arguments: List of arguments
 
     Returns:
-        List of embeddings or None if failed
+        L2-normalized float32 matrix (one row per argument) or None if failed
     """
     try:
-        from openai import OpenAI
-        from ...config import get_settings
-
         settings = get_settings()
-        if not settings.openai_api_key:
+        if not settings.openai_api_key and not settings.local_embedding_model:
             return None
 
-        client = OpenAI(api_key=settings.openai_api_key)
-
-        # Batch all argument texts
-        texts = [arg["argument"] for arg in arguments]
-
-        # Get embeddings in one API call
-        response = client.embeddings.create(
-            input=texts,
-            model="text-embedding-3-small"
-        )
-
-        embeddings = [item.embedding for item in response.data]
+        # One contiguous (N, d) float32 matrix, normalized once so each
+        # lookup is a plain dot product
+        embeddings = embed_texts([arg["argument"] for arg in arguments], normalize=True)
         logger.info(f"[Hierarchy] Computed {len(embeddings)} embeddings for parent matching")
 
         return embeddings
@@ -214,115 +373,167 @@ def _get_argument_embeddings(arguments: List[Dict]) -> Optional[List]:
         return None
 
 
-def _find_parent_id_with_embeddings(
-    parent_text: Optional[str],
-    arguments: List[Dict],
-    arg_embeddings: Optional[List]
-) -> Optional[int]:
+def _build_text_index(texts: List[str]) -> _TextIndex:
     """
-    Find parent argument ID using pre-computed embeddings.
+    Lowercase argument texts once and index them for _find_parent_by_text.
+
+    Args:
+        texts: Argument texts
+
+    Returns:
+        _TextIndex over the texts
+    """
+    clean_texts = [text.lower().strip().replace(_TEXT_SEPARATOR, "") for text in texts]
+
+    exact: Dict[str, int] = {}
+    starts: List[int] = []
+    offset = 0
+    for i, text in enumerate(clean_texts):
+        exact.setdefault(text, i)
+        starts.append(offset)
+        offset += len(text) + len(_TEXT_SEPARATOR)
+
+    return _TextIndex(
+        clean_texts=clean_texts,
+        exact=exact,
+        haystack=_TEXT_SEPARATOR.join(clean_texts),
+        starts=starts
+    )
+
+
+def _find_parent_by_text(parent_text: str, text_index: _TextIndex) -> Optional[int]:
+    """
+    Find parent argument index by exact or substring text match.
+
+    Returns the first argument that contains the parent text or is
+    contained in it.
 
     Args:
         parent_text: Text of parent from LLM
-        arguments: All arguments
-        arg_embeddings: Pre-computed embeddings for arguments
+        text_index: Argument texts from _build_text_index (computed once)
 
     Returns:
         Parent argument index or None
     """
-    if not parent_text:
-        return None
+    parent_text_clean = parent_text.lower().strip().replace(_TEXT_SEPARATOR, "")
+
+    # Exact match (O(1))
+    index = text_index.exact.get(parent_text_clean)
+    if index is not None:
+        logger.debug("[Hierarchy] Found parent by exact match")
+        return index
+
+    # Parent inside an argument: one C-level scan of the joined texts
+    clean_texts = text_index.clean_texts
+    first_container = len(clean_texts)
+    position = text_index.haystack.find(parent_text_clean)
+    if position != -1:
+        first_container = bisect_right(text_index.starts, position) - 1
+
+    # Argument inside the parent: only earlier arguments can win
+    for i in range(first_container):
+        if clean_texts[i] in parent_text_clean:
+            logger.debug("[Hierarchy] Found parent by substring match")
+            return i
 
-    parent_text_clean = parent_text.lower().strip()
+    if first_container < len(clean_texts):
+        logger.debug("[Hierarchy] Found parent by substring match")
+        return first_container
 
-    # First try exact text matching (fast path)
-    for i, arg in enumerate(arguments):
-        arg_text_clean = arg["argument"].lower().strip()
+    return None
 
-        # Exact match
-        if parent_text_clean == arg_text_clean:
-            logger.debug(f"[Hierarchy] Found parent by exact match")
-            return i
 
-        # Bidirectional substring match
-        if parent_text_clean in arg_text_clean or arg_text_clean in parent_text_clean:
-            logger.debug(f"[Hierarchy] Found parent by substring match")
-            return i
+def _find_parents_with_embeddings(
+    parent_texts: List[str],
+    arg_embeddings: Optional[np.ndarray]
+) -> List[Optional[int]]:
+    """
+    Find parent argument indices by semantic similarity, in one batch.
 
-    # Try semantic similarity if embeddings available
-    if arg_embeddings:
-        try:
-            from openai import OpenAI
-            from ...config import get_settings
-            import numpy as np
+    Distinct parent texts are embedded in a single call (children often
+    name the same parent) and scored against every argument at once.
 
-            settings = get_settings()
-            if not settings.openai_api_key:
-                return None
+    Args:
+        parent_texts: Texts of parents from LLM
+        arg_embeddings: Pre-computed, L2-normalized embeddings for arguments
 
-            client = OpenAI(api_key=settings.openai_api_key)
+    Returns:
+        Parent argument index (or None) for each parent text
+    """
+    if arg_embeddings is None:
+        return [None] * len(parent_texts)
+
+    try:
+        unique_texts = list(dict.fromkeys(parent_texts))
+        matches = _match_parents(embed_texts(unique_texts, normalize=True), arg_embeddings)
+
+        logger.info(
+            "[Hierarchy] Found %d/%d parents by similarity",
+            sum(match is not None for match in matches), len(unique_texts)
+        )
 
-            # Get embedding for parent text
-            parent_response = client.embeddings.create(
-                input=parent_text,
-                model="text-embedding-3-small"
-            )
-            parent_embedding = parent_response.data[0].embedding
+        match_by_text = dict(zip(unique_texts, matches))
+        return [match_by_text[text] for text in parent_texts]
 
-            # Find most similar argument
-            best_match_idx = None
-            best_similarity = 0.7  # Minimum threshold
+    except Exception as e:
+        logger.warning(f"[Hierarchy] Embeddings matching failed: {e}")
+        return [None] * len(parent_texts)
 
-            for i, arg_embedding in enumerate(arg_embeddings):
-                similarity = np.dot(parent_embedding, arg_embedding) / (
-                    np.linalg.norm(parent_embedding) * np.linalg.norm(arg_embedding)
-                )
 
-                if similarity > best_similarity:
-                    best_similarity = similarity
-                    best_match_idx = i
+def _match_parents(
+    parent_embeddings: np.ndarray,
+    arg_embeddings: np.ndarray
+) -> List[Optional[int]]:
+    """
+    Match each parent embedding to its most similar argument.
 
-            if best_match_idx is not None:
-                logger.info(f"[Hierarchy] Found parent by similarity: {best_similarity:.2f} for '{parent_text[:50]}...'")
-                return best_match_idx
+    Args:
+        parent_embeddings: L2-normalized (P, d) matrix
+        arg_embeddings: L2-normalized (N, d) matrix
 
-        except Exception as e:
-            logger.warning(f"[Hierarchy] Embeddings matching failed: {e}")
+    Returns:
+        Best argument index per parent, or None below PARENT_SIMILARITY_THRESHOLD
+    """
+    # (parents x arguments) cosine similarities in one BLAS call,
+    # best argument per parent and threshold mask computed in C
+    similarities = parent_embeddings @ arg_embeddings.T
+    best_indices = similarities.argmax(axis=1)
+    best_similarities = similarities[np.arange(len(parent_embeddings)), best_indices]
+    accepted = best_similarities > PARENT_SIMILARITY_THRESHOLD
 
-    # No match found
-    logger.warning(f"[Hierarchy] Could not find parent for: '{parent_text[:60]}...'")
-    return None
+    return [
+        index if ok else None
+        for index, ok in zip(best_indices.tolist(), accepted.tolist())
+    ]
 
 
 def _get_context_arguments(
-    arguments: List[Dict],
+    texts: List[str],
     exclude_index: int,
     max_context: int = 10
 ) -> List[str]:
     """
     Get context arguments for classification.
 
+    Only the returned window is allocated, so building contexts for all
+    arguments stays linear in their number.
+
     Args:
-        arguments: All arguments
+        texts: All argument texts
         exclude_index: Index to exclude (current argument)
         max_context: Maximum context arguments
 
     Returns:
         List of argument strings
     """
-    context = []
-    for i, arg in enumerate(arguments):
-        if i != exclude_index:
-            context.append(arg["argument"])
+    if len(texts) - 1 <= max_context:
+        return texts[:exclude_index] + texts[exclude_index + 1:]
 
-    # Limit context size
-    if len(context) > max_context:
-        # Prioritize nearby arguments
-        start = max(0, exclude_index - max_context // 2)
-        end = min(len(arguments), exclude_index + max_context // 2)
-        context = [arguments[i]["argument"] for i in range(start, end) if i != exclude_index]
+    # Prioritize nearby arguments
+    start = max(0, exclude_index - max_context // 2)
+    end = min(len(texts), exclude_index + max_context // 2)
 
-    return context[:max_context]
+    return (texts[start:exclude_index] + texts[exclude_index + 1:end])[:max_context]
 
 
 
@@ -337,14 +548,10 @@ def _count_roles(arguments: List[Dict]) -> Dict[str, int]:
     Returns:
         Dict mapping role → count
     """
-    counts = {role.value: 0 for role in ArgumentRole}
-
-    for arg in arguments:
-        role = arg.get("role", ArgumentRole.THESIS.value)
-        if role in counts:
-            counts[role] += 1
+    counts = Counter(arg.get("role", ArgumentRole.THESIS.value) for arg in arguments)
 
-    return counts
+    # Unknown roles are dropped, every known role is present
+    return {role.value: counts[role.value] for role in ArgumentRole}
 
 
 def get_thesis_arguments(arguments: List[Dict]) -> List[Dict]:
@@ -360,9 +567,31 @@ def get_thesis_arguments(arguments: List[Dict]) -> List[Dict]:
     return [arg for arg in arguments if arg.get("role") == ArgumentRole.THESIS.value]
 
 
+def build_children_index(arguments: List[Dict]) -> Dict[Optional[int], List[Dict]]:
+    """
+    Index arguments by parent_id in one pass.
+
+    Use it when looking up children of many parents, instead of calling
+    get_argument_children (a linear scan) once per parent.
+
+    Args:
+        arguments: Arguments with parent_id field
+
+    Returns:
+        Dict mapping parent_id → child arguments (top-level arguments under None)
+    """
+    children_by_parent: Dict[Optional[int], List[Dict]] = defaultdict(list)
+
+    for arg in arguments:
+        children_by_parent[arg.get("parent_id")].append(arg)
+
+    return children_by_parent
+
+
 def get_argument_children(
     argument_id: int,
-    arguments: List[Dict]
+    arguments: List[Dict],
+    children_index: Optional[Dict[Optional[int], List[Dict]]] = None
 ) -> List[Dict]:
     """
     Get child arguments of a specific argument.
@@ -370,8 +599,12 @@ def get_argument_children(
     Args:
         argument_id: Parent argument index
         arguments: All arguments
+        children_index: Optional index from build_children_index (O(1) lookup)
 
     Returns:
         List of child arguments
     """
+    if children_index is not None:
+        return list(children_index.get(argument_id, ()))
+
     return [arg for arg in arguments if arg.get("parent_id") == argument_id]
@@ -4,9 +4,12 @@ Local argument extraction from segments (Axis 1 + 2).
 Extracts explanatory arguments from individual segments using
 strict causal/mechanistic criteria.
 """
-import json
 import logging
-from typing import List, Dict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Dict, Iterator, Optional
+
+import orjson
 from openai import OpenAI
 
 from ...config import get_settings
@@ -14,12 +17,20 @@ from ...prompts import JSON_OUTPUT_STRICT
 from .constants_extraction import (
     EXPLANATORY_ARGUMENT_DEFINITION,
     LOCAL_EXTRACTION_SYSTEM_PROMPT,
-    LOCAL_EXTRACTION_USER_PROMPT,
     EXTRACTION_MODEL,
     EXTRACTION_TEMP,
-    EXTRACTION_MAX_TOKENS
+    EXTRACTION_MAX_TOKENS,
+    EXTRACTION_MAX_TOKENS_RETRY,
+    EXTRACTION_PROMPT_VERSION,
+    EXTRACTION_CACHE_NAMESPACE,
+    JSON_RETRY_FEEDBACK_PROMPT,
+    EXTRACTION_MAX_WORKERS
 )
 from .segmentation import Segment
+from ...services.openai_client import get_openai_client
+from ._batch import run_chat_batch
+from ._cache import make_cache_key, cache_get, cache_put
+from ._rate_limiter import throttled_chat_completion
 
 logger = logging.getLogger(__name__)
 
@@ -50,62 +61,117 @@ def extract_from_segment(
         >>> args[0]["argument"]
         'Le café réduit les risques de cancer par...'
     """
+    return list(extract_from_segment_iter(segment, language))
+
+
+def extract_from_segment_iter(
+    segment: Segment,
+    language: str = "fr"
+) -> Iterator[Dict]:
+    """
+    Stream explanatory arguments from a single segment.
+
+    The completion is streamed and each argument is yielded as soon as its
+    JSON object closes, so callers can start processing the first arguments
+    while the model is still generating the rest.
+
+    Args:
+        segment: Segment object with text
+        language: Source language (default: French)
+
+    Yields:
+        Argument dicts with {argument, stance, segment_id, source_language}
+        Yields nothing if no valid arguments or on error
+    """
     settings = get_settings()
 
     if not settings.openai_api_key:
         logger.error("[Local Extractor] No OpenAI API key configured")
-        return []
+        return
 
     if not segment.text or len(segment.text) < 50:
-        logger.debug(f"[Local Extractor] Segment {segment.segment_id} too short, skipping")
-        return []
+        logger.debug("[Local Extractor] Segment %s too short, skipping", segment.segment_id)
+        return
+
+    cached = _get_cached_arguments(segment, language)
+    if cached is not None:
+        logger.info("[Local Extractor] Segment %s: Cache hit (%d arguments)", segment.segment_id, len(cached))
+        yield from cached
+        return
 
-    logger.info(f"[Local Extractor] Extracting from segment {segment.segment_id} ({len(segment.text)} chars)")
+    logger.info("[Local Extractor] Extracting from segment %s (%d chars)", segment.segment_id, len(segment.text))
 
     try:
-        client = OpenAI(api_key=settings.openai_api_key)
-
-        # Build prompt with definition
-        user_prompt = LOCAL_EXTRACTION_USER_PROMPT.format(
-            definition=EXPLANATORY_ARGUMENT_DEFINITION,
-            segment=segment.text,
-            language=language,
-            json_instruction=JSON_OUTPUT_STRICT
-        )
-
-        # Call LLM
-        response = client.chat.completions.create(
-            model=EXTRACTION_MODEL,
-            messages=[
-                {"role": "system", "content": LOCAL_EXTRACTION_SYSTEM_PROMPT},
-                {"role": "user", "content": user_prompt}
-            ],
-            temperature=EXTRACTION_TEMP,
-            max_tokens=EXTRACTION_MAX_TOKENS,
-            response_format={"type": "json_object"}
-        )
-
-        content = response.choices[0].message.content
-
-        # Parse response
-        data = json.loads(content)
-        arguments = data.get("arguments", [])
-
-        # Add segment metadata
-        for arg in arguments:
-            arg["segment_id"] = segment.segment_id
-            arg["source_language"] = language
-
-        logger.info(f"[Local Extractor] Segment {segment.segment_id}: Found {len(arguments)} arguments")
-
-        return arguments
-
-    except json.JSONDecodeError as e:
-        logger.error(f"[Local Extractor] JSON parse error on segment {segment.segment_id}: {e}")
-        return []
+        client = get_openai_client()
+
+        # Call LLM (streamed)
+        body = _build_request_body(segment, language)
+        stream = throttled_chat_completion(client, {**body, "stream": True})
+
+        parser = _ArgumentStreamParser()
+        content_parts = []
+        arguments = []
+        finish_reason = None
+
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+
+            finish_reason = chunk.choices[0].finish_reason or finish_reason
+            delta = chunk.choices[0].delta.content
+            if not delta:
+                continue
+
+            content_parts.append(delta)
+
+            for arg in parser.feed(delta):
+                if _is_valid_argument(arg):
+                    arguments.append(_normalize_argument(arg, segment, language))
+                    yield arg
+
+        content = "".join(content_parts)
+        missing_arguments = []
+
+        if finish_reason == "length":
+            # Cut at EXTRACTION_MAX_TOKENS: the trailing arguments were lost
+            logger.warning(
+                "[Local Extractor] Segment %s: Response truncated at %d tokens, retrying with %d",
+                segment.segment_id, EXTRACTION_MAX_TOKENS, EXTRACTION_MAX_TOKENS_RETRY
+            )
+            missing_arguments = _complete_arguments(
+                client, {**body, "max_tokens": EXTRACTION_MAX_TOKENS_RETRY}, segment, language
+            )
+        else:
+            # Only cache complete, well-formed responses
+            try:
+                orjson.loads(content)
+            except orjson.JSONDecodeError as e:
+                # Re-prompt once with the parse error as feedback
+                logger.warning("[Local Extractor] Segment %s: Invalid JSON (%s), re-prompting", segment.segment_id, e)
+                missing_arguments = _complete_arguments(
+                    client,
+                    {**body, "messages": body["messages"] + [
+                        {"role": "assistant", "content": content},
+                        {"role": "user", "content": JSON_RETRY_FEEDBACK_PROMPT.format(error=e)}
+                    ]},
+                    segment,
+                    language
+                )
+
+        already_yielded = {arg["argument"] for arg in arguments}
+        for arg in missing_arguments:
+            if arg.get("argument") not in already_yielded:
+                arguments.append(arg)
+                yield arg
+
+        _put_cached_arguments(segment, language, arguments)
+
+        logger.info("[Local Extractor] Segment %s: Found %d arguments", segment.segment_id, len(arguments))
+
+    except orjson.JSONDecodeError as e:
+        logger.error("[Local Extractor] JSON parse error on segment %s: %s", segment.segment_id, e)
     except Exception as e:
-        logger.error(f"[Local Extractor] Error on segment {segment.segment_id}: {e}")
-        return []
+        logger.error("[Local Extractor] Error on segment %s: %s", segment.segment_id, e)
 
 
 def extract_from_all_segments(
@@ -115,26 +181,317 @@ def extract_from_all_segments(
     """
     Extract arguments from all segments.
 
+    Segments are extracted concurrently (up to EXTRACTION_MAX_WORKERS calls
+    in flight), so wall time is close to the slowest segments rather than
+    the sum of all of them.
+
     Args:
         segments: List of Segment objects
         language: Source language
 
     Returns:
-        List of argument lists (one per segment)
+        List of argument lists (one per segment, in segment order;
+        empty for segments that failed)
 
     Example:
         >>> all_args = extract_from_all_segments(segments, "fr")
         >>> total = sum(len(args) for args in all_args)
         >>> print(f"Total arguments: {total}")
     """
+    if not segments:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(EXTRACTION_MAX_WORKERS, len(segments))) as executor:
+        futures = [executor.submit(extract_from_segment, segment, language) for segment in segments]
+
     all_segment_arguments = []
+    for segment, future in zip(segments, futures):
+        try:
+            all_segment_arguments.append(future.result())
+        except Exception as e:
+            logger.error("[Local Extractor] Error on segment %s: %s", segment.segment_id, e)
+            all_segment_arguments.append([])
 
+    # Log summary
+    total_args = sum(len(args) for args in all_segment_arguments)
+    logger.info("[Local Extractor] Extracted %d arguments from %d segments", total_args, len(segments))
+
+    return all_segment_arguments
+
+
+def extract_from_all_segments_batch(
+    segments: List[Segment],
+    language: str = "fr"
+) -> List[List[Dict]]:
+    """
+    Extract arguments from all segments with a single OpenAI Batch API job.
+
+    Half the token cost of extract_from_all_segments and no per-segment
+    round-trip, but the batch completes asynchronously (minutes to hours):
+    use extract_from_all_segments when latency matters.
+
+    Args:
+        segments: List of Segment objects
+        language: Source language
+
+    Returns:
+        List of argument lists (one per segment, same order as segments)
+        Segments that failed or were skipped yield an empty list
+    """
+    settings = get_settings()
+
+    if not settings.openai_api_key:
+        logger.error("[Local Extractor] No OpenAI API key configured")
+        return [[] for _ in segments]
+
+    cached_arguments = {}
+    bodies = {}
     for segment in segments:
-        args = extract_from_segment(segment, language)
-        all_segment_arguments.append(args)
+        if not segment.text or len(segment.text) < 50:
+            continue
+
+        cached = _get_cached_arguments(segment, language)
+        if cached is not None:
+            cached_arguments[segment.segment_id] = cached
+        else:
+            bodies[str(segment.segment_id)] = _build_request_body(segment, language)
+
+    logger.info("[Local Extractor] %d segments cached, %d to submit", len(cached_arguments), len(bodies))
+
+    try:
+        client = get_openai_client()
+        contents = run_chat_batch(client, bodies)
+    except Exception as e:
+        logger.error("[Local Extractor] Batch extraction error: %s", e)
+        contents = {}
+
+    all_segment_arguments = []
+
+    for segment in segments:
+        if segment.segment_id in cached_arguments:
+            all_segment_arguments.append(cached_arguments[segment.segment_id])
+            continue
+
+        content = contents.get(str(segment.segment_id))
+        if content is None:
+            all_segment_arguments.append([])
+            continue
+
+        try:
+            arguments = _parse_arguments(content, segment, language)
+            _put_cached_arguments(segment, language, arguments)
+            all_segment_arguments.append(arguments)
+        except orjson.JSONDecodeError as e:
+            logger.error("[Local Extractor] JSON parse error on segment %s: %s", segment.segment_id, e)
+            all_segment_arguments.append([])
 
-    # Log summary
     total_args = sum(len(args) for args in all_segment_arguments)
-    logger.info(f"[Local Extractor] Extracted {total_args} arguments from {len(segments)} segments")
+    logger.info("[Local Extractor] Batch extracted %d arguments from %d segments", total_args, len(segments))
 
     return all_segment_arguments
+
+
+def _complete_arguments(client: OpenAI, body: Dict, segment: Segment, language: str) -> List[Dict]:
+    """
+    Run a non-streamed completion and parse its arguments.
+
+    Raises:
+        orjson.JSONDecodeError: If the response is still not valid JSON
+    """
+    response = throttled_chat_completion(client, body)
+    return _parse_arguments(response.choices[0].message.content, segment, language)
+
+
+def _build_request_body(segment: Segment, language: str) -> Dict:
+    """
+    Build the chat completion request body for one segment.
+
+    Shared by the synchronous and Batch API paths so both send identical prompts.
+
+    Args:
+        segment: Segment to extract from
+        language: Source language
+
+    Returns:
+        Keyword arguments for chat.completions.create
+    """
+    return {
+        "model": EXTRACTION_MODEL,
+        "messages": [
+            {"role": "system", "content": _system_prompt(language)},
+            {"role": "user", "content": segment.text}
+        ],
+        "temperature": EXTRACTION_TEMP,
+        "max_tokens": EXTRACTION_MAX_TOKENS,
+        "response_format": {"type": "json_object"}
+    }
+
+
+@lru_cache(maxsize=None)
+def _system_prompt(language: str) -> str:
+    """
+    Render the extraction system prompt once per language.
+
+    The segment is sent alone as the user message, so this prefix is
+    byte-identical across all segments and eligible for prompt caching.
+    """
+    return LOCAL_EXTRACTION_SYSTEM_PROMPT.format(
+        definition=EXPLANATORY_ARGUMENT_DEFINITION,
+        language=language,
+        json_instruction=JSON_OUTPUT_STRICT
+    )
+
+
+def _parse_arguments(content: str, segment: Segment, language: str) -> List[Dict]:
+    """
+    Parse LLM JSON content into arguments with segment metadata.
+
+    Args:
+        content: Raw JSON message content
+        segment: Source segment
+        language: Source language
+
+    Returns:
+        List of argument dicts (malformed items are skipped)
+
+    Raises:
+        orjson.JSONDecodeError: If content is not valid JSON
+    """
+    data = orjson.loads(content)
+
+    return [
+        _normalize_argument(arg, segment, language)
+        for arg in data.get("arguments", [])
+        if _is_valid_argument(arg)
+    ]
+
+
+def _is_valid_argument(arg: object) -> bool:
+    """Return True if an extracted item has the minimal argument shape."""
+    return isinstance(arg, dict) and isinstance(arg.get("argument"), str)
+
+
+def _normalize_argument(arg: Dict, segment: Segment, language: str) -> Dict:
+    """
+    Clean an extracted argument in place and attach segment metadata.
+
+    Strings are only re-allocated when they actually need stripping,
+    which is the uncommon case.
+
+    Returns:
+        The same dict, for use in comprehensions
+    """
+    text = arg["argument"]
+    if text != text.strip():
+        arg["argument"] = text.strip()
+
+    arg["segment_id"] = segment.segment_id
+    arg["source_language"] = language
+    return arg
+
+
+class _ArgumentStreamParser:
+    """
+    Incremental parser for streamed {"arguments": [{...}, ...]} responses.
+
+    Tracks string/escape state and bracket nesting across chunks, and
+    returns each object of the top-level array as soon as it closes.
+    """
+
+    # Container stack when positioned directly inside the arguments array
+    _ITEM_CONTAINER = ["{", "["]
+
+    def __init__(self) -> None:
+        self._stack: List[str] = []
+        self._in_string = False
+        self._escape = False
+        self._item: Optional[List[str]] = None
+
+    def feed(self, chunk: str) -> List[Dict]:
+        """
+        Consume a chunk of streamed JSON.
+
+        Args:
+            chunk: Next piece of the response content
+
+        Returns:
+            Argument dicts completed by this chunk (possibly empty)
+        """
+        completed = []
+
+        for char in chunk:
+            if self._item is not None:
+                self._item.append(char)
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                continue
+
+            if char == '"':
+                self._in_string = True
+            elif char in "{[":
+                if char == "{" and self._stack == self._ITEM_CONTAINER:
+                    self._item = [char]
+                self._stack.append(char)
+            elif char in "}]":
+                if self._stack:
+                    self._stack.pop()
+                if char == "}" and self._item is not None and self._stack == self._ITEM_CONTAINER:
+                    item = self._parse_item("".join(self._item))
+                    self._item = None
+                    if item is not None:
+                        completed.append(item)
+
+        return completed
+
+    @staticmethod
+    def _parse_item(text: str) -> Optional[Dict]:
+        """Decode one array item, ignoring anything that is not an object."""
+        try:
+            item = orjson.loads(text)
+        except orjson.JSONDecodeError:
+            return None
+        return item if isinstance(item, dict) else None
+
+
+def _segment_cache_key(segment: Segment, language: str) -> str:
+    """Cache key covering everything that determines a segment's extraction."""
+    return make_cache_key(EXTRACTION_MODEL, EXTRACTION_PROMPT_VERSION, language, segment.text)
+
+
+def _get_cached_arguments(segment: Segment, language: str) -> Optional[List[Dict]]:
+    """
+    Look up a previous extraction of the same segment text.
+
+    Cached entries are re-validated on recall and ignored if malformed.
+
+    Args:
+        segment: Segment to extract from
+        language: Source language
+
+    Returns:
+        List of argument dicts with fresh segment metadata, or None on miss
+    """
+    cached = cache_get(EXTRACTION_CACHE_NAMESPACE, _segment_cache_key(segment, language))
+
+    if not isinstance(cached, list):
+        return None
+    if not all(_is_valid_argument(arg) for arg in cached):
+        logger.warning("[Local Extractor] Ignoring malformed cache entry for segment %s", segment.segment_id)
+        return None
+
+    for arg in cached:
+        arg["segment_id"] = segment.segment_id
+        arg["source_language"] = language
+
+    return cached
+
+
+def _put_cached_arguments(segment: Segment, language: str, arguments: List[Dict]) -> None:
+    """Store a successful extraction for later runs."""
+    cache_put(EXTRACTION_CACHE_NAMESPACE, _segment_cache_key(segment, language), arguments)
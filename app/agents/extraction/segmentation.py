@@ -3,6 +3,7 @@ Transcript segmentation for pipeline-based extraction (Axis 1).
 
 Segments long transcripts into manageable chunks with context overlap.
 """
+import re
 from typing import List
 from dataclasses import dataclass
 
@@ -12,11 +13,15 @@ from .constants_extraction import (
     MIN_SEGMENT_LENGTH
 )
 
+# Paragraph breaks: a blank line (possibly holding only whitespace)
+_PARAGRAPH_SPLIT_RE = re.compile(r"\n\s*\n")
+_LINE_SPLIT_RE = re.compile(r"\n+")
+
 # ============================================================================
 # DATA STRUCTURES
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class Segment:
     """Represents a transcript segment."""
     text: str
@@ -66,41 +71,47 @@ def segment_transcript(transcript: str) -> List[Segment]:
     # Split by paragraph breaks
     paragraphs = _split_into_paragraphs(transcript)
 
-    current_segment_text = ""
+    # Paragraphs of the current segment, joined only when it is emitted;
+    # current_length tracks len("\n\n".join(current_paragraphs))
+    current_paragraphs: List[str] = []
+    current_length = 0
     current_start_pos = 0
 
     for para in paragraphs:
         # Check if adding this paragraph exceeds limit
-        if len(current_segment_text) + len(para) > MAX_SEGMENT_LENGTH:
-            if current_segment_text:  # Save current segment
+        if current_length + len(para) > MAX_SEGMENT_LENGTH:
+            if current_length:  # Save current segment
+                segment_text = "\n\n".join(current_paragraphs)
                 segments.append(Segment(
-                    text=current_segment_text.strip(),
+                    text=segment_text.strip(),
                     start_pos=current_start_pos,
-                    end_pos=current_start_pos + len(current_segment_text),
+                    end_pos=current_start_pos + current_length,
                     segment_id=segment_id
                 ))
                 segment_id += 1
 
                 # Start new segment with overlap
-                overlap_text = _get_overlap_text(current_segment_text, SEGMENT_OVERLAP)
-                current_segment_text = overlap_text + "\n\n" + para
-                current_start_pos += len(current_segment_text) - SEGMENT_OVERLAP - len(para)
+                overlap_text = _get_overlap_text(segment_text, SEGMENT_OVERLAP)
+                current_paragraphs = [overlap_text, para]
+                current_length = len(overlap_text) + 2 + len(para)
+                current_start_pos += current_length - SEGMENT_OVERLAP - len(para)
             else:
                 # Single paragraph too long, force split
-                current_segment_text = para
+                current_paragraphs = [para]
+                current_length = len(para)
         else:
             # Add paragraph to current segment
-            if current_segment_text:
-                current_segment_text += "\n\n" + para
-            else:
-                current_segment_text = para
+            if current_length:
+                current_length += 2
+            current_paragraphs.append(para)
+            current_length += len(para)
 
     # Add final segment
-    if current_segment_text and len(current_segment_text) >= MIN_SEGMENT_LENGTH:
+    if current_length and current_length >= MIN_SEGMENT_LENGTH:
         segments.append(Segment(
-            text=current_segment_text.strip(),
+            text="\n\n".join(current_paragraphs).strip(),
             start_pos=current_start_pos,
-            end_pos=current_start_pos + len(current_segment_text),
+            end_pos=current_start_pos + current_length,
             segment_id=segment_id
         ))
 
@@ -126,12 +137,12 @@ def _split_into_paragraphs(text: str) -> List[str]:
     Returns:
         List of paragraph strings
     """
-    # Split by double newlines (paragraph breaks)
-    paragraphs = [p.strip() for p in text.split('\n\n') if p.strip()]
+    # Split by blank lines (paragraph breaks), stripping each piece once
+    paragraphs = [p for p in (s.strip() for s in _PARAGRAPH_SPLIT_RE.split(text)) if p]
 
     # If no paragraph breaks, split by single newlines
     if len(paragraphs) <= 1:
-        paragraphs = [p.strip() for p in text.split('\n') if p.strip()]
+        paragraphs = [p for p in (s.strip() for s in _LINE_SPLIT_RE.split(text)) if p]
 
     # If still no splits, return whole text
     if not paragraphs:
@@ -4,23 +4,40 @@ Argument translation (Axis 4).
 Translates validated arguments from source language to target language
 while preserving causal/mechanistic meaning.
 """
-import json
 import logging
-from typing import List, Dict
-from openai import OpenAI
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional
+
+import orjson
 
 from ...config import get_settings
 from ...prompts import JSON_OUTPUT_STRICT
 from .constants_extraction import (
     TRANSLATION_SYSTEM_PROMPT,
     TRANSLATION_USER_PROMPT,
+    TRANSLATION_BATCH_USER_PROMPT,
+    TRANSLATION_RESPONSE_FORMAT,
+    TRANSLATION_BATCH_RESPONSE_FORMAT,
     TRANSLATION_MODEL,
+    TRANSLATION_ESCALATION_MODEL,
+    TRANSLATION_MIN_LENGTH_RATIO,
+    TRANSLATION_MAX_LENGTH_RATIO,
     TRANSLATION_TEMP,
-    TRANSLATION_MAX_TOKENS
+    TRANSLATION_MAX_TOKENS,
+    TRANSLATION_MAX_WORKERS,
+    TRANSLATION_BATCH_SIZE
 )
+from ._batch import run_chat_batch
+from ._cache import cached_chat_completion
+from ...services.openai_client import get_openai_client
+from ._rate_limiter import throttled_chat_completion
 
 logger = logging.getLogger(__name__)
 
+# Static instructions substituted once; only per-call fields are formatted
+_TRANSLATION_TEMPLATE = TRANSLATION_USER_PROMPT.replace("{json_instruction}", JSON_OUTPUT_STRICT)
+_TRANSLATION_BATCH_TEMPLATE = TRANSLATION_BATCH_USER_PROMPT.replace("{json_instruction}", JSON_OUTPUT_STRICT)
+
 # ============================================================================
 # TRANSLATION LOGIC
 # ============================================================================
@@ -33,7 +50,9 @@ def translate_arguments(
     """
     Translate all arguments to target language.
 
-    Each argument translated separately to preserve meaning.
+    Delegates to batch_translate_arguments: TRANSLATION_BATCH_SIZE
+    arguments per LLM call, with missing or suspicious translations
+    redone individually.
 
     Args:
         arguments: List of arguments in source language
@@ -53,22 +72,11 @@ def translate_arguments(
 
     logger.info(f"[Translator] Translating {len(arguments)} arguments from {source_language} to {target_language}")
 
-    for i, arg in enumerate(arguments):
-        translation = translate_single_argument(
-            arg["argument"],
-            target_language=target_language,
-            source_language=source_language
-        )
-
-        # Add translation field
-        arg[f"argument_{target_language}"] = translation
-
-        if (i + 1) % 10 == 0:
-            logger.info(f"[Translator] Translated {i + 1}/{len(arguments)}")
-
-    logger.info(f"[Translator] Completed translation of {len(arguments)} arguments")
-
-    return arguments
+    return batch_translate_arguments(
+        arguments,
+        target_language=target_language,
+        source_language=source_language
+    )
 
 
 def translate_single_argument(
@@ -79,6 +87,10 @@ def translate_single_argument(
     """
     Translate a single argument.
 
+    Uses the fast TRANSLATION_MODEL; a translation whose length is far off
+    the source (truncated or padded) is redone with
+    TRANSLATION_ESCALATION_MODEL.
+
     Args:
         argument: Argument text in source language
         target_language: Target language code
@@ -102,33 +114,29 @@ def translate_single_argument(
         return argument  # Return original on error
 
     try:
-        client = OpenAI(api_key=settings.openai_api_key)
+        client = get_openai_client()
 
-        # Build prompt
-        user_prompt = TRANSLATION_USER_PROMPT.format(
-            argument=argument,
-            source_language=source_language,
-            target_language=target_language,
-            json_instruction=JSON_OUTPUT_STRICT
+        # Call LLM (identical requests are served from the disk cache;
+        # backs off on 429/5xx so concurrent calls do not fail together)
+        content = cached_chat_completion(
+            client,
+            _build_translation_body(argument, target_language, source_language)
         )
-
-        # Call LLM
-        response = client.chat.completions.create(
-            model=TRANSLATION_MODEL,
-            messages=[
-                {"role": "system", "content": TRANSLATION_SYSTEM_PROMPT},
-                {"role": "user", "content": user_prompt}
-            ],
-            temperature=TRANSLATION_TEMP,
-            max_tokens=TRANSLATION_MAX_TOKENS,
-            response_format={"type": "json_object"}
-        )
-
-        content = response.choices[0].message.content
-        data = json.loads(content)
+        data = orjson.loads(content)
 
         translation = data.get("translation", argument)
 
+        if _needs_escalation(argument, translation):
+            logger.info(f"[Translator] Suspicious translation length, retrying with {TRANSLATION_ESCALATION_MODEL}")
+            content = cached_chat_completion(
+                client,
+                _build_translation_body(
+                    argument, target_language, source_language,
+                    model=TRANSLATION_ESCALATION_MODEL
+                )
+            )
+            translation = orjson.loads(content).get("translation", translation)
+
         return translation
 
     except Exception as e:
@@ -137,16 +145,112 @@ def translate_single_argument(
         return argument
 
 
+def translate_arguments_batch_api(
+    arguments: List[Dict],
+    target_language: str = "en",
+    source_language: str = "fr"
+) -> List[Dict]:
+    """
+    Translate all arguments with a single OpenAI Batch API job.
+
+    Half the token cost of translate_arguments and no per-argument
+    round-trip, but the batch completes asynchronously (minutes to hours).
+    Arguments the batch did not translate go through translate_single_argument.
+
+    Args:
+        arguments: List of arguments in source language
+        target_language: Target language code (default: "en")
+        source_language: Source language code (default: "fr")
+
+    Returns:
+        List of arguments with translation added
+    """
+    if not arguments:
+        return []
+
+    if not get_settings().openai_api_key:
+        return translate_arguments(arguments, target_language, source_language)
+
+    bodies = {
+        str(i): _build_translation_body(arg["argument"], target_language, source_language)
+        for i, arg in enumerate(arguments)
+    }
+
+    try:
+        contents = run_chat_batch(get_openai_client(), bodies)
+    except Exception as e:
+        logger.error(f"[Translator] Batch API translation error: {e}")
+        contents = {}
+
+    for i, arg in enumerate(arguments):
+        translation = None
+        content = contents.get(str(i))
+        if content is not None:
+            try:
+                translation = orjson.loads(content).get("translation")
+            except (orjson.JSONDecodeError, AttributeError) as e:
+                logger.warning(f"[Translator] Unparseable batch translation {i}: {e}")
+
+        if not translation:
+            translation = translate_single_argument(
+                arg["argument"],
+                target_language=target_language,
+                source_language=source_language
+            )
+        arg[f"argument_{target_language}"] = translation
+
+    logger.info(f"[Translator] Batch API translated {len(contents)}/{len(arguments)} arguments")
+
+    return arguments
+
+
+def _needs_escalation(argument: str, translation: str) -> bool:
+    """Return True if the translation length is anomalous for the source."""
+    if not argument:
+        return False
+    ratio = len(translation) / len(argument)
+    return not TRANSLATION_MIN_LENGTH_RATIO <= ratio <= TRANSLATION_MAX_LENGTH_RATIO
+
+
+def _build_translation_body(
+    argument: str,
+    target_language: str,
+    source_language: str,
+    model: str = TRANSLATION_MODEL
+) -> Dict:
+    """Build the chat completion request body for one argument."""
+    user_prompt = _TRANSLATION_TEMPLATE.format(
+        argument=argument,
+        source_language=source_language,
+        target_language=target_language
+    )
+
+    return {
+        "model": model,
+        "messages": [
+            {"role": "system", "content": TRANSLATION_SYSTEM_PROMPT},
+            {"role": "user", "content": user_prompt}
+        ],
+        "temperature": TRANSLATION_TEMP,
+        "max_tokens": TRANSLATION_MAX_TOKENS,
+        "response_format": TRANSLATION_RESPONSE_FORMAT
+    }
+
+
 def batch_translate_arguments(
     arguments: List[Dict],
-    batch_size: int = 5,
+    batch_size: int = TRANSLATION_BATCH_SIZE,
     target_language: str = "en",
     source_language: str = "fr"
 ) -> List[Dict]:
     """
     Translate arguments in batches for efficiency.
 
-    Optional optimization for large argument sets.
+    Packs batch_size arguments into one LLM call, so the instructions are
+    sent once per batch instead of once per argument. Batches run
+    concurrently. Arguments missing from a batch response, or whose
+    translation length is anomalous, go through translate_single_argument
+    (which escalates to TRANSLATION_ESCALATION_MODEL if needed).
 
     Args:
         arguments: List of arguments
@@ -156,11 +260,108 @@ def batch_translate_arguments(
 
     Returns:
         List of arguments with translations
+    """
+    if not arguments:
+        return []
+
+    settings = get_settings()
+    if not settings.openai_api_key:
+        logger.error("[Translator] No OpenAI API key configured")
+        for arg in arguments:
+            arg[f"argument_{target_language}"] = arg["argument"]
+        return arguments
+
+    batches = [arguments[i:i + batch_size] for i in range(0, len(arguments), batch_size)]
+    logger.info(f"[Translator] Translating {len(arguments)} arguments in {len(batches)} batches")
+
+    with ThreadPoolExecutor(max_workers=min(TRANSLATION_MAX_WORKERS, len(batches))) as executor:
+        results = list(executor.map(
+            lambda batch: _translate_batch(
+                [arg["argument"] for arg in batch], target_language, source_language
+            ),
+            batches
+        ))
+
+    for batch, translations in zip(batches, results):
+        for arg, translation in zip(batch, translations):
+            if translation is None or _needs_escalation(arg["argument"], translation):
+                translation = translate_single_argument(
+                    arg["argument"],
+                    target_language=target_language,
+                    source_language=source_language
+                )
+            arg[f"argument_{target_language}"] = translation
 
-    Note:
-        This is an optimization - currently just calls translate_arguments
-        Could be enhanced to batch multiple arguments in single LLM call
+    logger.info(f"[Translator] Completed translation of {len(arguments)} arguments")
+
+    return arguments
+
+
+def _translate_batch(
+    texts: List[str],
+    target_language: str,
+    source_language: str
+) -> List[Optional[str]]:
+    """
+    Translate several texts with one LLM call.
+
+    Returns:
+        Translation per text (input order), None where the response has no
+        usable entry (all None if the call fails)
     """
-    # For now, use standard translation
-    # TODO: Implement true batching if needed for performance
-    return translate_arguments(arguments, target_language, source_language)
+    try:
+        client = get_openai_client()
+
+        items = orjson.dumps(
+            [{"id": i, "text": text} for i, text in enumerate(texts)]
+        ).decode()
+        user_prompt = _TRANSLATION_BATCH_TEMPLATE.format(
+            items=items,
+            source_language=source_language,
+            target_language=target_language
+        )
+
+        messages = [
+            {"role": "system", "content": TRANSLATION_SYSTEM_PROMPT},
+            {"role": "user", "content": user_prompt}
+        ]
+        max_tokens = TRANSLATION_MAX_TOKENS * len(texts)
+
+        response = throttled_chat_completion(client, {
+            "model": TRANSLATION_MODEL,
+            "messages": messages,
+            "temperature": TRANSLATION_TEMP,
+            "max_tokens": max_tokens,
+            "response_format": TRANSLATION_BATCH_RESPONSE_FORMAT
+        })
+
+        data = orjson.loads(response.choices[0].message.content)
+        return _parse_batch_translations(data, len(texts))
+
+    except Exception as e:
+        logger.error(f"[Translator] Batch translation error: {e}")
+        return [None] * len(texts)
+
+
+def _parse_batch_translations(data: Dict, count: int) -> List[Optional[str]]:
+    """Map a batch response back to input positions by id."""
+    translations: List[Optional[str]] = [None] * count
+
+    items = data.get("translations") if isinstance(data, dict) else None
+    if not isinstance(items, list):
+        logger.warning("[Translator] Batch response missing 'translations' list")
+        return translations
+
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        index = item.get("id")
+        translation = item.get("translation")
+        if isinstance(index, int) and 0 <= index < count and isinstance(translation, str) and translation.strip():
+            translations[index] = translation
+
+    missing = translations.count(None)
+    if missing:
+        logger.warning(f"[Translator] Batch response missing {missing}/{count} translations")
+
+    return translations
@@ -8,10 +8,15 @@ from typing import List, Dict, Optional
 from dataclasses import dataclass, asdict
 from enum import Enum
 
+import orjson
+
 from ...logger import get_logger
+from .hierarchy import build_children_index
 
 logger = get_logger(__name__)
 
+_JSONL_WRITE_BUFFER_SIZE = 1 << 20  # Bytes buffered before each disk write
+
 # ============================================================================
 # DATA STRUCTURES
 # ============================================================================
@@ -24,7 +29,7 @@ class NodeType(str, Enum):
     COUNTER_ARGUMENT = "counter_argument"
 
 
-@dataclass
+@dataclass(slots=True)
 class EvidenceNode:
     """Leaf node - specific evidence/data."""
     argument: str
@@ -35,7 +40,7 @@ class EvidenceNode:
     source_language: str
 
 
-@dataclass
+@dataclass(slots=True)
 class SubArgumentNode:
     """Middle node - supporting argument."""
     argument: str
@@ -45,7 +50,7 @@ class SubArgumentNode:
     evidence: List[EvidenceNode]
 
 
-@dataclass
+@dataclass(slots=True)
 class ThesisNode:
     """Root node - main thesis."""
     argument: str
@@ -56,7 +61,7 @@ class ThesisNode:
     counter_arguments: List[SubArgumentNode]
 
 
-@dataclass
+@dataclass(slots=True)
 class ReasoningChain:
     """Complete reasoning chain from thesis to evidence."""
     thesis: ThesisNode
@@ -64,7 +69,7 @@ class ReasoningChain:
     total_arguments: int  # Total nodes in this chain
 
 
-@dataclass
+@dataclass(slots=True)
 class ArgumentStructure:
     """Collection of all reasoning chains with hierarchical structure."""
     reasoning_chains: List[ReasoningChain]
@@ -106,6 +111,9 @@ def build_reasoning_trees(flat_arguments: List[Dict]) -> ArgumentStructure:
     # Index arguments by their explicit ID for quick lookup
     arg_by_id = {arg["id"]: arg for arg in flat_arguments}
 
+    # Index children by parent ID once (O(1) child lookups while building)
+    children_by_parent = build_children_index(list(arg_by_id.values()))
+
     # Find all thesis arguments (roots)
     thesis_args = [
         arg for arg in flat_arguments
@@ -122,41 +130,35 @@ def build_reasoning_trees(flat_arguments: List[Dict]) -> ArgumentStructure:
         chain = _build_single_chain(
             thesis_arg["id"],
             thesis_arg,
-            arg_by_id,
+            children_by_parent,
             processed_ids,
             chain_id
         )
         if chain:
             chains.append(chain)
 
-    # Find orphaned arguments (not in any tree)
-    orphan_args = [
-        arg for arg in flat_arguments
-        if arg["id"] not in processed_ids
-    ]
+    # Find orphaned arguments (not in any tree); every tree member is an
+    # indexed argument, so equal counts mean there is nothing to scan for
+    orphan_args = []
+    if len(processed_ids) < len(arg_by_id):
+        orphan_args = [
+            arg for arg_id, arg in arg_by_id.items()
+            if arg_id not in processed_ids
+        ]
 
     if orphan_args:
         logger.warning(f"[TreeBuilder] Found {len(orphan_args)} orphan arguments - converting to standalone chains")
 
-        # Convert orphans to standalone thesis arguments (independent claims)
-        for orphan_arg in orphan_args:
-            # Create a standalone reasoning chain (thesis with no sub-arguments)
-            orphan_chain = ReasoningChain(
-                thesis=ThesisNode(
-                    argument=orphan_arg.get("argument", ""),
-                    argument_en=orphan_arg.get("argument_en", ""),
-                    stance=orphan_arg.get("stance", "affirmatif"),
-                    confidence=orphan_arg.get("confidence", 1.0),
-                    sub_arguments=[],
-                    counter_arguments=[]
-                ),
-                chain_id=len(chains),  # Sequential chain numbering
-                total_arguments=1
-            )
-            chains.append(orphan_chain)
-            processed_ids.add(orphan_arg["id"])
+        # Convert orphans to standalone thesis arguments (independent claims),
+        # numbered sequentially after the real chains
+        chains.extend(
+            _build_orphan_chain(orphan_arg, chain_id)
+            for chain_id, orphan_arg in enumerate(orphan_args, start=len(chains))
+        )
 
-            logger.debug(f"[TreeBuilder] Converted orphan to chain: {orphan_arg.get('argument_en', '')[:60]}...")
+        if logger.isEnabledFor(logging.DEBUG):
+            for orphan_arg in orphan_args:
+                logger.debug(f"[TreeBuilder] Converted orphan to chain: {orphan_arg.get('argument_en', '')[:60]}...")
 
     structure = ArgumentStructure(
         reasoning_chains=chains,
@@ -170,10 +172,26 @@ def build_reasoning_trees(flat_arguments: List[Dict]) -> ArgumentStructure:
     return structure
 
 
+def _build_orphan_chain(orphan_arg: Dict, chain_id: int) -> ReasoningChain:
+    """Create a standalone reasoning chain (thesis with no sub-arguments)."""
+    return ReasoningChain(
+        thesis=ThesisNode(
+            argument=orphan_arg.get("argument", ""),
+            argument_en=orphan_arg.get("argument_en", ""),
+            stance=orphan_arg.get("stance", "affirmatif"),
+            confidence=orphan_arg.get("confidence", 1.0),
+            sub_arguments=[],
+            counter_arguments=[]
+        ),
+        chain_id=chain_id,
+        total_arguments=1
+    )
+
+
 def _build_single_chain(
     thesis_id: int,
     thesis_arg: Dict,
-    arg_by_id: Dict[int, Dict],
+    children_by_parent: Dict[Optional[int], List[Dict]],
     processed_ids: set,
     chain_id: int
 ) -> Optional[ReasoningChain]:
@@ -183,7 +201,7 @@ def _build_single_chain(
     Args:
         thesis_id: Thesis argument ID (explicit id field)
         thesis_arg: Thesis argument dict
-        arg_by_id: All arguments indexed by their id field
+        children_by_parent: Arguments indexed by their parent_id field
         processed_ids: Set to track processed argument IDs
         chain_id: Chain identifier
 
@@ -194,10 +212,7 @@ def _build_single_chain(
     processed_ids.add(thesis_id)
 
     # Find children of thesis (by matching parent_id to thesis id)
-    children = [
-        arg for arg in arg_by_id.values()
-        if arg.get("parent_id") == thesis_id
-    ]
+    children = children_by_parent.get(thesis_id, [])
 
     # Separate supporting vs counter arguments
     sub_args = []
@@ -209,12 +224,12 @@ def _build_single_chain(
 
         if child_arg.get("role") == "counter_argument":
             counter_node = _build_sub_argument_node(
-                child_id, child_arg, arg_by_id, processed_ids
+                child_id, child_arg, children_by_parent, processed_ids
             )
             counter_args.append(counter_node)
         else:
             sub_node = _build_sub_argument_node(
-                child_id, child_arg, arg_by_id, processed_ids
+                child_id, child_arg, children_by_parent, processed_ids
             )
             sub_args.append(sub_node)
 
@@ -249,7 +264,7 @@ def _build_single_chain(
 def _build_sub_argument_node(
     sub_id: int,
     sub_arg: Dict,
-    arg_by_id: Dict[int, Dict],
+    children_by_parent: Dict[Optional[int], List[Dict]],
     processed_ids: set
 ) -> SubArgumentNode:
     """
@@ -258,32 +273,17 @@ def _build_sub_argument_node(
     Args:
         sub_id: Sub-argument ID (explicit id field)
         sub_arg: Sub-argument dict
-        arg_by_id: All arguments indexed by id
+        children_by_parent: Arguments indexed by parent_id
         processed_ids: Track processed IDs
 
     Returns:
         SubArgumentNode with evidence
     """
     # Find evidence children (by matching parent_id to sub_id)
-    evidence_args = [
-        arg for arg in arg_by_id.values()
-        if arg.get("parent_id") == sub_id
-    ]
+    evidence_args = children_by_parent.get(sub_id, [])
 
-    evidence_nodes = []
-    for ev_arg in evidence_args:
-        ev_id = ev_arg["id"]
-        processed_ids.add(ev_id)
-
-        ev_node = EvidenceNode(
-            argument=ev_arg.get("argument", ""),
-            argument_en=ev_arg.get("argument_en", ""),
-            stance=ev_arg.get("stance", "affirmatif"),
-            confidence=ev_arg.get("confidence", 1.0),
-            segment_id=ev_arg.get("segment_id", 0),
-            source_language=ev_arg.get("source_language", "")
-        )
-        evidence_nodes.append(ev_node)
+    processed_ids.update(ev_arg["id"] for ev_arg in evidence_args)
+    evidence_nodes = [_build_evidence_node(ev_arg) for ev_arg in evidence_args]
 
     sub_node = SubArgumentNode(
         argument=sub_arg.get("argument", ""),
@@ -296,6 +296,18 @@ def _build_sub_argument_node(
     return sub_node
 
 
+def _build_evidence_node(ev_arg: Dict) -> EvidenceNode:
+    """Build a leaf evidence node from an argument dict."""
+    return EvidenceNode(
+        argument=ev_arg.get("argument", ""),
+        argument_en=ev_arg.get("argument_en", ""),
+        stance=ev_arg.get("stance", "affirmatif"),
+        confidence=ev_arg.get("confidence", 1.0),
+        segment_id=ev_arg.get("segment_id", 0),
+        source_language=ev_arg.get("source_language", "")
+    )
+
+
 # ============================================================================
 # SERIALIZATION
 # ============================================================================
@@ -304,64 +316,53 @@ def structure_to_dict(structure: ArgumentStructure) -> Dict:
     """
     Convert ArgumentStructure to dictionary for JSON serialization.
 
+    Nodes are converted field by field with dataclasses.asdict; the
+    structure totals are grouped under "metadata".
+
     Args:
         structure: ArgumentStructure object
 
     Returns:
         Dict representation
     """
-    return {
-        "reasoning_chains": [
-            _chain_to_dict(chain) for chain in structure.reasoning_chains
-        ],
-        "orphan_arguments": structure.orphan_arguments,
-        "metadata": {
-            "total_chains": structure.total_chains,
-            "total_arguments": structure.total_arguments
-        }
+    structure_dict = asdict(structure)
+    structure_dict["metadata"] = {
+        "total_chains": structure_dict.pop("total_chains"),
+        "total_arguments": structure_dict.pop("total_arguments")
     }
 
+    return structure_dict
 
-def _chain_to_dict(chain: ReasoningChain) -> Dict:
-    """Convert ReasoningChain to dict."""
-    return {
-        "chain_id": chain.chain_id,
-        "total_arguments": chain.total_arguments,
-        "thesis": {
-            "argument": chain.thesis.argument,
-            "argument_en": chain.thesis.argument_en,
-            "stance": chain.thesis.stance,
-            "confidence": chain.thesis.confidence,
-            "sub_arguments": [
-                _sub_arg_to_dict(sub) for sub in chain.thesis.sub_arguments
-            ],
-            "counter_arguments": [
-                _sub_arg_to_dict(counter) for counter in chain.thesis.counter_arguments
-            ]
-        }
-    }
 
+def write_structure_jsonl(structure: ArgumentStructure, path: str) -> None:
+    """
+    Write ArgumentStructure to a JSON Lines file.
 
-def _sub_arg_to_dict(sub: SubArgumentNode) -> Dict:
-    """Convert SubArgumentNode to dict."""
-    return {
-        "argument": sub.argument,
-        "argument_en": sub.argument_en,
-        "stance": sub.stance,
-        "confidence": sub.confidence,
-        "evidence": [
-            {
-                "argument": ev.argument,
-                "argument_en": ev.argument_en,
-                "stance": ev.stance,
-                "confidence": ev.confidence,
-                "segment_id": ev.segment_id,
-                "source_language": ev.source_language
-            }
-            for ev in sub.evidence
-        ]
+    The first line holds "metadata" (as in structure_to_dict) and
+    "orphan_arguments", then each reasoning chain is one line. Chains are
+    serialized one at a time, so the whole document is never held in
+    memory, and readers can stream chains line by line.
+
+    Opt-in library API for offline exports: the workflow itself persists
+    structures to MongoDB via structure_to_dict and never calls this.
+
+    Args:
+        structure: ArgumentStructure object
+        path: Output file path
+    """
+    header = {
+        "metadata": {
+            "total_chains": structure.total_chains,
+            "total_arguments": structure.total_arguments
+        },
+        "orphan_arguments": structure.orphan_arguments
     }
 
+    with open(path, "wb", buffering=_JSONL_WRITE_BUFFER_SIZE) as f:
+        f.write(orjson.dumps(header, option=orjson.OPT_APPEND_NEWLINE))
+        for chain in structure.reasoning_chains:
+            f.write(orjson.dumps(asdict(chain), option=orjson.OPT_APPEND_NEWLINE))
+
 
 # ============================================================================
 # UTILITIES
@@ -384,6 +385,9 @@ def get_chain_by_id(structure: ArgumentStructure, chain_id: int) -> Optional[Rea
     """
     Get specific reasoning chain.
 
+    build_reasoning_trees numbers chains by position, so the chain is
+    looked up by index first; other structures fall back to a scan.
+
     Args:
         structure: ArgumentStructure
         chain_id: Chain identifier
@@ -391,7 +395,11 @@ def get_chain_by_id(structure: ArgumentStructure, chain_id: int) -> Optional[Rea
     Returns:
         ReasoningChain or None
     """
-    for chain in structure.reasoning_chains:
+    chains = structure.reasoning_chains
+    if 0 <= chain_id < len(chains) and chains[chain_id].chain_id == chain_id:
+        return chains[chain_id]
+
+    for chain in chains:
         if chain.chain_id == chain_id:
             return chain
     return None
@@ -4,10 +4,13 @@ Argument validation (Axis 4).
 Validates that extracted text meets explanatory argument criteria
 before translation.
 """
-import json
 import logging
-from typing import List, Dict
-from openai import OpenAI
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Dict, Optional
+
+import orjson
 
 from ...config import get_settings
 from ...prompts import JSON_OUTPUT_STRICT
@@ -15,13 +18,42 @@ from .constants_extraction import (
     EXPLANATORY_ARGUMENT_DEFINITION,
     VALIDATION_SYSTEM_PROMPT,
     VALIDATION_USER_PROMPT,
+    VALIDATION_BATCH_USER_PROMPT,
+    VALIDATION_RESPONSE_FORMAT,
+    VALIDATION_BATCH_RESPONSE_FORMAT,
     CLASSIFICATION_MODEL,
     VALIDATION_TEMP,
-    VALIDATION_MAX_TOKENS
+    VALIDATION_MAX_TOKENS,
+    VALIDATION_MIN_ARGUMENT_LENGTH,
+    VALIDATION_CACHE_SIZE,
+    VALIDATION_MAX_WORKERS,
+    VALIDATION_BATCH_SIZE,
+    CAUSAL_CONNECTIVE_KEYWORDS
 )
+from ._batch import run_chat_batch
+from ._cache import cached_chat_completion
+from ...services.openai_client import get_openai_client
+from ._rate_limiter import throttled_chat_completion
 
 logger = logging.getLogger(__name__)
 
+# Static definition and instructions substituted once; only the argument is formatted per call
+_VALIDATION_TEMPLATE = (
+    VALIDATION_USER_PROMPT
+    .replace("{definition}", EXPLANATORY_ARGUMENT_DEFINITION)
+    .replace("{json_instruction}", JSON_OUTPUT_STRICT)
+)
+_VALIDATION_BATCH_TEMPLATE = (
+    VALIDATION_BATCH_USER_PROMPT
+    .replace("{definition}", EXPLANATORY_ARGUMENT_DEFINITION)
+    .replace("{json_instruction}", JSON_OUTPUT_STRICT)
+)
+
+_CAUSAL_CONNECTIVE_RE = re.compile(
+    r"\b(" + "|".join(map(re.escape, CAUSAL_CONNECTIVE_KEYWORDS)) + r")\b",
+    re.IGNORECASE
+)
+
 # ============================================================================
 # VALIDATION LOGIC
 # ============================================================================
@@ -35,6 +67,10 @@ def validate_arguments(arguments: List[Dict]) -> List[Dict]:
     - Mechanistic explanation
     - Necessity for understanding
 
+    Delegates to batch_validate_arguments: texts too short to carry an
+    argument are rejected locally, the rest are validated
+    VALIDATION_BATCH_SIZE per LLM call. Input order is preserved.
+
     Args:
         arguments: List of arguments to validate
 
@@ -50,20 +86,7 @@ def validate_arguments(arguments: List[Dict]) -> List[Dict]:
 
     logger.info(f"[Validator] Validating {len(arguments)} arguments")
 
-    valid_arguments = []
-
-    for arg in arguments:
-        is_valid = validate_single_argument(arg["argument"])
-
-        if is_valid:
-            valid_arguments.append(arg)
-        else:
-            logger.debug(f"[Validator] Rejected: {arg['argument'][:50]}...")
-
-    rejected_count = len(arguments) - len(valid_arguments)
-    logger.info(f"[Validator] Kept {len(valid_arguments)}, rejected {rejected_count}")
-
-    return valid_arguments
+    return batch_validate_arguments(arguments)
 
 
 def validate_single_argument(argument: str) -> bool:
@@ -89,29 +112,8 @@ def validate_single_argument(argument: str) -> bool:
         return True  # Accept if can't validate
 
     try:
-        client = OpenAI(api_key=settings.openai_api_key)
-
-        # Build prompt
-        user_prompt = VALIDATION_USER_PROMPT.format(
-            definition=EXPLANATORY_ARGUMENT_DEFINITION,
-            argument=argument,
-            json_instruction=JSON_OUTPUT_STRICT
-        )
-
-        # Call LLM
-        response = client.chat.completions.create(
-            model=CLASSIFICATION_MODEL,  # Use fast model for validation
-            messages=[
-                {"role": "system", "content": VALIDATION_SYSTEM_PROMPT},
-                {"role": "user", "content": user_prompt}
-            ],
-            temperature=VALIDATION_TEMP,
-            max_tokens=VALIDATION_MAX_TOKENS,
-            response_format={"type": "json_object"}
-        )
-
-        content = response.choices[0].message.content
-        data = json.loads(content)
+        # Cached as a JSON string so callers always get a fresh dict
+        data = orjson.loads(_validate_cached(argument))
 
         is_valid = data.get("is_valid", False)
 
@@ -127,6 +129,233 @@ def validate_single_argument(argument: str) -> bool:
         return True
 
 
+def batch_validate_arguments(
+    arguments: List[Dict],
+    batch_size: int = VALIDATION_BATCH_SIZE
+) -> List[Dict]:
+    """
+    Validate arguments in batches for efficiency.
+
+    Packs batch_size texts into one LLM call, so the definition and
+    instructions are sent once per batch instead of once per argument.
+    Batches run concurrently. Texts missing from a batch response are
+    validated individually.
+
+    Args:
+        arguments: List of arguments to validate
+        batch_size: Number of texts per batch
+
+    Returns:
+        List of valid arguments only
+    """
+    if not arguments:
+        return []
+
+    if not get_settings().openai_api_key:
+        logger.warning("[Validator] No OpenAI key, accepting all arguments")
+        return arguments
+
+    verdicts = [_cheap_prefilter(arg["argument"]) for arg in arguments]
+    pending = [i for i, verdict in enumerate(verdicts) if verdict is None]
+    batches = [pending[i:i + batch_size] for i in range(0, len(pending), batch_size)]
+
+    if batches:
+        logger.info(f"[Validator] Validating {len(pending)} arguments in {len(batches)} batches")
+
+        with ThreadPoolExecutor(max_workers=min(VALIDATION_MAX_WORKERS, len(batches))) as executor:
+            results = list(executor.map(
+                lambda batch: _validate_batch([arguments[i]["argument"] for i in batch]),
+                batches
+            ))
+
+        for batch, batch_verdicts in zip(batches, results):
+            for i, verdict in zip(batch, batch_verdicts):
+                if verdict is None:
+                    verdict = validate_single_argument(arguments[i]["argument"])
+                verdicts[i] = verdict
+
+    valid_arguments = []
+
+    for arg, is_valid in zip(arguments, verdicts):
+        if is_valid:
+            valid_arguments.append(arg)
+        else:
+            logger.debug(f"[Validator] Rejected: {arg['argument'][:50]}...")
+
+    rejected_count = len(arguments) - len(valid_arguments)
+    logger.info(f"[Validator] Kept {len(valid_arguments)}, rejected {rejected_count}")
+
+    return valid_arguments
+
+
+def _validate_batch(texts: List[str]) -> List[Optional[bool]]:
+    """
+    Validate several texts with one LLM call.
+
+    Returns:
+        Verdict per text (input order), None where the response has no
+        usable entry (all None if the call fails)
+    """
+    try:
+        client = get_openai_client()
+
+        items = orjson.dumps(
+            [{"id": i, "text": text} for i, text in enumerate(texts)]
+        ).decode()
+        messages = [
+            {"role": "system", "content": VALIDATION_SYSTEM_PROMPT},
+            {"role": "user", "content": _VALIDATION_BATCH_TEMPLATE.format(items=items)}
+        ]
+        max_tokens = VALIDATION_MAX_TOKENS * len(texts)
+
+        response = throttled_chat_completion(client, {
+            "model": CLASSIFICATION_MODEL,
+            "messages": messages,
+            "temperature": VALIDATION_TEMP,
+            "max_tokens": max_tokens,
+            "response_format": VALIDATION_BATCH_RESPONSE_FORMAT
+        })
+
+        data = orjson.loads(response.choices[0].message.content)
+        return _parse_batch_validations(data, len(texts))
+
+    except Exception as e:
+        logger.error(f"[Validator] Batch validation error: {e}")
+        return [None] * len(texts)
+
+
+def _parse_batch_validations(data: Dict, count: int) -> List[Optional[bool]]:
+    """Map a batch response back to input positions by id."""
+    verdicts: List[Optional[bool]] = [None] * count
+
+    items = data.get("validations") if isinstance(data, dict) else None
+    if not isinstance(items, list):
+        logger.warning("[Validator] Batch response missing 'validations' list")
+        return verdicts
+
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        index = item.get("id")
+        is_valid = item.get("is_valid")
+        if isinstance(index, int) and 0 <= index < count and isinstance(is_valid, bool):
+            verdicts[index] = is_valid
+
+    missing = verdicts.count(None)
+    if missing:
+        logger.warning(f"[Validator] Batch response missing {missing}/{count} validations")
+
+    return verdicts
+
+
+def validate_arguments_batch_api(arguments: List[Dict]) -> List[Dict]:
+    """
+    Validate all arguments with a single OpenAI Batch API job.
+
+    Half the token cost of validate_arguments and no per-argument
+    round-trip, but the batch completes asynchronously (minutes to hours).
+    Arguments without a usable batch result are accepted (fail open, as
+    in validate_single_argument).
+
+    Args:
+        arguments: List of arguments to validate
+
+    Returns:
+        List of valid arguments only
+    """
+    if not arguments:
+        return []
+
+    if not get_settings().openai_api_key:
+        logger.warning("[Validator] No OpenAI key, accepting all arguments")
+        return arguments
+
+    prefiltered = [_cheap_prefilter(arg["argument"]) for arg in arguments]
+    bodies = {
+        str(i): _build_validation_body(arg["argument"])
+        for i, arg in enumerate(arguments)
+        if prefiltered[i] is None
+    }
+
+    contents = {}
+    if bodies:
+        try:
+            contents = run_chat_batch(get_openai_client(), bodies)
+        except Exception as e:
+            logger.error(f"[Validator] Batch API validation error: {e}")
+
+    valid_arguments = []
+    for i, arg in enumerate(arguments):
+        is_valid = True if prefiltered[i] is None else prefiltered[i]
+        content = contents.get(str(i))
+        if content is not None:
+            try:
+                is_valid = orjson.loads(content).get("is_valid", False)
+            except (orjson.JSONDecodeError, AttributeError) as e:
+                logger.warning(f"[Validator] Unparseable batch result {i}: {e}")
+
+        if is_valid:
+            valid_arguments.append(arg)
+        else:
+            logger.debug(f"[Validator] Rejected: {arg['argument'][:50]}...")
+
+    rejected_count = len(arguments) - len(valid_arguments)
+    logger.info(f"[Validator] Kept {len(valid_arguments)}, rejected {rejected_count}")
+
+    return valid_arguments
+
+
+@lru_cache(maxsize=VALIDATION_CACHE_SIZE)
+def _validate_cached(argument: str) -> str:
+    """
+    Validate one argument with the LLM (memoized).
+
+    Shared by validate_single_argument and validate_with_details, so an
+    argument checked by both costs one call. Raises on any error so
+    failures are never cached; across runs, identical requests are served
+    from the disk cache.
+
+    Returns:
+        JSON string with the validation details
+    """
+    return cached_chat_completion(get_openai_client(), _build_validation_body(argument))
+
+
+def _cheap_prefilter(argument: str) -> Optional[bool]:
+    """
+    Reject obviously invalid texts locally, without an LLM call.
+
+    A connective cannot establish the mechanistic and necessity criteria,
+    so nothing is accepted here; it only keeps a short but explicitly
+    causal text from being rejected on length.
+
+    Returns:
+        False for texts too short to carry an argument (unless they contain
+        an explicit causal connective), None otherwise (the LLM decides)
+    """
+    if _CAUSAL_CONNECTIVE_RE.search(argument):
+        return None
+    if len(argument.strip()) < VALIDATION_MIN_ARGUMENT_LENGTH:
+        return False
+    return None
+
+
+def _build_validation_body(argument: str) -> Dict:
+    """Build the chat completion request body for one argument."""
+    user_prompt = _VALIDATION_TEMPLATE.format(argument=argument)
+
+    return {
+        "model": CLASSIFICATION_MODEL,  # Use fast model for validation
+        "messages": [
+            {"role": "system", "content": VALIDATION_SYSTEM_PROMPT},
+            {"role": "user", "content": user_prompt}
+        ],
+        "temperature": VALIDATION_TEMP,
+        "max_tokens": VALIDATION_MAX_TOKENS,
+        "response_format": VALIDATION_RESPONSE_FORMAT
+    }
+
+
 def validate_with_details(argument: str) -> Dict:
     """
     Validate argument and return detailed criteria evaluation.
@@ -161,27 +390,7 @@ def validate_with_details(argument: str) -> Dict:
         }
 
     try:
-        client = OpenAI(api_key=settings.openai_api_key)
-
-        user_prompt = VALIDATION_USER_PROMPT.format(
-            definition=EXPLANATORY_ARGUMENT_DEFINITION,
-            argument=argument,
-            json_instruction=JSON_OUTPUT_STRICT
-        )
-
-        response = client.chat.completions.create(
-            model=CLASSIFICATION_MODEL,
-            messages=[
-                {"role": "system", "content": VALIDATION_SYSTEM_PROMPT},
-                {"role": "user", "content": user_prompt}
-            ],
-            temperature=VALIDATION_TEMP,
-            max_tokens=VALIDATION_MAX_TOKENS,
-            response_format={"type": "json_object"}
-        )
-
-        content = response.choices[0].message.content
-        return json.loads(content)
+        return orjson.loads(_validate_cached(argument))
 
     except Exception as e:
         logger.error(f"[Validator] Detailed validation error: {e}")
@@ -200,7 +409,8 @@ def filter_by_criteria(
     """
     Filter arguments by specific criteria.
 
-    More fine-grained control than simple validation.
+    More fine-grained control than simple validation. Validation calls
+    run concurrently (network-bound); input order is preserved.
 
     Args:
         arguments: List of arguments
@@ -215,11 +425,18 @@ def filter_by_criteria(
         >>> # Only arguments with mechanisms
         >>> mechanistic = filter_by_criteria(args, require_mechanistic=True)
     """
-    filtered = []
+    if not arguments:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(VALIDATION_MAX_WORKERS, len(arguments))) as executor:
+        details_list = list(executor.map(
+            lambda arg: validate_with_details(arg["argument"]),
+            arguments
+        ))
 
-    for arg in arguments:
-        details = validate_with_details(arg["argument"])
+    filtered = []
 
+    for arg, details in zip(arguments, details_list):
         meets_requirements = True
         if require_causal and not details.get("meets_causal_criterion"):
             meets_requirements = False
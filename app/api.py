@@ -19,6 +19,7 @@ from app.core.workflow import process_video, process_video_with_progress
 from app.config import get_settings
 from app.core.auth import verify_api_key, verify_admin_password
 from app.services.storage import submit_rating, get_available_analyses
+from app.services.evidence_engine import close_evidence_engine_client
 from app.utils.youtube import extract_video_id
 from app.constants import AnalysisMode, AnalysisStatus
 from app.logger import get_logger
@@ -58,6 +59,7 @@ async def lifespan(app: FastAPI):
     configure_logging(get_settings().log_level)
     logger.info("api_startup", log_level=get_settings().log_level)
     yield
+    await close_evidence_engine_client()
     logger.info("api_shutdown")
 
 
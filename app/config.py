@@ -21,6 +21,18 @@ class Settings(BaseSettings):
     openai_model: str = "gpt-4o-mini"
     openai_smart_model: str = "gpt-4o"
 
+    # Proactive OpenAI rate limiting (account quota, 0 = disabled)
+    openai_rpm: int = 0
+    openai_tpm: int = 0
+
+    # On-disk LLM result cache (empty dir = ~/.cache/video-analyzer, 0 MB = unbounded)
+    llm_cache_enabled: bool = True
+    llm_cache_dir: str = ""
+    llm_cache_max_mb: int = 2048
+
+    # Local embeddings for deduplication (sentence-transformers model name, empty = OpenAI)
+    local_embedding_model: str = ""
+
     # Logging
     log_level: str = "INFO"
 
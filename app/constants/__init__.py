@@ -80,6 +80,7 @@ from .content_limits import (
     TRANSCRIPT_MIN_LENGTH,
     TRANSCRIPT_MIN_VALID_LENGTH,
     TRANSCRIPT_MAX_LENGTH_FOR_ARGS,
+    TRANSCRIPT_MAX_TOKENS_FOR_ARGS,
 
     # Analysis
     PROS_CONS_MAX_CONTENT_LENGTH,
@@ -216,6 +217,7 @@ from .cache import (
 
 from .language import (
     LANGUAGE_MAP_DETECTION,
+    LANGUAGE_DETECTION_RESPONSE_FORMAT,
 )
 
 # ============================================================================
@@ -263,6 +265,7 @@ __all__ = [
     "TRANSCRIPT_MIN_LENGTH",
     "TRANSCRIPT_MIN_VALID_LENGTH",
     "TRANSCRIPT_MAX_LENGTH_FOR_ARGS",
+    "TRANSCRIPT_MAX_TOKENS_FOR_ARGS",
     "PROS_CONS_MAX_CONTENT_LENGTH",
     "PROS_CONS_MIN_PARTIAL_CONTENT",
     "AGGREGATE_MAX_PROS_PER_ARG",
@@ -343,4 +346,5 @@ __all__ = [
 
     # Language
     "LANGUAGE_MAP_DETECTION",
+    "LANGUAGE_DETECTION_RESPONSE_FORMAT",
 ]
@@ -15,7 +15,10 @@ TRANSCRIPT_MIN_VALID_LENGTH = 100
 """Minimum length to validate transcript extraction success."""
 
 TRANSCRIPT_MAX_LENGTH_FOR_ARGS = 25000
-"""Maximum transcript characters for argument extraction (token optimization)."""
+"""Maximum transcript characters for argument extraction (fallback when no tokenizer is available)."""
+
+TRANSCRIPT_MAX_TOKENS_FOR_ARGS = 8000
+"""Maximum transcript tokens for argument extraction (token-accurate truncation)."""
 
 
 # ============================================================================
@@ -3,4 +3,22 @@ from typing import Dict
 LANGUAGE_MAP_DETECTION: Dict[str, str] = {
     "fr": "French",
     "en": "English",
+}
+
+# Structured output of language detection: the model can only answer one
+# of the supported codes
+LANGUAGE_DETECTION_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "language_detection",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "language": {"type": "string", "enum": list(LANGUAGE_MAP_DETECTION)}
+            },
+            "required": ["language"],
+            "additionalProperties": False
+        }
+    }
 }
\ No newline at end of file
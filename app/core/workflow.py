@@ -7,13 +7,17 @@ This module contains the `process_video` function that orchestrates the entire w
 - Evidence Engine analysis (delegated via HTTP)
 - Report generation
 """
+import asyncio
 import time
-from typing import Dict, Any
+from typing import Dict, Any, List
 
 from app.utils.youtube import extract_video_id
 from app.utils.transcript import extract_transcript
-from app.agents.extraction import extract_arguments, structure_to_dict
-from app.services.evidence_engine import analyze_argument as evidence_engine_analyze
+from app.agents.extraction import extract_arguments_async, structure_to_dict
+from app.services.evidence_engine import (
+    analyze_argument as evidence_engine_analyze,
+    EVIDENCE_ENGINE_MAX_CONCURRENCY
+)
 from app.utils.report_formatter import generate_markdown_report
 from app.services.storage import save_analysis, get_available_analyses
 from app.utils.analysis_metadata import build_available_analyses_metadata
@@ -26,6 +30,49 @@ from app.logger import get_logger
 logger = get_logger(__name__)
 
 
+async def _enrich_thesis_arguments(
+    thesis_arguments: List[Dict[str, Any]],
+    analysis_mode: AnalysisMode,
+    language: str,
+    progress_callback=None
+) -> List[Dict[str, Any]]:
+    """
+    Analyze thesis arguments with evidence-engine, several at a time.
+
+    Calls run concurrently (bounded by EVIDENCE_ENGINE_MAX_CONCURRENCY);
+    results keep the input order. If progress_callback is given, it is
+    called after each completed analysis.
+    """
+    semaphore = asyncio.Semaphore(EVIDENCE_ENGINE_MAX_CONCURRENCY)
+    arg_count = len(thesis_arguments)
+    done = 0
+
+    async def enrich(arg: Dict[str, Any]) -> Dict[str, Any]:
+        nonlocal done
+        async with semaphore:
+            result = await evidence_engine_analyze(
+                argument=arg["argument"],
+                argument_en=arg.get("argument_en", arg["argument"]),
+                mode=analysis_mode.value,
+                language=language,
+            )
+
+        done += 1
+        if progress_callback:
+            percent = 35 + int((done / arg_count) * 55)
+            await progress_callback("evidence_engine", percent, f"Analyzed argument {done}/{arg_count}...")
+
+        # Wrap pros/cons into analysis dict for report_formatter compatibility
+        analysis = {
+            "pros": result.get("pros", []),
+            "cons": result.get("cons", []),
+        }
+        other = {k: v for k, v in result.items() if k not in ("pros", "cons")}
+        return {**arg, "analysis": analysis, **other}
+
+    return list(await asyncio.gather(*(enrich(arg) for arg in thesis_arguments)))
+
+
 async def process_video(
     youtube_url: str,
     force_refresh: bool = False,
@@ -96,7 +143,7 @@ async def process_video(
 
     # Step 3: Extract arguments with language detection (returns ArgumentStructure)
     t_args = time.time()
-    language, argument_structure = extract_arguments(transcript_text, video_id=video_id)
+    language, argument_structure = await extract_arguments_async(transcript_text, video_id=video_id)
     logger.info(
         "step_end",
         video_id=video_id,
@@ -136,21 +183,7 @@ async def process_video(
     # Step 5: Delegate per-argument analysis to evidence-engine
     logger.info("step_start", video_id=video_id, step="evidence_engine", thesis_count=len(thesis_arguments))
     t_evidence = time.time()
-    enriched_thesis_arguments = []
-    for arg in thesis_arguments:
-        result = await evidence_engine_analyze(
-            argument=arg["argument"],
-            argument_en=arg.get("argument_en", arg["argument"]),
-            mode=analysis_mode.value,
-            language=language,
-        )
-        # Wrap pros/cons into analysis dict for report_formatter compatibility
-        analysis = {
-            "pros": result.get("pros", []),
-            "cons": result.get("cons", []),
-        }
-        other = {k: v for k, v in result.items() if k not in ("pros", "cons")}
-        enriched_thesis_arguments.append({**arg, "analysis": analysis, **other})
+    enriched_thesis_arguments = await _enrich_thesis_arguments(thesis_arguments, analysis_mode, language)
 
     logger.info(
         "step_end",
@@ -272,7 +305,7 @@ async def process_video_with_progress(
 
     # Step 3: Extract arguments (returns ArgumentStructure)
     await progress_callback("arguments", 25, "Extracting arguments from transcript...")
-    language, argument_structure = extract_arguments(transcript_text, video_id=video_id)
+    language, argument_structure = await extract_arguments_async(transcript_text, video_id=video_id)
 
     if not argument_structure.reasoning_chains:
         await progress_callback("complete", 100, "No arguments found - analysis complete")
@@ -306,23 +339,9 @@ async def process_video_with_progress(
     # Step 5: Delegate per-argument analysis to evidence-engine
     arg_count = len(thesis_arguments)
     await progress_callback("evidence_engine", 35, f"Analyzing {arg_count} thesis arguments via evidence-engine...")
-    enriched_thesis_arguments = []
-    for idx, arg in enumerate(thesis_arguments):
-        percent = 35 + int((idx / arg_count) * 55)
-        await progress_callback("evidence_engine", percent, f"Analyzing argument {idx + 1}/{arg_count}...")
-        result = await evidence_engine_analyze(
-            argument=arg["argument"],
-            argument_en=arg.get("argument_en", arg["argument"]),
-            mode=analysis_mode.value,
-            language=language,
-        )
-        # Wrap pros/cons into analysis dict for report_formatter compatibility
-        analysis = {
-            "pros": result.get("pros", []),
-            "cons": result.get("cons", []),
-        }
-        other = {k: v for k, v in result.items() if k not in ("pros", "cons")}
-        enriched_thesis_arguments.append({**arg, "analysis": analysis, **other})
+    enriched_thesis_arguments = await _enrich_thesis_arguments(
+        thesis_arguments, analysis_mode, language, progress_callback=progress_callback
+    )
 
     # Step 6: Report generation
     await progress_callback("report", 95, "Generating final report...")
@@ -1,4 +1,7 @@
+from functools import lru_cache
+
 import httpx
+import orjson
 from app.config import get_settings
 
 # ============================================================================
@@ -7,6 +10,28 @@ from app.config import get_settings
 
 EVIDENCE_ENGINE_TIMEOUT_SECONDS = 120
 EVIDENCE_ENGINE_ANALYZE_PATH    = "/analyze"
+EVIDENCE_ENGINE_MAX_CONCURRENCY = 4  # Arguments analyzed in parallel per video
+
+# ============================================================================
+# CLIENT
+# ============================================================================
+
+@lru_cache(maxsize=1)
+def get_evidence_engine_client() -> httpx.AsyncClient:
+    """
+    Return the process-wide evidence-engine client.
+    Reusing one connection pool keeps connections alive across arguments and
+    videos instead of paying a TCP/TLS handshake per call. Bound to the
+    application's event loop: close it with close_evidence_engine_client.
+    """
+    return httpx.AsyncClient(timeout=EVIDENCE_ENGINE_TIMEOUT_SECONDS)
+
+
+async def close_evidence_engine_client() -> None:
+    """Close the shared client (if it was ever created)."""
+    if get_evidence_engine_client.cache_info().currsize:
+        await get_evidence_engine_client().aclose()
+        get_evidence_engine_client.cache_clear()
 
 # ============================================================================
 # LOGIC
@@ -35,11 +60,10 @@ async def analyze_argument(
         "X-API-Key": settings.evidence_engine_api_key,
         "Content-Type": "application/json",
     }
-    async with httpx.AsyncClient(timeout=EVIDENCE_ENGINE_TIMEOUT_SECONDS) as client:
-        response = await client.post(
-            f"{settings.evidence_engine_url}{EVIDENCE_ENGINE_ANALYZE_PATH}",
-            json=payload,
-            headers=headers,
-        )
-        response.raise_for_status()
-        return response.json()
+    response = await get_evidence_engine_client().post(
+        f"{settings.evidence_engine_url}{EVIDENCE_ENGINE_ANALYZE_PATH}",
+        content=orjson.dumps(payload),
+        headers=headers,
+    )
+    response.raise_for_status()
+    return orjson.loads(response.content)
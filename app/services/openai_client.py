@@ -0,0 +1,90 @@
+"""
+Shared OpenAI client for the extraction agents and utilities.
+
+A single client (and its httpx connection pool) is reused across calls so
+TCP/TLS handshakes are paid once per process instead of once per request.
+Connections speak HTTP/2 (negotiated via ALPN), so concurrent calls are
+multiplexed as streams over a few connections instead of one each.
+
+Retries are owned by OPENAI_RETRY (exponential backoff on connection
+errors, 429 and 5xx); the SDK's own retries are disabled so attempts do
+not multiply.
+"""
+from functools import lru_cache
+
+import httpx
+from openai import OpenAI, APIConnectionError, APIStatusError
+from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception
+
+from ..config import get_settings
+from ..constants import DEFAULT_TIMEOUT_HTTPX
+
+# ============================================================================
+# CONSTANTS
+# ============================================================================
+
+# Sized for concurrent classification (16) + embeddings (4) + segment workers
+OPENAI_MAX_CONNECTIONS = 64
+OPENAI_MAX_KEEPALIVE_CONNECTIONS = 32
+OPENAI_CONNECT_RETRIES = 2  # Transport-level retries of failed TCP/TLS connects
+# Non-streamed completions of 4000+ tokens can take minutes; only the read
+# timeout is raised, connects still fail fast
+OPENAI_READ_TIMEOUT_SECONDS = 300
+OPENAI_TIMEOUT = httpx.Timeout(DEFAULT_TIMEOUT_HTTPX, read=OPENAI_READ_TIMEOUT_SECONDS)
+
+OPENAI_RETRY_MAX_ATTEMPTS = 3
+OPENAI_RETRY_MIN_WAIT_SECONDS = 1
+OPENAI_RETRY_MAX_WAIT_SECONDS = 10
+
+# ============================================================================
+# CLIENT
+# ============================================================================
+
+@lru_cache(maxsize=1)
+def get_openai_client() -> OpenAI:
+    """
+    Return the process-wide OpenAI client.
+
+    The underlying httpx client ignores HTTP(S)_PROXY environment variables
+    (trust_env=False), which used to break OpenAI calls behind local proxies.
+
+    Returns:
+        Cached OpenAI client
+    """
+    settings = get_settings()
+
+    http_client = httpx.Client(
+        timeout=OPENAI_TIMEOUT,
+        transport=httpx.HTTPTransport(
+            http2=True,
+            retries=OPENAI_CONNECT_RETRIES,
+            limits=httpx.Limits(
+                max_connections=OPENAI_MAX_CONNECTIONS,
+                max_keepalive_connections=OPENAI_MAX_KEEPALIVE_CONNECTIONS
+            )
+        ),
+        trust_env=False
+    )
+
+    return OpenAI(api_key=settings.openai_api_key, http_client=http_client, max_retries=0)
+
+
+# ============================================================================
+# RETRY LOGIC
+# ============================================================================
+
+def _is_retryable(exc: BaseException) -> bool:
+    """Return True for transient OpenAI errors worth retrying."""
+    if isinstance(exc, APIConnectionError):
+        return True
+    if isinstance(exc, APIStatusError):
+        return exc.status_code == 429 or exc.status_code >= 500
+    return False
+
+
+OPENAI_RETRY = retry(
+    stop=stop_after_attempt(OPENAI_RETRY_MAX_ATTEMPTS),
+    wait=wait_exponential(multiplier=1, min=OPENAI_RETRY_MIN_WAIT_SECONDS, max=OPENAI_RETRY_MAX_WAIT_SECONDS),
+    retry=retry_if_exception(_is_retryable),
+    reraise=True
+)
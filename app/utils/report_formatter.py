@@ -6,8 +6,8 @@ Supports bilingual output (French/English) based on source video language.
 from typing import Dict, List
 import datetime
 import json
-from openai import OpenAI
 from ..config import get_settings
+from ..services.openai_client import get_openai_client, OPENAI_RETRY
 from ..logger import get_logger
 
 logger = get_logger(__name__)
@@ -47,10 +47,8 @@ def _translate_to_french(text: str) -> str:
     if not settings.openai_api_key:
         return text
 
-    client = OpenAI(api_key=settings.openai_api_key)
-
     try:
-        response = client.chat.completions.create(
+        response = OPENAI_RETRY(get_openai_client().chat.completions.create)(
             model=settings.openai_model,  # gpt-4o-mini for fast translation
             messages=[
                 {"role": "system", "content": "You are a translator. Translate the following text from English to French. Preserve markdown formatting and links. Return only the translated text."},
@@ -10,7 +10,16 @@ os.environ.setdefault("EVIDENCE_ENGINE_URL", "http://localhost:8001")
 os.environ.setdefault("EVIDENCE_ENGINE_API_KEY", "test-key")
 
 import pytest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
+
+
+@pytest.fixture(autouse=True)
+def isolated_llm_cache(tmp_path):
+    """Point the on-disk LLM cache at a per-test directory."""
+    from app.agents.extraction import _cache
+
+    with patch.object(_cache, "LLM_CACHE_DIR", str(tmp_path / "llm-cache")):
+        yield
 
 
 @pytest.fixture
@@ -0,0 +1,120 @@
+"""
+Unit tests for app/agents/extraction/_cache.py
+
+Tests the JSON/array round-trips and cached_chat_completion with a mocked
+client (the cache directory is isolated per test by conftest).
+"""
+import os
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+from app.agents.extraction import _cache
+from app.agents.extraction._cache import (
+    make_cache_key,
+    cache_get,
+    cache_put,
+    cache_get_array,
+    cache_put_array,
+    cached_chat_completion,
+    prune_cache,
+)
+
+
+def _client(content, finish_reason="stop"):
+    response = MagicMock()
+    response.choices[0].message.content = content
+    response.choices[0].finish_reason = finish_reason
+
+    client = MagicMock()
+    client.chat.completions.create.return_value = response
+    return client
+
+
+# ---------------------------------------------------------------------------
+# cache_get / cache_put
+# ---------------------------------------------------------------------------
+
+def test_cache_round_trip_and_miss():
+    key = make_cache_key("model", "text")
+
+    assert cache_get("tests", key) is None
+    cache_put("tests", key, [{"argument": "a"}])
+    assert cache_get("tests", key) == [{"argument": "a"}]
+
+
+def test_cache_array_round_trip():
+    key = make_cache_key("model", "text")
+    vector = np.arange(4, dtype=np.float32)
+
+    assert cache_get_array("tests", key) is None
+    cache_put_array("tests", key, vector)
+    assert np.array_equal(cache_get_array("tests", key), vector)
+
+
+def test_failed_writes_leave_no_temp_files(tmp_path):
+    cache_put("tests", make_cache_key("json"), {"not", "serializable"})
+    cache_put_array("tests", make_cache_key("array"), np.array([object()]))
+
+    assert list((tmp_path / "llm-cache" / "tests").iterdir()) == []
+
+
+def test_disabled_cache_never_reads_or_writes(tmp_path):
+    settings = MagicMock(llm_cache_enabled=False)
+    key = make_cache_key("text")
+
+    with patch.object(_cache, "get_settings", return_value=settings):
+        cache_put("tests", key, "value")
+        assert cache_get("tests", key) is None
+
+    assert not (tmp_path / "llm-cache").exists()
+
+
+# ---------------------------------------------------------------------------
+# prune_cache
+# ---------------------------------------------------------------------------
+
+def test_prune_cache_evicts_least_recently_used_entries():
+    keys = [make_cache_key(str(i)) for i in range(4)]
+    for i, key in enumerate(keys):
+        cache_put("tests", key, "x" * 100)
+        os.utime(_cache._entry_path("tests", key), (i, i))
+
+    cache_get("tests", keys[0])  # Hit refreshes the oldest entry
+
+    removed = prune_cache(max_bytes=250)
+
+    assert removed == 2
+    assert [cache_get("tests", key) is not None for key in keys] == [True, False, False, True]
+
+
+def test_prune_cache_keeps_cache_under_cap():
+    cache_put("tests", make_cache_key("a"), "x" * 100)
+
+    assert prune_cache(max_bytes=1000) == 0
+
+
+# ---------------------------------------------------------------------------
+# cached_chat_completion
+# ---------------------------------------------------------------------------
+
+def test_cached_chat_completion_reuses_identical_requests():
+    client = _client('{"translation": "A"}')
+    body = {"model": "m", "messages": [{"role": "user", "content": "a"}], "temperature": 0.1}
+
+    first = cached_chat_completion(client, body)
+    second = cached_chat_completion(client, dict(reversed(list(body.items()))))
+    cached_chat_completion(client, {**body, "temperature": 0.2})
+
+    assert first == second == '{"translation": "A"}'
+    assert client.chat.completions.create.call_count == 2
+
+
+def test_cached_chat_completion_skips_truncated_responses():
+    client = _client('{"translation": "A', finish_reason="length")
+    body = {"model": "m", "messages": []}
+
+    cached_chat_completion(client, body)
+    cached_chat_completion(client, body)
+
+    assert client.chat.completions.create.call_count == 2
@@ -0,0 +1,130 @@
+"""
+Unit tests for pure helpers in app/agents/extraction/consolidator.py
+
+Tests _find_unique_indices and _cluster_representatives on hand-built embeddings,
+and the text-only exact/near-exact prefilters.
+"""
+from unittest.mock import patch
+
+from app.agents.extraction.consolidator import (
+    consolidate_arguments,
+    _find_unique_indices,
+    _cluster_representatives,
+    _drop_near_exact_duplicates,
+    _normalize_text,
+    _simhash,
+)
+
+
+# ---------------------------------------------------------------------------
+# _find_unique_indices
+# ---------------------------------------------------------------------------
+
+def test_find_unique_indices_empty():
+    assert _find_unique_indices([], 0.85) == []
+
+
+def test_find_unique_indices_all_distinct():
+    embeddings = [
+        [1.0, 0.0, 0.0],
+        [0.0, 1.0, 0.0],
+        [0.0, 0.0, 1.0],
+    ]
+    assert _find_unique_indices(embeddings, 0.85) == [0, 1, 2]
+
+
+def test_find_unique_indices_drops_later_duplicate():
+    embeddings = [
+        [1.0, 0.0],
+        [0.0, 1.0],
+        [0.99, 0.05],  # near-duplicate of 0
+    ]
+    assert _find_unique_indices(embeddings, 0.85) == [0, 1]
+
+
+def test_find_unique_indices_ignores_vector_scale():
+    # Cosine similarity: scaled copies are duplicates
+    embeddings = [
+        [1.0, 2.0],
+        [10.0, 20.0],
+    ]
+    assert _find_unique_indices(embeddings, 0.85) == [0]
+
+
+def test_find_unique_indices_zero_vector_is_unique():
+    embeddings = [
+        [1.0, 0.0],
+        [0.0, 0.0],
+    ]
+    assert _find_unique_indices(embeddings, 0.85) == [0, 1]
+
+
+# ---------------------------------------------------------------------------
+# _cluster_representatives
+# ---------------------------------------------------------------------------
+
+def test_cluster_representatives_keeps_longest_text():
+    embeddings = [
+        [1.0, 0.0],
+        [0.99, 0.05],
+        [0.0, 1.0],
+    ]
+    texts = ["short", "a longer duplicate", "other"]
+    assert _cluster_representatives(embeddings, texts, 0.85) == [1, 2]
+
+
+def test_cluster_representatives_links_transitively():
+    # 0~1 and 1~2 are above threshold, 0~2 is not: one cluster
+    embeddings = [
+        [1.0, 0.0],
+        [0.94, 0.34],
+        [0.77, 0.64],
+    ]
+    texts = ["a", "bb", "c"]
+    assert _cluster_representatives(embeddings, texts, 0.9) == [1]
+
+
+# ---------------------------------------------------------------------------
+# _normalize_text / _simhash
+# ---------------------------------------------------------------------------
+
+def test_normalize_text():
+    assert _normalize_text("  Le nucléaire,   c'est PROPRE ! ") == "le nucléaire c est propre"
+
+
+def test_simhash_close_texts_differ_in_few_bits():
+    base = _simhash(_normalize_text("La vaccination réduit fortement la mortalité infantile."))
+    close = _simhash(_normalize_text("La vaccination réduit fortement la mortalité infantile!!"))
+    other = _simhash(_normalize_text("Le nucléaire est une énergie décarbonée et pilotable."))
+    assert (base ^ close).bit_count() == 0
+    assert (base ^ other).bit_count() > 20
+
+
+# ---------------------------------------------------------------------------
+# _drop_near_exact_duplicates
+# ---------------------------------------------------------------------------
+
+def test_drop_near_exact_duplicates_keeps_first_occurrence():
+    arguments = [
+        {"argument": "La vaccination réduit fortement la mortalité infantile dans les pays pauvres.", "id": 0},
+        {"argument": "la vaccination réduit fortement la mortalité infantile dans les pays pauvres", "id": 1},
+        {"argument": "La vaccination réduit fortement la mortalité infantile dans les pays pauvre.", "id": 2},
+        {"argument": "Le nucléaire est une énergie décarbonée et pilotable.", "id": 3},
+    ]
+    assert [arg["id"] for arg in _drop_near_exact_duplicates(arguments)] == [0, 3]
+
+
+# ---------------------------------------------------------------------------
+# consolidate_arguments
+# ---------------------------------------------------------------------------
+
+def test_consolidate_arguments_drops_overlap_duplicates_before_embedding():
+    segment_args = [
+        [{"argument": "Les prix montent.", "segment_id": 0}],
+        [{"argument": "les prix  montent", "segment_id": 1}],
+    ]
+    with patch("app.agents.extraction.consolidator.deduplicate_by_similarity", side_effect=lambda args, threshold: args) as dedup:
+        result = consolidate_arguments(segment_args)
+
+    assert [arg["segment_id"] for arg in result] == [0]
+    assert len(dedup.call_args.args[0]) == 1
@@ -0,0 +1,87 @@
+"""
+Unit tests for app/agents/extraction/_embeddings.py
+
+Tests sub-batching and ordering of embed_texts with a mocked client,
+the disk cache, and the optional local embedder path.
+"""
+from unittest.mock import patch, MagicMock
+
+import numpy as np
+
+from app.agents.extraction import _embeddings
+from app.agents.extraction._embeddings import embed_texts
+
+
+def _fake_client():
+    """Client whose embeddings encode the input text, returned in reverse order."""
+    def create(model, input):
+        response = MagicMock()
+        items = []
+        for index, text in enumerate(input):
+            item = MagicMock()
+            item.index = index
+            item.embedding = [float(text), 1.0]
+            items.append(item)
+        response.data = list(reversed(items))
+        return response
+
+    client = MagicMock()
+    client.embeddings.create.side_effect = create
+    return client
+
+
+# ---------------------------------------------------------------------------
+# embed_texts
+# ---------------------------------------------------------------------------
+
+def test_embed_texts_empty():
+    assert embed_texts([]).shape == (0, 0)
+
+
+def test_embed_texts_preserves_order_across_batches():
+    client = _fake_client()
+    texts = [str(i) for i in range(7)]
+
+    with patch.object(_embeddings, "get_openai_client", return_value=client), \
+         patch.object(_embeddings, "EMBEDDING_BATCH_SIZE", 3):
+        result = embed_texts(texts)
+
+    assert client.embeddings.create.call_count == 3
+    assert result.shape == (7, 2)
+    assert result[:, 0].tolist() == [float(i) for i in range(7)]
+
+
+def test_embed_texts_uses_local_embedder_when_configured():
+    embedder = MagicMock()
+    embedder.encode.return_value = np.ones((2, 3), dtype=np.float64)
+    settings = MagicMock(local_embedding_model="local-model")
+
+    with patch.object(_embeddings, "get_settings", return_value=settings), \
+         patch.object(_embeddings, "_get_local_embedder", return_value=embedder), \
+         patch.object(_embeddings, "get_openai_client") as get_client:
+        result = embed_texts(["a", "b"])
+
+    get_client.assert_not_called()
+    assert result.dtype == np.float32
+    assert result.shape == (2, 3)
+
+
+def test_embed_texts_normalize_returns_unit_rows():
+    client = _fake_client()
+
+    with patch.object(_embeddings, "get_openai_client", return_value=client):
+        result = embed_texts(["3", "0"], normalize=True)
+
+    assert np.allclose(np.linalg.norm(result, axis=1), 1.0)
+
+
+def test_embed_texts_only_embeds_cache_misses():
+    client = _fake_client()
+
+    with patch.object(_embeddings, "get_openai_client", return_value=client):
+        embed_texts(["1", "2"])
+        result = embed_texts(["2", "3", "1"])
+
+    assert client.embeddings.create.call_count == 2
+    assert client.embeddings.create.call_args.kwargs["input"] == ["3"]
+    assert result[:, 0].tolist() == [2.0, 3.0, 1.0]
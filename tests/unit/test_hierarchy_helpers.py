@@ -1,12 +1,25 @@
 """
 Unit tests for pure helpers in app/agents/extraction/hierarchy.py
 
-Tests get_thesis_arguments, get_argument_children, and _count_roles.
+Tests get_thesis_arguments, get_argument_children, _count_roles and
+the parent matching and batch classification helpers.
 """
+from unittest.mock import patch, MagicMock
+
+import numpy as np
+
+from app.agents.extraction import hierarchy
 from app.agents.extraction.hierarchy import (
     get_thesis_arguments,
     get_argument_children,
+    build_children_index,
     _count_roles,
+    _get_context_arguments,
+    _build_text_index,
+    _find_parent_by_text,
+    _find_parents_with_embeddings,
+    _parse_batch_classifications,
+    classify_argument_role,
     ArgumentRole,
 )
 
@@ -83,6 +96,21 @@ def test_get_argument_children_empty_list():
     assert get_argument_children(0, []) == []
 
 
+def test_get_argument_children_uses_index():
+    arguments = [
+        _make_arg(0, "thesis"),
+        _make_arg(1, "sub_argument", parent_id=0),
+        _make_arg(2, "evidence", parent_id=1),
+        _make_arg(3, "sub_argument", parent_id=0),
+    ]
+    index = build_children_index(arguments)
+
+    for arg in arguments:
+        assert get_argument_children(arg["id"], arguments, index) == \
+            get_argument_children(arg["id"], arguments)
+    assert [a["id"] for a in index[None]] == [0]
+
+
 # ---------------------------------------------------------------------------
 # _count_roles
 # ---------------------------------------------------------------------------
@@ -121,3 +149,172 @@ def test_count_roles_unknown_role_excluded():
 
     assert counts["thesis"] == 1
     assert "some_unknown_role" not in counts
+
+
+# ---------------------------------------------------------------------------
+# _get_context_arguments
+# ---------------------------------------------------------------------------
+
+def test_get_context_arguments_small_list_excludes_current():
+    texts = ["a", "b", "c"]
+    assert _get_context_arguments(texts, exclude_index=1) == ["a", "c"]
+
+
+def test_get_context_arguments_windows_around_current():
+    texts = [str(i) for i in range(20)]
+
+    assert _get_context_arguments(texts, exclude_index=10, max_context=4) == ["8", "9", "11"]
+    assert _get_context_arguments(texts, exclude_index=0, max_context=4) == ["1"]
+
+
+# ---------------------------------------------------------------------------
+# _find_parent_by_text
+# ---------------------------------------------------------------------------
+
+def test_find_parent_by_text_exact_match_ignores_case():
+    text_index = _build_text_index(["Taxes raise prices"])
+    assert _find_parent_by_text("  taxes RAISE prices ", text_index) == 0
+
+
+def test_find_parent_by_text_exact_match_wins_over_earlier_substring():
+    text_index = _build_text_index(["Taxes raise prices for consumers", "Taxes raise prices"])
+    assert _find_parent_by_text("taxes raise prices", text_index) == 1
+
+
+def test_find_parent_by_text_substring_match():
+    text_index = _build_text_index(["Unrelated claim", "Taxes raise prices for consumers"])
+    assert _find_parent_by_text("taxes raise prices", text_index) == 1
+
+
+def test_find_parent_by_text_argument_inside_parent_wins_when_earlier():
+    text_index = _build_text_index(["Taxes", "Unrelated", "Taxes raise prices for consumers"])
+    assert _find_parent_by_text("taxes raise prices", text_index) == 0
+
+
+def test_find_parent_by_text_does_not_match_across_arguments():
+    text_index = _build_text_index(["Taxes raise", "food prices"])
+    assert _find_parent_by_text("raise food", text_index) is None
+
+
+def test_find_parent_by_text_no_match():
+    text_index = _build_text_index(["Taxes raise prices"])
+    assert _find_parent_by_text("Wages fall", text_index) is None
+
+
+# ---------------------------------------------------------------------------
+# _find_parents_with_embeddings
+# ---------------------------------------------------------------------------
+
+def test_find_parents_with_embeddings_batches_and_thresholds():
+    arg_embeddings = np.array([[1.0, 0.0], [0.0, 1.0]], dtype=np.float32)
+    parent_embeddings = np.array([
+        [0.11, 0.99],   # close to argument 1
+        [0.71, 0.71],   # 0.71 to both: above threshold, first wins
+        [-1.0, 0.0],    # no match
+    ], dtype=np.float32)
+
+    with patch.object(hierarchy, "embed_texts", return_value=parent_embeddings) as embed:
+        result = _find_parents_with_embeddings(["a", "b", "c"], arg_embeddings)
+
+    assert result == [1, 0, None]
+    embed.assert_called_once_with(["a", "b", "c"], normalize=True)
+
+
+def test_find_parents_with_embeddings_embeds_each_text_once():
+    arg_embeddings = np.array([[1.0, 0.0], [0.0, 1.0]], dtype=np.float32)
+    parent_embeddings = np.array([[0.0, 1.0], [1.0, 0.0]], dtype=np.float32)
+
+    with patch.object(hierarchy, "embed_texts", return_value=parent_embeddings) as embed:
+        result = _find_parents_with_embeddings(["b", "a", "b"], arg_embeddings)
+
+    assert result == [1, 0, 1]
+    embed.assert_called_once_with(["b", "a"], normalize=True)
+
+
+def test_find_parents_with_embeddings_without_embeddings():
+    assert _find_parents_with_embeddings(["a", "b"], None) == [None, None]
+
+
+# ---------------------------------------------------------------------------
+# _parse_batch_classifications
+# ---------------------------------------------------------------------------
+
+def test_parse_batch_classifications_orders_and_sanitizes_parents():
+    arguments = [_make_arg(0, None), _make_arg(1, None), _make_arg(2, None)]
+    data = {"classifications": [
+        {"id": 2, "role": "evidence", "parent_id": 2, "confidence": 0.7},   # self-parent dropped
+        {"id": 0, "role": "thesis", "parent_id": 1, "confidence": 0.9},     # thesis has no parent
+        {"id": 1, "role": "sub_argument", "parent_id": 0},
+    ]}
+
+    assert _parse_batch_classifications(data, arguments) == [
+        {"role": "thesis", "parent_id": None, "confidence": 0.9},
+        {"role": "sub_argument", "parent_id": 0, "confidence": 0.5},
+        {"role": "evidence", "parent_id": None, "confidence": 0.7},
+    ]
+
+
+def test_parse_batch_classifications_rejects_incomplete_response():
+    arguments = [_make_arg(0, None), _make_arg(1, None)]
+    data = {"classifications": [
+        {"id": 0, "role": "thesis", "parent_id": None},
+        {"id": 1, "role": "not_a_role", "parent_id": 0},
+    ]}
+    assert _parse_batch_classifications(data, arguments) is None
+
+
+def test_parse_batch_classifications_rejects_wrong_shape():
+    assert _parse_batch_classifications({"roles": []}, [_make_arg(0, None)]) is None
+
+
+# ---------------------------------------------------------------------------
+# classify_argument_role
+# ---------------------------------------------------------------------------
+
+def test_classify_argument_role_memoizes_successes(mock_settings, mock_openai_chat_response):
+    hierarchy._classify_cached.cache_clear()
+    client = MagicMock()
+    client.chat.completions.create.return_value = mock_openai_chat_response(
+        '{"role": "evidence", "parent_argument": "A", "confidence": 0.8}'
+    )
+
+    with patch.object(hierarchy, "get_settings", return_value=mock_settings), \
+         patch.object(hierarchy, "get_openai_client", return_value=client):
+        first = classify_argument_role("B", ["A"])
+        first["role"] = "mutated"
+        second = classify_argument_role("B", ["A"])
+
+    assert second == {"role": "evidence", "parent_argument": "A", "confidence": 0.8}
+    assert client.chat.completions.create.call_count == 1
+    hierarchy._classify_cached.cache_clear()
+
+
+def test_classify_argument_role_requests_structured_output(mock_settings, mock_openai_chat_response):
+    hierarchy._classify_cached.cache_clear()
+    client = MagicMock()
+    client.chat.completions.create.return_value = mock_openai_chat_response(
+        '{"role": "thesis", "parent_argument": null, "confidence": 0.9}'
+    )
+
+    with patch.object(hierarchy, "get_settings", return_value=mock_settings), \
+         patch.object(hierarchy, "get_openai_client", return_value=client):
+        classify_argument_role("B", ["A"])
+
+    response_format = client.chat.completions.create.call_args.kwargs["response_format"]
+    schema = response_format["json_schema"]["schema"]
+    assert response_format["type"] == "json_schema"
+    assert schema["properties"]["role"]["enum"] == [role.value for role in ArgumentRole]
+    hierarchy._classify_cached.cache_clear()
+
+
+def test_classify_argument_role_does_not_cache_errors(mock_settings):
+    hierarchy._classify_cached.cache_clear()
+    client = MagicMock()
+    client.chat.completions.create.side_effect = RuntimeError("boom")
+
+    with patch.object(hierarchy, "get_settings", return_value=mock_settings), \
+         patch.object(hierarchy, "get_openai_client", return_value=client):
+        assert classify_argument_role("B", ["A"])["role"] == "thesis"
+        classify_argument_role("B", ["A"])
+
+    assert client.chat.completions.create.call_count == 2
@@ -0,0 +1,224 @@
+"""
+Unit tests for pure helpers in app/agents/extraction/local_extractor.py
+
+Tests the incremental _ArgumentStreamParser used for streamed responses
+the cleanup in _normalize_argument, the request messages
+the truncation and invalid-JSON retries of extract_from_segment_iter
+and the concurrent extract_from_all_segments.
+"""
+import json
+from types import SimpleNamespace
+from unittest.mock import patch, MagicMock
+
+from app.prompts import JSON_OUTPUT_STRICT
+from app.agents.extraction import local_extractor
+from app.agents.extraction.constants_extraction import (
+    EXPLANATORY_ARGUMENT_DEFINITION,
+    EXTRACTION_MAX_TOKENS_RETRY,
+    LOCAL_EXTRACTION_SYSTEM_PROMPT,
+)
+from app.agents.extraction.local_extractor import (
+    extract_from_all_segments,
+    extract_from_segment_iter,
+    _ArgumentStreamParser,
+    _normalize_argument,
+    _parse_arguments,
+    _build_request_body,
+)
+from app.agents.extraction.segmentation import Segment
+
+
+def _feed_in_chunks(content, chunk_size):
+    parser = _ArgumentStreamParser()
+    items = []
+    for i in range(0, len(content), chunk_size):
+        items.extend(parser.feed(content[i:i + chunk_size]))
+    return items
+
+
+# ---------------------------------------------------------------------------
+# _ArgumentStreamParser
+# ---------------------------------------------------------------------------
+
+def test_stream_parser_yields_each_argument():
+    payload = {
+        "arguments": [
+            {"argument": "Le café réduit le cancer", "stance": "affirmatif"},
+            {"argument": "Cela pourrait venir des polyphénols", "stance": "conditionnel"},
+        ]
+    }
+    content = json.dumps(payload, ensure_ascii=False)
+
+    assert _feed_in_chunks(content, 1) == payload["arguments"]
+    assert _feed_in_chunks(content, 7) == payload["arguments"]
+
+
+def test_stream_parser_emits_item_as_soon_as_it_closes():
+    parser = _ArgumentStreamParser()
+
+    assert parser.feed('{"arguments": [{"argument": "A", "stance": "affirmatif"}') == [
+        {"argument": "A", "stance": "affirmatif"}
+    ]
+    assert parser.feed(', {"argument": "B"') == []
+    assert parser.feed(', "stance": "conditionnel"}]}') == [
+        {"argument": "B", "stance": "conditionnel"}
+    ]
+
+
+def test_stream_parser_handles_braces_and_escapes_in_strings():
+    payload = {
+        "arguments": [
+            {"argument": 'Un "test" avec {accolades} et [crochets] \\ fin', "stance": "affirmatif"},
+        ]
+    }
+    content = json.dumps(payload)
+
+    assert _feed_in_chunks(content, 3) == payload["arguments"]
+
+
+def test_stream_parser_keeps_nested_objects_inside_item():
+    payload = {"arguments": [{"argument": "A", "meta": {"k": [1, 2]}}]}
+
+    assert _feed_in_chunks(json.dumps(payload), 5) == payload["arguments"]
+
+
+def test_stream_parser_ignores_non_object_items():
+    assert _feed_in_chunks('{"arguments": ["text", 3, {"argument": "A"}]}', 4) == [
+        {"argument": "A"}
+    ]
+
+
+def test_stream_parser_empty_array():
+    assert _feed_in_chunks('{"arguments": []}', 2) == []
+
+
+# ---------------------------------------------------------------------------
+# _normalize_argument
+# ---------------------------------------------------------------------------
+
+SEGMENT = Segment(text="...", start_pos=0, end_pos=3, segment_id=7)
+
+
+def test_normalize_argument_attaches_segment_metadata():
+    arg = {"argument": "Cela pourrait réduire les coûts.", "stance": "affirmatif"}
+    _normalize_argument(arg, SEGMENT, "fr")
+    assert arg == {
+        "argument": "Cela pourrait réduire les coûts.",
+        "stance": "affirmatif",
+        "segment_id": 7,
+        "source_language": "fr",
+    }
+
+
+def test_normalize_argument_strips_text_and_keeps_llm_stance():
+    arg = {"argument": "  Les prix montent. ", "stance": "unknown"}
+    _normalize_argument(arg, SEGMENT, "fr")
+    assert arg["argument"] == "Les prix montent."
+    assert arg["stance"] == "unknown"
+
+
+def test_parse_arguments_skips_malformed_items():
+    content = json.dumps({"arguments": ["text", {"stance": "affirmatif"}, {"argument": "A"}]})
+    assert [arg["argument"] for arg in _parse_arguments(content, SEGMENT, "fr")] == ["A"]
+
+
+# ---------------------------------------------------------------------------
+# _build_request_body
+# ---------------------------------------------------------------------------
+
+def test_build_request_body_sends_segment_alone():
+    segment = Segment(text="Le texte {avec} des accolades.", start_pos=0, end_pos=30, segment_id=0)
+
+    expected_system = LOCAL_EXTRACTION_SYSTEM_PROMPT.format(
+        definition=EXPLANATORY_ARGUMENT_DEFINITION,
+        language="fr",
+        json_instruction=JSON_OUTPUT_STRICT
+    )
+
+    messages = _build_request_body(segment, "fr")["messages"]
+    assert messages == [
+        {"role": "system", "content": expected_system},
+        {"role": "user", "content": segment.text},
+    ]
+
+
+# ---------------------------------------------------------------------------
+# extract_from_segment_iter
+# ---------------------------------------------------------------------------
+
+def _stream_chunk(content, finish_reason=None):
+    return SimpleNamespace(choices=[SimpleNamespace(
+        delta=SimpleNamespace(content=content),
+        finish_reason=finish_reason,
+    )])
+
+
+def test_extract_retries_with_higher_cap_when_truncated(mock_settings, mock_openai_chat_response):
+    segment = Segment(text="x" * 100, start_pos=0, end_pos=100, segment_id=3)
+    truncated = '{"arguments": [{"argument": "A", "stance": "affirmatif"}, {"argum'
+    full = json.dumps({"arguments": [
+        {"argument": "A", "stance": "affirmatif"},
+        {"argument": "B", "stance": "conditionnel"},
+    ]})
+
+    client = MagicMock()
+    client.chat.completions.create.side_effect = [
+        iter([_stream_chunk(truncated), _stream_chunk(None, "length")]),
+        mock_openai_chat_response(full),
+    ]
+
+    with patch.object(local_extractor, "get_settings", return_value=mock_settings), \
+         patch.object(local_extractor, "get_openai_client", return_value=client), \
+         patch.object(local_extractor, "_get_cached_arguments", return_value=None), \
+         patch.object(local_extractor, "_put_cached_arguments") as put_cached:
+        arguments = list(extract_from_segment_iter(segment, "fr"))
+
+    assert [arg["argument"] for arg in arguments] == ["A", "B"]
+    assert client.chat.completions.create.call_args.kwargs["max_tokens"] == EXTRACTION_MAX_TOKENS_RETRY
+    put_cached.assert_called_once()
+
+
+def test_extract_reprompts_once_on_invalid_json(mock_settings, mock_openai_chat_response):
+    segment = Segment(text="x" * 100, start_pos=0, end_pos=100, segment_id=4)
+    invalid = '{"arguments": [{"argument": "A", "stance": "affirmatif"}], }'
+    fixed = json.dumps({"arguments": [{"argument": "A", "stance": "affirmatif"}]})
+
+    client = MagicMock()
+    client.chat.completions.create.side_effect = [
+        iter([_stream_chunk(invalid), _stream_chunk(None, "stop")]),
+        mock_openai_chat_response(fixed),
+    ]
+
+    with patch.object(local_extractor, "get_settings", return_value=mock_settings), \
+         patch.object(local_extractor, "get_openai_client", return_value=client), \
+         patch.object(local_extractor, "_get_cached_arguments", return_value=None), \
+         patch.object(local_extractor, "_put_cached_arguments") as put_cached:
+        arguments = list(extract_from_segment_iter(segment, "fr"))
+
+    assert [arg["argument"] for arg in arguments] == ["A"]
+    messages = client.chat.completions.create.call_args.kwargs["messages"]
+    assert messages[-2] == {"role": "assistant", "content": invalid}
+    assert messages[-1]["role"] == "user"
+    put_cached.assert_called_once()
+
+
+# ---------------------------------------------------------------------------
+# extract_from_all_segments
+# ---------------------------------------------------------------------------
+
+def test_extract_from_all_segments_keeps_order_and_isolates_failures():
+    segments = [Segment(text=str(i), start_pos=0, end_pos=1, segment_id=i) for i in range(4)]
+
+    def fake_extract(segment, language):
+        if segment.segment_id == 2:
+            raise RuntimeError("boom")
+        return [{"argument": segment.text}]
+
+    with patch.object(local_extractor, "extract_from_segment", side_effect=fake_extract):
+        result = extract_from_all_segments(segments, "fr")
+
+    assert result == [[{"argument": "0"}], [{"argument": "1"}], [], [{"argument": "3"}]]
+
+
+def test_extract_from_all_segments_empty():
+    assert extract_from_all_segments([], "fr") == []
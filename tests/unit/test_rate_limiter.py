@@ -0,0 +1,95 @@
+"""
+Unit tests for app/agents/extraction/_rate_limiter.py
+
+Tests LeakyBucket budgets with a patched clock, the disabled default and
+the per-attempt throttling of throttled_chat_completion.
+"""
+from unittest.mock import patch, MagicMock
+
+import httpx
+import pytest
+from openai import APIConnectionError
+
+from app.agents.extraction import _rate_limiter
+from app.agents.extraction._rate_limiter import LeakyBucket, get_rate_limiter, throttled_chat_completion
+
+
+class _FakeClock:
+    """monotonic()/sleep() pair where sleeping advances time instantly."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+# ---------------------------------------------------------------------------
+# LeakyBucket
+# ---------------------------------------------------------------------------
+
+def test_leaky_bucket_waits_for_request_budget():
+    clock = _FakeClock()
+
+    with patch.object(_rate_limiter, "time", clock):
+        bucket = LeakyBucket(rpm=60, tpm=0)
+        for _ in range(60):
+            bucket.acquire(100)
+        assert clock.sleeps == []
+
+        bucket.acquire(100)
+
+    # One request refills every second at 60 RPM
+    assert sum(clock.sleeps) == pytest.approx(1.0)
+
+
+def test_leaky_bucket_waits_for_token_budget_and_clamps_large_requests():
+    clock = _FakeClock()
+
+    with patch.object(_rate_limiter, "time", clock):
+        bucket = LeakyBucket(rpm=0, tpm=600)
+        bucket.acquire(600)
+        bucket.acquire(60)
+        assert sum(clock.sleeps) == pytest.approx(6.0)
+
+        bucket.acquire(10_000)  # Larger than the whole budget: waits for a full refill
+
+    assert sum(clock.sleeps) == pytest.approx(66.0)
+
+
+# ---------------------------------------------------------------------------
+# get_rate_limiter
+# ---------------------------------------------------------------------------
+
+def test_get_rate_limiter_disabled_by_default():
+    get_rate_limiter.cache_clear()
+    settings = MagicMock(openai_rpm=0, openai_tpm=0)
+
+    with patch.object(_rate_limiter, "get_settings", return_value=settings):
+        assert get_rate_limiter() is None
+
+    get_rate_limiter.cache_clear()
+
+
+# ---------------------------------------------------------------------------
+# throttled_chat_completion
+# ---------------------------------------------------------------------------
+
+def test_throttled_chat_completion_throttles_every_attempt():
+    client = MagicMock()
+    client.chat.completions.create.side_effect = [
+        APIConnectionError(request=httpx.Request("POST", "https://api.openai.com")),
+        "response",
+    ]
+    body = {"model": "m", "messages": [], "max_tokens": 10}
+
+    with patch.object(_rate_limiter, "throttle") as throttle, patch("time.sleep"):
+        assert throttled_chat_completion(client, body) == "response"
+
+    assert throttle.call_count == 2
+    throttle.assert_called_with([], 10)
@@ -7,6 +7,7 @@ from app.agents.extraction.segmentation import (
     segment_transcript,
     get_segment_stats,
     Segment,
+    _split_into_paragraphs,
 )
 from app.agents.extraction.constants_extraction import (
     MAX_SEGMENT_LENGTH,
@@ -72,6 +73,22 @@ def test_segment_ids_sequential():
         assert seg.segment_id == i
 
 
+def test_split_into_paragraphs_blank_lines():
+    text = "First paragraph.\n\n\nSecond paragraph.\n  \nThird paragraph."
+
+    assert _split_into_paragraphs(text) == [
+        "First paragraph.",
+        "Second paragraph.",
+        "Third paragraph.",
+    ]
+
+
+def test_split_into_paragraphs_falls_back_to_lines():
+    text = "line one\nline two\n\n"
+
+    assert _split_into_paragraphs(text) == ["line one", "line two"]
+
+
 def test_get_segment_stats_empty():
     stats = get_segment_stats([])
 
@@ -0,0 +1,39 @@
+"""
+Unit tests for app/agents/extraction/_tokens.py
+
+Tests truncate_to_tokens with a fake encoder and the character fallback.
+"""
+from unittest.mock import patch
+
+from app.agents.extraction import _tokens
+from app.agents.extraction._tokens import truncate_to_tokens
+
+
+class _WordEncoder:
+    """One token per whitespace-separated word."""
+
+    def encode(self, text):
+        return text.split(" ")
+
+    def decode(self, tokens):
+        return " ".join(tokens)
+
+
+# ---------------------------------------------------------------------------
+# truncate_to_tokens
+# ---------------------------------------------------------------------------
+
+def test_truncate_to_tokens_within_budget_unchanged():
+    with patch.object(_tokens, "get_encoder", return_value=_WordEncoder()):
+        assert truncate_to_tokens("a b c", 3, fallback_max_chars=1) == "a b c"
+
+
+def test_truncate_to_tokens_slices_tokens():
+    with patch.object(_tokens, "get_encoder", return_value=_WordEncoder()):
+        assert truncate_to_tokens("a b c d", 2, fallback_max_chars=1) == "a b"
+
+
+def test_truncate_to_tokens_falls_back_to_chars():
+    with patch.object(_tokens, "get_encoder", return_value=None):
+        assert truncate_to_tokens("abcdef", 1, fallback_max_chars=4) == "abcd"
+        assert truncate_to_tokens("abc", 1, fallback_max_chars=4) == "abc"
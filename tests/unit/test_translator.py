@@ -0,0 +1,178 @@
+"""
+Unit tests for app/agents/extraction/translator.py
+
+Tests concurrent and batched translation with a mocked OpenAI client.
+"""
+import json
+import re
+from unittest.mock import patch, MagicMock
+
+from app.agents.extraction import translator
+from app.agents.extraction.translator import (
+    translate_arguments,
+    translate_single_argument,
+    batch_translate_arguments,
+    translate_arguments_batch_api,
+    _parse_batch_translations,
+)
+
+
+# ---------------------------------------------------------------------------
+# translate_arguments
+# ---------------------------------------------------------------------------
+
+def test_translate_arguments_empty():
+    assert translate_arguments([]) == []
+
+
+def test_translate_arguments_keeps_each_translation_on_its_argument(mock_settings, mock_openai_chat_response):
+    def create(**kwargs):
+        items = json.loads(re.search(r"^\[.*\]$", kwargs["messages"][1]["content"], re.M).group())
+        translations = [{"id": item["id"], "translation": "EN " + item["text"]} for item in items]
+        return mock_openai_chat_response(json.dumps({"translations": translations}))
+
+    client = MagicMock()
+    client.chat.completions.create.side_effect = create
+    arguments = [{"argument": f"argument {i}"} for i in range(25)]
+
+    with patch.object(translator, "get_settings", return_value=mock_settings), \
+         patch.object(translator, "get_openai_client", return_value=client):
+        result = translate_arguments(arguments, "en", "fr")
+
+    assert result is arguments
+    assert [arg["argument_en"] for arg in result] == [f"EN argument {i}" for i in range(25)]
+    assert client.chat.completions.create.call_count == -(-25 // translator.TRANSLATION_BATCH_SIZE)
+
+
+def test_translate_arguments_returns_original_on_error(mock_settings):
+    client = MagicMock()
+    client.chat.completions.create.side_effect = RuntimeError("boom")
+
+    with patch.object(translator, "get_settings", return_value=mock_settings), \
+         patch.object(translator, "get_openai_client", return_value=client):
+        result = translate_arguments([{"argument": "texte"}], "en", "fr")
+
+    assert result[0]["argument_en"] == "texte"
+
+
+# ---------------------------------------------------------------------------
+# translate_single_argument (escalation)
+# ---------------------------------------------------------------------------
+
+def test_translate_single_argument_keeps_plausible_fast_translation(mock_settings, mock_openai_chat_response):
+    client = MagicMock()
+    client.chat.completions.create.return_value = mock_openai_chat_response('{"translation": "Coffee reduces cancer risk"}')
+
+    with patch.object(translator, "get_settings", return_value=mock_settings), \
+         patch.object(translator, "get_openai_client", return_value=client):
+        result = translate_single_argument("Le café réduit les risques de cancer")
+
+    assert result == "Coffee reduces cancer risk"
+    assert client.chat.completions.create.call_count == 1
+    assert client.chat.completions.create.call_args.kwargs["model"] == translator.TRANSLATION_MODEL
+    assert client.chat.completions.create.call_args.kwargs["response_format"]["type"] == "json_schema"
+
+
+def test_translate_single_argument_escalates_truncated_translation(mock_settings, mock_openai_chat_response):
+    def create(**kwargs):
+        if kwargs["model"] == translator.TRANSLATION_ESCALATION_MODEL:
+            return mock_openai_chat_response('{"translation": "Coffee reduces cancer risk"}')
+        return mock_openai_chat_response('{"translation": "Coffee"}')
+
+    client = MagicMock()
+    client.chat.completions.create.side_effect = create
+
+    with patch.object(translator, "get_settings", return_value=mock_settings), \
+         patch.object(translator, "get_openai_client", return_value=client):
+        result = translate_single_argument("Le café réduit les risques de cancer")
+
+    assert result == "Coffee reduces cancer risk"
+    assert client.chat.completions.create.call_count == 2
+
+
+# ---------------------------------------------------------------------------
+# batch_translate_arguments
+# ---------------------------------------------------------------------------
+
+def test_parse_batch_translations_maps_by_id():
+    data = {"translations": [
+        {"id": 1, "translation": "B"},
+        {"id": 0, "translation": "A"},
+        {"id": 7, "translation": "out of range"},
+        {"id": 2, "translation": "  "},
+    ]}
+    assert _parse_batch_translations(data, 3) == ["A", "B", None]
+
+
+def test_parse_batch_translations_wrong_shape():
+    assert _parse_batch_translations({"items": []}, 2) == [None, None]
+
+
+def test_batch_translate_arguments_one_call_per_batch(mock_settings, mock_openai_chat_response):
+    def create(**kwargs):
+        items = json.loads(re.search(r"^\[.*\]$", kwargs["messages"][1]["content"], re.M).group())
+        translations = [{"id": item["id"], "translation": item["text"].upper()} for item in items]
+        return mock_openai_chat_response(json.dumps({"translations": translations}))
+
+    client = MagicMock()
+    client.chat.completions.create.side_effect = create
+    arguments = [{"argument": f"arg {i}"} for i in range(7)]
+
+    with patch.object(translator, "get_settings", return_value=mock_settings), \
+         patch.object(translator, "get_openai_client", return_value=client):
+        batch_translate_arguments(arguments, batch_size=3)
+
+    assert client.chat.completions.create.call_count == 3
+    assert [arg["argument_en"] for arg in arguments] == [f"ARG {i}" for i in range(7)]
+    response_format = client.chat.completions.create.call_args.kwargs["response_format"]
+    assert response_format["json_schema"]["name"] == "argument_translations"
+
+
+def test_batch_translate_arguments_falls_back_per_item(mock_settings, mock_openai_chat_response):
+    client = MagicMock()
+    client.chat.completions.create.side_effect = [
+        mock_openai_chat_response('{"translations": [{"id": 0, "translation": "A"}]}'),
+        mock_openai_chat_response('{"translation": "B"}'),
+    ]
+    arguments = [{"argument": "a"}, {"argument": "b"}]
+
+    with patch.object(translator, "get_settings", return_value=mock_settings), \
+         patch.object(translator, "get_openai_client", return_value=client):
+        batch_translate_arguments(arguments, batch_size=2)
+
+    assert [arg["argument_en"] for arg in arguments] == ["A", "B"]
+
+
+def test_batch_translate_arguments_redoes_suspicious_length(mock_settings, mock_openai_chat_response):
+    client = MagicMock()
+    client.chat.completions.create.side_effect = [
+        mock_openai_chat_response('{"translations": [{"id": 0, "translation": "Coffee"}]}'),
+        mock_openai_chat_response('{"translation": "Coffee reduces cancer risk"}'),
+    ]
+    arguments = [{"argument": "Le café réduit les risques de cancer"}]
+
+    with patch.object(translator, "get_settings", return_value=mock_settings), \
+         patch.object(translator, "get_openai_client", return_value=client):
+        batch_translate_arguments(arguments)
+
+    assert arguments[0]["argument_en"] == "Coffee reduces cancer risk"
+    assert client.chat.completions.create.call_count == 2
+
+
+# ---------------------------------------------------------------------------
+# translate_arguments_batch_api
+# ---------------------------------------------------------------------------
+
+def test_translate_arguments_batch_api_falls_back_for_missing_results(mock_settings, mock_openai_chat_response):
+    client = MagicMock()
+    client.chat.completions.create.return_value = mock_openai_chat_response('{"translation": "B"}')
+    arguments = [{"argument": "a"}, {"argument": "b"}]
+
+    with patch.object(translator, "get_settings", return_value=mock_settings), \
+         patch.object(translator, "get_openai_client", return_value=client), \
+         patch.object(translator, "run_chat_batch", return_value={"0": '{"translation": "A"}'}) as run:
+        translate_arguments_batch_api(arguments, "en", "fr")
+
+    assert set(run.call_args.args[1]) == {"0", "1"}
+    assert [arg["argument_en"] for arg in arguments] == ["A", "B"]
+    assert client.chat.completions.create.call_count == 1
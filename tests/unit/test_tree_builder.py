@@ -3,8 +3,13 @@ Unit tests for app/agents/extraction/tree_builder.py
 
 Tests build_reasoning_trees with flat list → nested ArgumentStructure.
 """
+import orjson
+
 from app.agents.extraction.tree_builder import (
     build_reasoning_trees,
+    structure_to_dict,
+    write_structure_jsonl,
+    get_chain_by_id,
     ArgumentStructure,
     ReasoningChain,
     ThesisNode,
@@ -106,6 +111,20 @@ def test_build_orphan_arguments_become_chains():
     assert structure.total_chains == 2
 
 
+def test_build_orphan_chains_numbered_in_input_order():
+    arguments = [
+        _make_arg(0, "sub_argument", parent_id=998, argument_en="First orphan"),
+        _make_arg(1, "thesis", argument_en="Real thesis"),
+        _make_arg(2, "evidence", parent_id=999, argument_en="Second orphan"),
+    ]
+    structure = build_reasoning_trees(arguments)
+
+    assert [chain.chain_id for chain in structure.reasoning_chains] == [0, 1, 2]
+    assert [chain.thesis.argument_en for chain in structure.reasoning_chains] == [
+        "Real thesis", "First orphan", "Second orphan"
+    ]
+
+
 def test_build_metadata_correct():
     arguments = [
         _make_arg(0, "thesis"),
@@ -129,3 +148,93 @@ def test_build_multiple_thesis_chains():
 
     assert structure.total_chains == 2
     assert structure.total_arguments == 2
+
+
+def test_tree_nodes_use_slots():
+    arguments = [
+        _make_arg(0, "thesis"),
+        _make_arg(1, "sub_argument", parent_id=0),
+        _make_arg(2, "evidence", parent_id=1),
+    ]
+    structure = build_reasoning_trees(arguments)
+    thesis = structure.reasoning_chains[0].thesis
+
+    for node in (structure, structure.reasoning_chains[0], thesis,
+                 thesis.sub_arguments[0], thesis.sub_arguments[0].evidence[0]):
+        assert not hasattr(node, "__dict__")
+
+
+# ---------------------------------------------------------------------------
+# structure_to_dict
+# ---------------------------------------------------------------------------
+
+def test_structure_to_dict_shape():
+    arguments = [
+        _make_arg(0, "thesis", argument="T", argument_en="T"),
+        _make_arg(1, "sub_argument", parent_id=0, argument="S", argument_en="S"),
+        _make_arg(2, "evidence", parent_id=1, argument="E", argument_en="E"),
+        _make_arg(3, "counter_argument", parent_id=0, argument="C", argument_en="C"),
+    ]
+
+    result = structure_to_dict(build_reasoning_trees(arguments))
+
+    node = {"stance": "affirmatif", "confidence": 0.8}
+    assert result == {
+        "reasoning_chains": [{
+            "chain_id": 0,
+            "total_arguments": 4,
+            "thesis": {
+                "argument": "T", "argument_en": "T", **node,
+                "sub_arguments": [{
+                    "argument": "S", "argument_en": "S", **node,
+                    "evidence": [{
+                        "argument": "E", "argument_en": "E", **node,
+                        "segment_id": 0, "source_language": "en",
+                    }],
+                }],
+                "counter_arguments": [{
+                    "argument": "C", "argument_en": "C", **node, "evidence": [],
+                }],
+            },
+        }],
+        "orphan_arguments": [],
+        "metadata": {"total_chains": 1, "total_arguments": 4},
+    }
+
+
+def test_write_structure_jsonl_matches_structure_to_dict(tmp_path):
+    arguments = [
+        _make_arg(0, "thesis", argument="T1"),
+        _make_arg(1, "sub_argument", parent_id=0, argument="S"),
+        _make_arg(2, "evidence", parent_id=1, argument="E"),
+        _make_arg(3, "thesis", argument="T2"),
+    ]
+    structure = build_reasoning_trees(arguments)
+    path = tmp_path / "structure.jsonl"
+
+    write_structure_jsonl(structure, str(path))
+
+    lines = [orjson.loads(line) for line in path.read_bytes().splitlines()]
+    expected = structure_to_dict(structure)
+    assert lines[0] == {"metadata": expected["metadata"], "orphan_arguments": []}
+    assert lines[1:] == expected["reasoning_chains"]
+
+
+# ---------------------------------------------------------------------------
+# get_chain_by_id
+# ---------------------------------------------------------------------------
+
+def test_get_chain_by_id_positional_and_missing():
+    structure = build_reasoning_trees([_make_arg(i, "thesis", argument=f"T{i}") for i in range(3)])
+
+    assert get_chain_by_id(structure, 2).thesis.argument == "T2"
+    assert get_chain_by_id(structure, 3) is None
+    assert get_chain_by_id(structure, -1) is None
+
+
+def test_get_chain_by_id_falls_back_when_ids_are_not_positions():
+    structure = build_reasoning_trees([_make_arg(i, "thesis", argument=f"T{i}") for i in range(3)])
+    structure.reasoning_chains.reverse()
+
+    assert get_chain_by_id(structure, 0).thesis.argument == "T0"
+    assert get_chain_by_id(structure, 2).thesis.argument == "T2"
@@ -0,0 +1,275 @@
+"""
+Unit tests for app/agents/extraction/validators.py
+
+Tests the local pre-filter and the Batch API validation path with a
+mocked batch runner.
+"""
+import json
+import re
+from unittest.mock import patch, MagicMock
+
+from app.agents.extraction import validators
+from app.agents.extraction.constants_extraction import (
+    EXPLANATORY_ARGUMENT_DEFINITION,
+    VALIDATION_USER_PROMPT,
+)
+from app.agents.extraction.validators import (
+    validate_arguments,
+    validate_arguments_batch_api,
+    batch_validate_arguments,
+    validate_single_argument,
+    validate_with_details,
+    filter_by_criteria,
+    _build_validation_body,
+    _cheap_prefilter,
+    _parse_batch_validations,
+)
+from app.prompts import JSON_OUTPUT_STRICT
+
+
+def _neutral(label: str) -> str:
+    """Argument long enough to pass the pre-filter, with no causal connective."""
+    return f"Argument {label}: le taux d'imposition reste stable cette année"
+
+
+# ---------------------------------------------------------------------------
+# _build_validation_body
+# ---------------------------------------------------------------------------
+
+def test_build_validation_body_matches_full_template():
+    argument = 'Le café {réduit} "le" cancer'
+    expected = VALIDATION_USER_PROMPT.format(
+        definition=EXPLANATORY_ARGUMENT_DEFINITION,
+        argument=argument,
+        json_instruction=JSON_OUTPUT_STRICT
+    )
+
+    assert _build_validation_body(argument)["messages"][1]["content"] == expected
+
+
+def test_build_validation_body_requests_structured_output():
+    response_format = _build_validation_body("texte")["response_format"]
+
+    assert response_format["type"] == "json_schema"
+    assert response_format["json_schema"]["strict"] is True
+    assert response_format["json_schema"]["schema"]["properties"]["is_valid"] == {"type": "boolean"}
+
+
+# ---------------------------------------------------------------------------
+# _cheap_prefilter
+# ---------------------------------------------------------------------------
+
+def test_cheap_prefilter_rejects_short_text():
+    assert _cheap_prefilter("Le café est bon") is False
+
+
+def test_cheap_prefilter_defers_causal_connective_to_llm():
+    assert _cheap_prefilter("Le café réduit le risque de cancer parce que la caféine protège le foie") is None
+    assert _cheap_prefilter("Higher interest rates lead to less borrowing, which LEADS TO lower inflation") is None
+    # A connective keeps a short text from being rejected on length
+    assert _cheap_prefilter("Ça brûle parce que c'est chaud") is None
+
+
+def test_cheap_prefilter_defers_other_texts():
+    assert _cheap_prefilter(_neutral("a")) is None
+    # "car" is not treated as a connective (English noun)
+    assert _cheap_prefilter("The electric car market grew by twenty percent last year") is None
+
+
+def test_validate_arguments_only_calls_llm_for_undecided(mock_settings):
+    causal = {"argument": "Taxes on sugar reduce consumption because prices go up for consumers"}
+    short = {"argument": "Trop court"}
+    neutral = {"argument": _neutral("a")}
+
+    with patch.object(validators, "get_settings", return_value=mock_settings), \
+         patch.object(validators, "_validate_batch", side_effect=lambda texts: [text == causal["argument"] for text in texts]) as validate_batch:
+        result = validate_arguments([causal, short, neutral])
+
+    validate_batch.assert_called_once_with([causal["argument"], neutral["argument"]])
+    assert result == [causal]
+
+
+def test_validate_arguments_keeps_input_order(mock_settings):
+    arguments = [{"argument": _neutral(label)} for label in "abcde"]
+    keep = {_neutral("a"), _neutral("c"), _neutral("e")}
+
+    with patch.object(validators, "get_settings", return_value=mock_settings), \
+         patch.object(validators, "_validate_batch", side_effect=lambda texts: [text in keep for text in texts]):
+        result = validate_arguments(arguments)
+
+    assert result == [arguments[0], arguments[2], arguments[4]]
+
+
+# ---------------------------------------------------------------------------
+# validate_single_argument / validate_with_details
+# ---------------------------------------------------------------------------
+
+def test_validation_is_shared_between_single_and_details(mock_settings, mock_openai_chat_response):
+    validators._validate_cached.cache_clear()
+    client = MagicMock()
+    client.chat.completions.create.return_value = mock_openai_chat_response(
+        '{"is_valid": true, "meets_causal_criterion": true, "reasoning": "causal"}'
+    )
+
+    with patch.object(validators, "get_settings", return_value=mock_settings), \
+         patch.object(validators, "get_openai_client", return_value=client):
+        assert validate_single_argument(_neutral("a")) is True
+        details = validate_with_details(_neutral("a"))
+        details["is_valid"] = False
+        assert validate_with_details(_neutral("a"))["is_valid"] is True
+
+    assert client.chat.completions.create.call_count == 1
+    validators._validate_cached.cache_clear()
+
+
+def test_validation_does_not_cache_errors(mock_settings, mock_openai_chat_response):
+    validators._validate_cached.cache_clear()
+    client = MagicMock()
+    client.chat.completions.create.side_effect = [
+        RuntimeError("boom"),
+        mock_openai_chat_response('{"is_valid": false, "reasoning": "narration"}'),
+    ]
+
+    with patch.object(validators, "get_settings", return_value=mock_settings), \
+         patch.object(validators, "get_openai_client", return_value=client):
+        assert validate_single_argument(_neutral("a")) is True  # Fail open
+        assert validate_single_argument(_neutral("a")) is False
+
+    validators._validate_cached.cache_clear()
+
+
+# ---------------------------------------------------------------------------
+# batch_validate_arguments
+# ---------------------------------------------------------------------------
+
+def test_parse_batch_validations_maps_by_id():
+    data = {"validations": [
+        {"id": 1, "is_valid": False},
+        {"id": 0, "is_valid": True},
+        {"id": 7, "is_valid": True},
+        {"id": 2, "is_valid": "yes"},
+    ]}
+    assert _parse_batch_validations(data, 3) == [True, False, None]
+
+
+def test_parse_batch_validations_wrong_shape():
+    assert _parse_batch_validations({"items": []}, 2) == [None, None]
+
+
+def test_batch_validate_arguments_one_call_per_batch(mock_settings, mock_openai_chat_response):
+    def create(**kwargs):
+        items = json.loads(re.search(r"^\[.*\]$", kwargs["messages"][1]["content"], re.M).group())
+        validations = [
+            {"id": item["id"], "is_valid": int(re.search(r"\d+", item["text"]).group()) % 2 == 0}
+            for item in items
+        ]
+        return mock_openai_chat_response(json.dumps({"validations": validations}))
+
+    client = MagicMock()
+    client.chat.completions.create.side_effect = create
+    arguments = [{"argument": _neutral(str(i))} for i in range(7)]
+
+    with patch.object(validators, "get_settings", return_value=mock_settings), \
+         patch.object(validators, "get_openai_client", return_value=client):
+        result = batch_validate_arguments(arguments, batch_size=3)
+
+    assert client.chat.completions.create.call_count == 3
+    assert result == [arguments[i] for i in (0, 2, 4, 6)]
+
+
+def test_batch_validate_arguments_skips_prefiltered_and_falls_back_per_item(mock_settings):
+    arguments = [
+        {"argument": "Trop court"},
+        {"argument": _neutral("a")},
+        {"argument": _neutral("b")},
+    ]
+
+    with patch.object(validators, "get_settings", return_value=mock_settings), \
+         patch.object(validators, "_validate_batch", return_value=[True, None]) as validate_batch, \
+         patch.object(validators, "validate_single_argument", return_value=False) as validate_single:
+        result = batch_validate_arguments(arguments)
+
+    validate_batch.assert_called_once_with([_neutral("a"), _neutral("b")])
+    validate_single.assert_called_once_with(_neutral("b"))
+    assert result == [arguments[1]]
+
+
+# ---------------------------------------------------------------------------
+# validate_arguments_batch_api
+# ---------------------------------------------------------------------------
+
+def test_validate_arguments_batch_api_empty():
+    assert validate_arguments_batch_api([]) == []
+
+
+def test_validate_arguments_batch_api_filters_and_fails_open(mock_settings):
+    arguments = [{"argument": _neutral(label)} for label in "abcd"]
+    contents = {
+        "0": '{"is_valid": true}',
+        "1": '{"is_valid": false, "reasoning": "narration"}',
+        "2": "not json",
+        # "3" missing: the request failed inside the batch
+    }
+
+    with patch.object(validators, "get_settings", return_value=mock_settings), \
+         patch.object(validators, "get_openai_client"), \
+         patch.object(validators, "run_chat_batch", return_value=contents):
+        result = validate_arguments_batch_api(arguments)
+
+    assert result == [arguments[0], arguments[2], arguments[3]]
+
+
+def test_validate_arguments_batch_api_accepts_all_when_batch_fails(mock_settings):
+    arguments = [{"argument": _neutral("a")}, {"argument": _neutral("b")}]
+
+    with patch.object(validators, "get_settings", return_value=mock_settings), \
+         patch.object(validators, "get_openai_client"), \
+         patch.object(validators, "run_chat_batch", side_effect=RuntimeError("expired")):
+        assert validate_arguments_batch_api(arguments) == arguments
+
+
+def test_validate_arguments_batch_api_skips_batch_when_prefilter_decides_all(mock_settings):
+    arguments = [{"argument": "Trop court"}, {"argument": "Trop court aussi"}]
+
+    with patch.object(validators, "get_settings", return_value=mock_settings), \
+         patch.object(validators, "run_chat_batch") as run_batch:
+        result = validate_arguments_batch_api(arguments)
+
+    run_batch.assert_not_called()
+    assert result == []
+
+
+def test_validate_arguments_batch_api_sends_causal_texts_to_llm(mock_settings):
+    causal = "Prices rose because supply fell sharply this winter"
+    arguments = [{"argument": "Trop court"}, {"argument": causal}]
+
+    with patch.object(validators, "get_settings", return_value=mock_settings), \
+         patch.object(validators, "get_openai_client"), \
+         patch.object(validators, "run_chat_batch", return_value={"1": '{"is_valid": false}'}) as run_batch:
+        result = validate_arguments_batch_api(arguments)
+
+    assert list(run_batch.call_args.args[1]) == ["1"]
+    assert result == []
+
+
+# ---------------------------------------------------------------------------
+# filter_by_criteria
+# ---------------------------------------------------------------------------
+
+def test_filter_by_criteria_empty():
+    assert filter_by_criteria([], require_causal=True) == []
+
+
+def test_filter_by_criteria_keeps_order_and_applies_requirements():
+    details = {
+        "a": {"meets_causal_criterion": True, "meets_mechanistic_criterion": True},
+        "b": {"meets_causal_criterion": True, "meets_mechanistic_criterion": False},
+        "c": {"meets_causal_criterion": False, "meets_mechanistic_criterion": True},
+        "d": {"meets_causal_criterion": True, "meets_mechanistic_criterion": True},
+    }
+    arguments = [{"argument": label} for label in "abcd"]
+
+    with patch.object(validators, "validate_with_details", side_effect=details.__getitem__):
+        result = filter_by_criteria(arguments, require_causal=True, require_mechanistic=True)
+
+    assert result == [arguments[0], arguments[3]]